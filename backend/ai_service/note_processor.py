@@ -24,6 +24,7 @@ from shared.utils import setup_logging
 from shared.types import Person, Company, Topic, Event, Location, ContactStatus, DataSource, RelationshipType
 
 # Import graph services
+from backend.graph_service.connection import batch_session
 from backend.graph_service.people import create_person, link_person_to_company, create_person_relationship, get_person_by_name, search_people
 from backend.graph_service.companies import create_company, get_company_by_name
 from backend.graph_service.topics import create_topic, get_topic_by_name, link_person_to_topic
@@ -513,39 +514,42 @@ Return ONLY the JSON object, no other text.
     async def _validate_relationships(self, relationships: List[RelationshipMention], resolved_entities: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Validate relationships and ensure they connect to existing entities."""
         validated = []
+
+        # Every lookup and create below shares one pooled session instead
+        # of checking one out per service call
+        with batch_session():
+            # First, ensure all entities exist (create any that are marked as "create_new")
+            for entity_name, entity_resolution in resolved_entities.items():
+                if entity_resolution["action"] == "create_new" and not entity_resolution.get("existing_id"):
+                    await self._ensure_entity_exists(entity_resolution, resolved_entities)
         
-        # First, ensure all entities exist (create any that are marked as "create_new")
-        for entity_name, entity_resolution in resolved_entities.items():
-            if entity_resolution["action"] == "create_new" and not entity_resolution.get("existing_id"):
-                await self._ensure_entity_exists(entity_resolution, resolved_entities)
-        
-        for rel in relationships:
-            # Get resolved entities
-            from_entity = resolved_entities.get(rel.from_entity)
-            to_entity = resolved_entities.get(rel.to_entity)
+            for rel in relationships:
+                # Get resolved entities
+                from_entity = resolved_entities.get(rel.from_entity)
+                to_entity = resolved_entities.get(rel.to_entity)
             
-            if not from_entity or not to_entity:
-                logger.warning(f"Skipping relationship {rel.from_entity} -> {rel.to_entity}: entities not resolved")
-                continue
+                if not from_entity or not to_entity:
+                    logger.warning(f"Skipping relationship {rel.from_entity} -> {rel.to_entity}: entities not resolved")
+                    continue
             
-            # Get entity IDs, ensuring they exist
-            from_id = await self._ensure_entity_exists(from_entity, resolved_entities)
-            to_id = await self._ensure_entity_exists(to_entity, resolved_entities)
+                # Get entity IDs, ensuring they exist
+                from_id = await self._ensure_entity_exists(from_entity, resolved_entities)
+                to_id = await self._ensure_entity_exists(to_entity, resolved_entities)
             
-            if not from_id or not to_id:
-                logger.warning(f"Cannot create relationship: missing IDs for {rel.from_entity} -> {rel.to_entity}")
-                continue
+                if not from_id or not to_id:
+                    logger.warning(f"Cannot create relationship: missing IDs for {rel.from_entity} -> {rel.to_entity}")
+                    continue
             
-            validated.append({
-                "from_entity": rel.from_entity,
-                "to_entity": rel.to_entity,
-                "from_id": from_id,
-                "to_id": to_id,
-                "relationship_type": rel.relationship_type,
-                "strength": rel.strength,
-                "properties": rel.properties,
-                "context": rel.context
-            })
+                validated.append({
+                    "from_entity": rel.from_entity,
+                    "to_entity": rel.to_entity,
+                    "from_id": from_id,
+                    "to_id": to_id,
+                    "relationship_type": rel.relationship_type,
+                    "strength": rel.strength,
+                    "properties": rel.properties,
+                    "context": rel.context
+                })
         
         return validated
     
@@ -692,54 +696,56 @@ Return ONLY the JSON object, no other text.
                     "action": action
                 })
         
-        # Create relationships
-        for rel in validated_relationships:
-            try:
-                from_id = rel["from_id"]
-                to_id = rel["to_id"]
+        # Create relationships, sharing one pooled session across the
+        # whole batch of link writes
+        with batch_session():
+            for rel in validated_relationships:
+                try:
+                    from_id = rel["from_id"]
+                    to_id = rel["to_id"]
                 
-                # Handle different relationship types
-                if rel["relationship_type"] == "WORKS_AT":
-                    # Link person to company
-                    link_person_to_company(
-                        from_id,
-                        to_id,
-                        rel.get("properties", {}).get("role", "Unknown"),
-                        datetime.now(UTC)
-                    )
-                    logger.info(f"Created WORKS_AT relationship: {rel['from_entity']} -> {rel['to_entity']}")
+                    # Handle different relationship types
+                    if rel["relationship_type"] == "WORKS_AT":
+                        # Link person to company
+                        link_person_to_company(
+                            from_id,
+                            to_id,
+                            rel.get("properties", {}).get("role", "Unknown"),
+                            datetime.now(UTC)
+                        )
+                        logger.info(f"Created WORKS_AT relationship: {rel['from_entity']} -> {rel['to_entity']}")
                     
-                elif rel["relationship_type"] == "KNOWS":
-                    # Create person-to-person relationship
-                    create_person_relationship(
-                        from_id,
-                        to_id,
-                        rel.get("strength", 3),
-                        rel.get("properties", {}).get("type", "acquaintance")
-                    )
-                    logger.info(f"Created KNOWS relationship: {rel['from_entity']} -> {rel['to_entity']}")
+                    elif rel["relationship_type"] == "KNOWS":
+                        # Create person-to-person relationship
+                        create_person_relationship(
+                            from_id,
+                            to_id,
+                            rel.get("strength", 3),
+                            rel.get("properties", {}).get("type", "acquaintance")
+                        )
+                        logger.info(f"Created KNOWS relationship: {rel['from_entity']} -> {rel['to_entity']}")
                     
-                elif rel["relationship_type"] == "INTERESTED_IN":
-                    # Link person to topic
-                    link_person_to_topic(from_id, to_id)
-                    logger.info(f"Created INTERESTED_IN relationship: {rel['from_entity']} -> {rel['to_entity']}")
+                    elif rel["relationship_type"] == "INTERESTED_IN":
+                        # Link person to topic
+                        link_person_to_topic(from_id, to_id)
+                        logger.info(f"Created INTERESTED_IN relationship: {rel['from_entity']} -> {rel['to_entity']}")
                     
-                elif rel["relationship_type"] == "ATTENDED":
-                    # Link person to event
-                    link_person_to_event(from_id, to_id)
-                    logger.info(f"Created ATTENDED relationship: {rel['from_entity']} -> {rel['to_entity']}")
+                    elif rel["relationship_type"] == "ATTENDED":
+                        # Link person to event
+                        link_person_to_event(from_id, to_id)
+                        logger.info(f"Created ATTENDED relationship: {rel['from_entity']} -> {rel['to_entity']}")
                 
-                created_entities["relationships"].append({
-                    "from": rel["from_entity"],
-                    "to": rel["to_entity"],
-                    "type": rel["relationship_type"],
-                    "action": "created"
-                })
+                    created_entities["relationships"].append({
+                        "from": rel["from_entity"],
+                        "to": rel["to_entity"],
+                        "type": rel["relationship_type"],
+                        "action": "created"
+                    })
                 
-            except Exception as e:
-                logger.error(f"Error creating relationship {rel['from_entity']} -> {rel['to_entity']}: {e}")
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+                except Exception as e:
+                    logger.error(f"Error creating relationship {rel['from_entity']} -> {rel['to_entity']}: {e}")
+                    import traceback
+                    logger.error(f"Full traceback: {traceback.format_exc()}")
         
         return created_entities
     
@@ -11,7 +11,7 @@ sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -20,6 +20,9 @@ from pydantic import ValidationError
 
 from shared.config import get_settings, is_development
 from shared.utils import setup_logging
+from backend.graph_service.connection import neo4j_connection
+from backend.graph_service.graph_queries import ensure_fulltext_indexes
+from backend.graph_service.schema import ensure_denormalized_fields, ensure_schema
 
 # Import routers
 from backend.api.routers import people, companies, interactions, topics, events, locations, graph, ai
@@ -40,6 +43,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if is_development() else None,
     redoc_url="/redoc" if is_development() else None,
+    # orjson serializes responses (datetimes included) in C instead of
+    # the stdlib json encoder
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiting
@@ -66,6 +72,15 @@ app.include_router(graph.router, prefix=f"{settings.API_PREFIX}/graph", tags=["g
 app.include_router(ai.router, prefix=f"{settings.API_PREFIX}/ai", tags=["ai"])
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Warm the Neo4j connection pool so the first request skips the handshake."""
+    neo4j_connection.warm_up()
+    ensure_schema()
+    ensure_fulltext_indexes()
+    ensure_denormalized_fields()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import List
 from shared.types import Company, APIResponse
 from backend.graph_service.companies import (
     create_company as neo4j_create_company,
     get_company as neo4j_get_company,
+    iter_companies as neo4j_iter_companies,
     list_companies as neo4j_list_companies,
     update_company as neo4j_update_company,
     delete_company as neo4j_delete_company
@@ -16,6 +18,14 @@ def list_companies():
     """List all companies."""
     return neo4j_list_companies()
 
+@router.get("/stream")
+def stream_companies():
+    """Stream all companies as newline-delimited JSON."""
+    def ndjson_iter():
+        for company in neo4j_iter_companies():
+            yield company.model_dump_json() + "\n"
+    return StreamingResponse(ndjson_iter(), media_type="application/x-ndjson")
+
 @router.get("/{company_id}", response_model=Company)
 def get_company(company_id: str):
     """Get a company by ID."""
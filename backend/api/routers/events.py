@@ -34,6 +34,21 @@ async def create_event(event: Event):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=APIResponse)
+async def create_events(events: List[Event]):
+    """Create multiple events in a single batched write."""
+    try:
+        created_events = event_service.create_events(events)
+        return APIResponse(
+            success=True,
+            data=[event.model_dump() for event in created_events],
+            message=f"Created {len(created_events)} events successfully"
+        )
+    except Exception as e:
+        logger.error(f"Error creating events in batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/", response_model=APIResponse)
 async def list_events(
     search: Optional[str] = Query(None, description="Search events by name"),
@@ -72,10 +87,16 @@ async def list_events(
 
 
 @router.get("/upcoming", response_model=APIResponse)
-async def get_upcoming_events(limit: int = Query(10, ge=1, le=50, description="Number of events to return")):
+async def get_upcoming_events(
+    limit: int = Query(10, ge=1, le=50, description="Number of events to return"),
+    summary: bool = Query(False, description="Return only id/name/date/type per event")
+):
     """Get upcoming events (events with dates in the future)."""
     try:
-        events = event_service.get_upcoming_events(limit)
+        if summary:
+            events = event_service.get_upcoming_event_summaries(limit)
+        else:
+            events = event_service.get_upcoming_events(limit)
         return APIResponse(
             success=True,
             data=[event.model_dump() for event in events],
@@ -87,10 +108,16 @@ async def get_upcoming_events(limit: int = Query(10, ge=1, le=50, description="N
 
 
 @router.get("/recent", response_model=APIResponse)
-async def get_recent_events(limit: int = Query(10, ge=1, le=50, description="Number of events to return")):
+async def get_recent_events(
+    limit: int = Query(10, ge=1, le=50, description="Number of events to return"),
+    summary: bool = Query(False, description="Return only id/name/date/type per event")
+):
     """Get recent events (events with dates in the past)."""
     try:
-        events = event_service.get_recent_events(limit)
+        if summary:
+            events = event_service.get_recent_event_summaries(limit)
+        else:
+            events = event_service.get_recent_events(limit)
         return APIResponse(
             success=True,
             data=[event.model_dump() for event in events],
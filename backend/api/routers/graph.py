@@ -2,6 +2,7 @@
 Graph-related API endpoints for network visualization and analysis.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -11,6 +12,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from shared.types import APIResponse
 from shared.utils import setup_logging
 from backend.graph_service.people import list_people
@@ -24,7 +26,7 @@ from backend.graph_service.graph_queries import (
     get_person_network_graph,
     get_person_details,
     get_network_statistics,
-    get_network_insights,
+    get_network_insights_async,
     search_network,
     get_network_paths,
     get_network_clusters,
@@ -46,19 +48,27 @@ def _convert_neo4j_record(record):
     return data
 
 
-@router.get("/full", response_model=APIResponse)
-async def get_full_network_graph():
+# The whole-graph endpoints skip response_model: re-validating every
+# node and edge through APIResponse doubles serialization work on the
+# largest payloads, so they hand a plain dict straight to orjson.
+@router.get("/full")
+async def get_full_network_graph_endpoint():
     """Get the complete network graph for visualization."""
     try:
         graph = get_full_network_graph()
-        return APIResponse(success=True, data=graph.model_dump(), message="Full network graph retrieved")
+        return ORJSONResponse({
+            "success": True,
+            "data": graph.model_dump(),
+            "message": "Full network graph retrieved",
+            "error": None
+        })
     except Exception as e:
         logger.error(f"Error getting full network graph: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/person/{person_id}", response_model=APIResponse)
-async def get_person_network_graph(person_id: str, depth: int = Query(2, ge=1, le=5)):
+async def get_person_network_graph_endpoint(person_id: str, depth: int = Query(2, ge=1, le=5)):
     """Get a person's network graph up to a certain depth."""
     try:
         graph = get_person_network_graph(person_id, depth)
@@ -89,7 +99,7 @@ async def get_person_details_endpoint(person_id: str):
 
 
 @router.get("/statistics", response_model=APIResponse)
-async def get_network_statistics():
+async def get_network_statistics_endpoint():
     """Get overall network statistics."""
     try:
         stats = get_network_statistics()
@@ -103,7 +113,7 @@ async def get_network_statistics():
 async def get_network_insights():
     """Get insights about the network."""
     try:
-        insights = get_network_insights()
+        insights = await get_network_insights_async()
         return APIResponse(success=True, data=insights, message="Network insights retrieved")
     except Exception as e:
         logger.error(f"Error getting network insights: {e}")
@@ -111,7 +121,7 @@ async def get_network_insights():
 
 
 @router.get("/search", response_model=APIResponse)
-async def search_network(query: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)):
+async def search_network_endpoint(query: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)):
     """Search across the entire network."""
     try:
         results = search_network(query, limit)
@@ -122,7 +132,7 @@ async def search_network(query: str = Query(..., min_length=1), limit: int = Que
 
 
 @router.get("/paths", response_model=APIResponse)
-async def get_network_paths(from_person_id: str, to_person_id: str, max_length: int = Query(3, ge=1, le=6)):
+async def get_network_paths_endpoint(from_person_id: str, to_person_id: str, max_length: int = Query(3, ge=1, le=6)):
     """Find paths between two people in the network."""
     try:
         paths = get_network_paths(from_person_id, to_person_id, max_length)
@@ -133,7 +143,7 @@ async def get_network_paths(from_person_id: str, to_person_id: str, max_length:
 
 
 @router.get("/clusters", response_model=APIResponse)
-async def get_network_clusters():
+async def get_network_clusters_endpoint():
     """Identify clusters or communities in the network."""
     try:
         clusters = get_network_clusters()
@@ -144,7 +154,7 @@ async def get_network_clusters():
 
 
 @router.get("/recommendations/{person_id}", response_model=APIResponse)
-async def get_network_recommendations(person_id: str, limit: int = Query(5, ge=1, le=20)):
+async def get_network_recommendations_endpoint(person_id: str, limit: int = Query(5, ge=1, le=20)):
     """Get network recommendations for a person."""
     try:
         recommendations = get_network_recommendations(person_id, limit)
@@ -154,17 +164,21 @@ async def get_network_recommendations(person_id: str, limit: int = Query(5, ge=1
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/data", response_model=APIResponse)
+@router.get("/data")
 async def get_graph_data():
     """Get all graph data for visualization (nodes and real edges)."""
     try:
-        # Fetch all entities
-        people = list_people()
-        companies = list_companies()
-        topics = list_topics()
-        events = list_events()
-        locations = list_locations()
-        interactions = list_interactions()
+        # Fetch all entities concurrently: the six reads are independent,
+        # so overlapping them bounds this stage by the slowest one (and
+        # keeps the blocking driver calls off the event loop)
+        people, companies, topics, events, locations, interactions = await asyncio.gather(
+            asyncio.to_thread(list_people),
+            asyncio.to_thread(list_companies),
+            asyncio.to_thread(list_topics),
+            asyncio.to_thread(list_events),
+            asyncio.to_thread(list_locations),
+            asyncio.to_thread(list_interactions)
+        )
 
         # Convert to graph format
         nodes = []
@@ -361,11 +375,12 @@ async def get_graph_data():
             "edges": edges
         }
 
-        return APIResponse(
-            success=True,
-            data=graph_data,
-            message="Graph data retrieved successfully"
-        )
+        return ORJSONResponse({
+            "success": True,
+            "data": graph_data,
+            "message": "Graph data retrieved successfully",
+            "error": None
+        })
 
     except Exception as e:
         logger.error(f"Error getting graph data: {e}")
@@ -376,12 +391,15 @@ async def get_graph_data():
 async def get_graph_stats():
     """Get statistics about the graph."""
     try:
-        people = list_people()
-        companies = list_companies()
-        topics = list_topics()
-        events = list_events()
-        locations = list_locations()
-        interactions = list_interactions()
+        # Same concurrent fan-out as get_graph_data
+        people, companies, topics, events, locations, interactions = await asyncio.gather(
+            asyncio.to_thread(list_people),
+            asyncio.to_thread(list_companies),
+            asyncio.to_thread(list_topics),
+            asyncio.to_thread(list_events),
+            asyncio.to_thread(list_locations),
+            asyncio.to_thread(list_interactions)
+        )
 
         # Calculate recent interactions (last 30 days)
         thirty_days_ago = datetime.now() - timedelta(days=30)
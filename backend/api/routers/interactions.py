@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Dict, Any, Optional
 from shared.types import Interaction, APIResponse, InteractionUpdate
 from backend.graph_service.interactions import (
     create_interaction as neo4j_create_interaction,
@@ -15,9 +15,12 @@ from backend.graph_service.interactions import (
 router = APIRouter()
 
 @router.get("/", response_model=APIResponse)
-def list_interactions():
-    """List all interactions."""
-    interactions = neo4j_list_interactions()
+def list_interactions(
+    skip: int = Query(0, ge=0, description="Number of interactions to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum interactions to return")
+):
+    """List interactions, optionally paginated."""
+    interactions = neo4j_list_interactions(skip=skip, limit=limit)
     return APIResponse(
         success=True,
         data=[interaction.model_dump() for interaction in interactions],
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+import orjson
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from shared.types import Person, APIResponse
 import sys
 from pathlib import Path
@@ -10,7 +12,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
 from backend.graph_service.people import (
     create_person as neo4j_create_person,
     get_person as neo4j_get_person,
+    get_person_async as neo4j_get_person_async,
+    get_person_profile as neo4j_get_person_profile,
+    iter_people as neo4j_iter_people,
     list_people as neo4j_list_people,
+    list_people_async as neo4j_list_people_async,
+    list_people_page as neo4j_list_people_page,
     update_person as neo4j_update_person,
     delete_person as neo4j_delete_person
 )
@@ -18,19 +25,42 @@ from backend.graph_service.people import (
 router = APIRouter()
 
 @router.get("/", response_model=APIResponse)
-def list_people():
-    """List all people."""
-    people = neo4j_list_people()
+async def list_people(
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit for the full list"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+    """List all people, or a keyset page when a limit is given."""
+    if limit is not None:
+        people, next_cursor = neo4j_list_people_page(limit=limit, cursor=cursor)
+        return APIResponse(
+            success=True,
+            data={
+                "items": [person.model_dump() for person in people],
+                "next_cursor": next_cursor
+            },
+            message="People retrieved successfully"
+        )
+    people = await neo4j_list_people_async()
     return APIResponse(
         success=True,
         data=[person.model_dump() for person in people],
         message="People retrieved successfully"
     )
 
+@router.get("/stream")
+def stream_people():
+    """Stream all people as newline-delimited JSON."""
+    def ndjson_iter():
+        # orjson encodes each record in one shot and yields bytes, so
+        # StreamingResponse skips the per-chunk str->bytes encode
+        for person in neo4j_iter_people():
+            yield orjson.dumps(person.model_dump(mode="json")) + b"\n"
+    return StreamingResponse(ndjson_iter(), media_type="application/x-ndjson")
+
 @router.get("/{person_id}", response_model=APIResponse)
-def get_person(person_id: str):
+async def get_person(person_id: str):
     """Get a person by ID."""
-    person = neo4j_get_person(person_id)
+    person = await neo4j_get_person_async(person_id)
     if not person:
         raise HTTPException(status_code=404, detail="Person not found")
     return APIResponse(
@@ -39,6 +69,18 @@ def get_person(person_id: str):
         message="Person retrieved successfully"
     )
 
+@router.get("/{person_id}/profile", response_model=APIResponse)
+def get_person_profile(person_id: str):
+    """Get a person with employment, topics and relationships in one query."""
+    profile = neo4j_get_person_profile(person_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Person not found")
+    return APIResponse(
+        success=True,
+        data=profile,
+        message="Person profile retrieved successfully"
+    )
+
 @router.post("/", response_model=APIResponse)
 def create_person(person: Person):
     """Create a new person."""
@@ -43,9 +43,9 @@ async def list_topics(
     """List all topics with optional search and pagination."""
     try:
         if search:
-            topics = topic_service.search_topics(search)
+            topics = await topic_service.search_topics_async(search)
         else:
-            topics = topic_service.list_topics()
+            topics = await topic_service.list_topics_async()
         
         # Simple pagination
         start_idx = (page - 1) * page_size
@@ -72,7 +72,7 @@ async def list_topics(
 async def get_popular_topics(limit: int = Query(10, ge=1, le=50, description="Number of topics to return")):
     """Get the most popular topics (by number of people interested)."""
     try:
-        topics = topic_service.get_popular_topics(limit)
+        topics = await topic_service.get_popular_topics_async(limit)
         return APIResponse(
             success=True,
             data=topics,
@@ -87,7 +87,7 @@ async def get_popular_topics(limit: int = Query(10, ge=1, le=50, description="Nu
 async def get_topic(topic_id: str):
     """Get a topic by ID."""
     try:
-        topic = topic_service.get_topic(topic_id)
+        topic = await topic_service.get_topic_async(topic_id)
         if not topic:
             raise HTTPException(status_code=404, detail="Topic not found")
         
@@ -2,6 +2,8 @@
 Tests for Company CRUD operations.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
@@ -95,6 +97,19 @@ class TestCompanyCRUD:
         names = [company["name"] for company in data]
         assert "Alpha Corp" in names
         assert "Beta Inc" in names
+
+    def test_stream_companies(self):
+        """Test streaming companies as newline-delimited JSON."""
+        company_data = {"name": "Stream Corp", "industry": "Technology"}
+        client.post("/api/v1/companies/", json=company_data)
+
+        response = client.get("/api/v1/companies/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [line for line in response.text.splitlines() if line]
+        names = [json.loads(line)["name"] for line in lines]
+        assert "Stream Corp" in names
     
     def test_update_company(self):
         """Test updating a company."""
@@ -0,0 +1,48 @@
+"""
+Concurrency tests exercising the API with parallel in-flight requests.
+
+Uses httpx.AsyncClient over the ASGI transport so several requests can be
+dispatched with asyncio.gather instead of serially through TestClient.
+"""
+
+import asyncio
+
+import httpx
+
+from backend.api.main import app
+
+BASE_URL = "http://testserver"
+
+
+def _async_client():
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL)
+
+
+def test_concurrent_health_checks():
+    """Many parallel requests against the health endpoint all succeed."""
+    async def run():
+        async with _async_client() as client:
+            return await asyncio.gather(*(client.get("/health") for _ in range(10)))
+
+    responses = asyncio.run(run())
+    assert all(r.status_code == 200 for r in responses)
+
+
+def test_concurrent_person_creation():
+    """Parallel person creations all land and show up in the listing."""
+    async def run():
+        async with _async_client() as client:
+            creates = await asyncio.gather(
+                *(client.post("/api/v1/people/", json={"name": f"Concurrent Person {i}"})
+                  for i in range(5))
+            )
+            listing = await client.get("/api/v1/people/")
+            # Cleanup
+            ids = [r.json()["data"]["id"] for r in creates if r.status_code == 200]
+            await asyncio.gather(*(client.delete(f"/api/v1/people/{pid}") for pid in ids))
+            return creates, listing
+
+    creates, listing = asyncio.run(run())
+    assert all(r.status_code == 200 for r in creates)
+    names = {p["name"] for p in listing.json()["data"]}
+    assert {f"Concurrent Person {i}" for i in range(5)} <= names
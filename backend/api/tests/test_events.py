@@ -22,6 +22,20 @@ def test_create_event():
     client.delete(f"{API_PREFIX}/{event_id}")
 
 
+def test_create_events_batch():
+    payloads = [create_event_payload(f"Batch Event {i}") for i in range(3)]
+    response = client.post(API_PREFIX + "/batch", json=payloads)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"]
+    created = data["data"]
+    assert len(created) == 3
+    assert {e["name"] for e in created} == {p["name"] for p in payloads}
+    # Cleanup
+    for event in created:
+        client.delete(f"{API_PREFIX}/{event['id']}")
+
+
 def test_get_event_not_found():
     response = client.get(f"{API_PREFIX}/nonexistent-id")
     assert response.status_code == 404
@@ -61,7 +75,7 @@ def test_list_events():
     assert response.status_code == 200
     data = response.json()["data"]
     assert "items" in data
-    assert any(e["id"] == event_id for e in data["items"])
+    assert event_id in {e["id"] for e in data["items"]}
     # Cleanup
     client.delete(f"{API_PREFIX}/{event_id}")
 
@@ -75,7 +89,7 @@ def test_search_events():
     response = client.get(API_PREFIX + "/", params={"search": "Searchable"})
     assert response.status_code == 200
     data = response.json()["data"]
-    assert any(e["id"] == event_id for e in data["items"])
+    assert event_id in {e["id"] for e in data["items"]}
     # Cleanup
     client.delete(f"{API_PREFIX}/{event_id}")
 
@@ -94,7 +108,7 @@ def test_link_and_unlink_person_to_event():
     resp = client.get(f"{API_PREFIX}/{event_id}/people")
     assert resp.status_code == 200
     people = resp.json()["data"]
-    assert any(p["id"] == person_id for p in people)
+    assert person_id in {p["id"] for p in people}
     # Unlink
     unlink_resp = client.delete(f"{API_PREFIX}/{event_id}/people/{person_id}")
     assert unlink_resp.status_code == 200
@@ -111,6 +125,6 @@ def test_get_upcoming_and_recent_events():
     # Upcoming
     resp = client.get(f"{API_PREFIX}/upcoming")
     assert resp.status_code == 200
-    assert any(e["id"] == event_id for e in resp.json()["data"])
+    assert event_id in {e["id"] for e in resp.json()["data"]}
     # Cleanup
     client.delete(f"{API_PREFIX}/{event_id}") 
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Tests for the graph endpoints.
+
+These are smoke tests: every read-only graph route must answer 200 with
+a success envelope. They exist because the handlers once shadowed the
+service functions they call, which turned every request into a 500.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.graph_service.connection import get_session_context
+
+client = TestClient(app)
+API_PREFIX = "/api/v1/graph"
+
+# Node IDs created during the current test, swept in one query afterwards
+_created_ids = []
+
+
+@pytest.fixture(autouse=True)
+def cleanup_created_nodes():
+    """Sweep every node a test created with a single DETACH DELETE."""
+    _created_ids.clear()
+    yield
+    if _created_ids:
+        with get_session_context() as session:
+            session.run(
+                "MATCH (n) WHERE n.id IN $ids DETACH DELETE n",
+                ids=list(_created_ids),
+            )
+        _created_ids.clear()
+
+
+def create_person(name):
+    """POST a person and record the ID for the cleanup sweep."""
+    response = client.post("/api/v1/people/", json={"name": name})
+    assert response.status_code == 200
+    person_id = response.json()["data"]["id"]
+    _created_ids.append(person_id)
+    return person_id
+
+
+def assert_success(response):
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"]
+    return body["data"]
+
+
+def test_full_network_graph():
+    data = assert_success(client.get(f"{API_PREFIX}/full"))
+    assert "nodes" in data
+    assert "edges" in data
+
+
+def test_graph_data():
+    data = assert_success(client.get(f"{API_PREFIX}/data"))
+    assert "nodes" in data
+    assert "edges" in data
+
+
+def test_network_statistics():
+    assert_success(client.get(f"{API_PREFIX}/statistics"))
+
+
+def test_graph_stats():
+    assert_success(client.get(f"{API_PREFIX}/stats"))
+
+
+def test_network_insights():
+    assert_success(client.get(f"{API_PREFIX}/insights"))
+
+
+def test_network_clusters():
+    assert_success(client.get(f"{API_PREFIX}/clusters"))
+
+
+def test_search_network():
+    assert_success(client.get(f"{API_PREFIX}/search", params={"query": "test"}))
+
+
+def test_person_network_graph():
+    person_id = create_person("Graph Smoke Person")
+    data = assert_success(client.get(f"{API_PREFIX}/person/{person_id}"))
+    assert "nodes" in data
+    assert "edges" in data
+
+
+def test_person_details():
+    person_id = create_person("Graph Details Person")
+    assert_success(client.get(f"{API_PREFIX}/person/{person_id}/details"))
+
+
+def test_network_paths():
+    from_id = create_person("Path Person A")
+    to_id = create_person("Path Person B")
+    assert_success(
+        client.get(
+            f"{API_PREFIX}/paths",
+            params={"from_person_id": from_id, "to_person_id": to_id},
+        )
+    )
+
+
+def test_network_recommendations():
+    person_id = create_person("Recommendation Person")
+    assert_success(client.get(f"{API_PREFIX}/recommendations/{person_id}"))
@@ -1,10 +1,36 @@
 import pytest
 from fastapi.testclient import TestClient
 from backend.api.main import app
+from backend.graph_service.connection import get_session_context
 
 client = TestClient(app)
 API_PREFIX = "/api/v1/locations"
 
+# Node IDs created during the current test, swept in one query afterwards
+_created_ids = []
+
+
+@pytest.fixture(autouse=True)
+def cleanup_created_nodes():
+    """Sweep every node a test created with a single DETACH DELETE."""
+    _created_ids.clear()
+    yield
+    if _created_ids:
+        with get_session_context() as session:
+            session.run(
+                "MATCH (n) WHERE n.id IN $ids DETACH DELETE n",
+                ids=list(_created_ids),
+            )
+        _created_ids.clear()
+
+
+def create_tracked(path, payload):
+    """POST helper that records the created node ID for the cleanup sweep."""
+    response = client.post(path, json=payload)
+    if response.status_code == 200:
+        _created_ids.append(response.json()["data"]["id"])
+    return response
+
 
 def create_location_payload(city="Test City", state="Test State", country="Test Country"):
     return {"city": city, "state": state, "country": country}
@@ -12,14 +38,12 @@ def create_location_payload(city="Test City", state="Test State", country="Test
 
 def test_create_location():
     payload = create_location_payload()
-    response = client.post(API_PREFIX + "/", json=payload)
+    response = create_tracked(API_PREFIX + "/", payload)
     assert response.status_code == 200
     data = response.json()
     assert data["success"]
     assert data["data"]["city"] == payload["city"]
-    location_id = data["data"]["id"]
-    # Cleanup
-    client.delete(f"{API_PREFIX}/{location_id}")
+    assert data["data"]["id"] is not None
 
 
 def test_get_location_not_found():
@@ -30,7 +54,7 @@ def test_get_location_not_found():
 def test_crud_location():
     # Create
     payload = create_location_payload("CRUD City")
-    response = client.post(API_PREFIX + "/", json=payload)
+    response = create_tracked(API_PREFIX + "/", payload)
     assert response.status_code == 200
     location = response.json()["data"]
     location_id = location["id"]
@@ -54,38 +78,34 @@ def test_crud_location():
 def test_list_locations():
     # Create a location
     payload = create_location_payload("List City")
-    response = client.post(API_PREFIX + "/", json=payload)
+    response = create_tracked(API_PREFIX + "/", payload)
     location_id = response.json()["data"]["id"]
     # List
     response = client.get(API_PREFIX + "/")
     assert response.status_code == 200
     data = response.json()["data"]
     assert "items" in data
-    assert any(l["id"] == location_id for l in data["items"])
-    # Cleanup
-    client.delete(f"{API_PREFIX}/{location_id}")
+    assert location_id in {l["id"] for l in data["items"]}
 
 
 def test_search_locations():
     # Create a location
     payload = create_location_payload("Searchable City")
-    response = client.post(API_PREFIX + "/", json=payload)
+    response = create_tracked(API_PREFIX + "/", payload)
     location_id = response.json()["data"]["id"]
     # Search
     response = client.get(API_PREFIX + "/", params={"search": "Searchable"})
     assert response.status_code == 200
     data = response.json()["data"]
-    assert any(l["id"] == location_id for l in data["items"])
-    # Cleanup
-    client.delete(f"{API_PREFIX}/{location_id}")
+    assert location_id in {l["id"] for l in data["items"]}
 
 
 def test_link_and_unlink_person_to_location():
     # Create location
-    location_resp = client.post(API_PREFIX + "/", json=create_location_payload("LinkCity"))
+    location_resp = create_tracked(API_PREFIX + "/", create_location_payload("LinkCity"))
     location_id = location_resp.json()["data"]["id"]
     # Create person
-    person_resp = client.post("/api/v1/people/", json={"name": "Location Person"})
+    person_resp = create_tracked("/api/v1/people/", {"name": "Location Person"})
     person_id = person_resp.json()["data"]["id"]
     # Link
     link_resp = client.post(f"{API_PREFIX}/{location_id}/people/{person_id}")
@@ -94,20 +114,17 @@ def test_link_and_unlink_person_to_location():
     resp = client.get(f"{API_PREFIX}/{location_id}/people")
     assert resp.status_code == 200
     people = resp.json()["data"]
-    assert any(p["id"] == person_id for p in people)
+    assert person_id in {p["id"] for p in people}
     # Unlink
     unlink_resp = client.delete(f"{API_PREFIX}/{location_id}/people/{person_id}")
     assert unlink_resp.status_code == 200
-    # Cleanup
-    client.delete(f"/api/v1/people/{person_id}")
-    client.delete(f"{API_PREFIX}/{location_id}")
 
 
 def test_get_popular_locations():
     # Create location and person
-    location_resp = client.post(API_PREFIX + "/", json=create_location_payload("PopularCity"))
+    location_resp = create_tracked(API_PREFIX + "/", create_location_payload("PopularCity"))
     location_id = location_resp.json()["data"]["id"]
-    person_resp = client.post("/api/v1/people/", json={"name": "Popular Person"})
+    person_resp = create_tracked("/api/v1/people/", {"name": "Popular Person"})
     person_id = person_resp.json()["data"]["id"]
     # Link
     client.post(f"{API_PREFIX}/{location_id}/people/{person_id}")
@@ -115,7 +132,4 @@ def test_get_popular_locations():
     resp = client.get(f"{API_PREFIX}/popular")
     assert resp.status_code == 200
     data = resp.json()["data"]
-    assert any(l["city"] == "PopularCity" for l in data)
-    # Cleanup
-    client.delete(f"/api/v1/people/{person_id}")
-    client.delete(f"{API_PREFIX}/{location_id}") 
\ No newline at end of file
+    assert "PopularCity" in {l["city"] for l in data}
\ No newline at end of file
@@ -1,3 +1,12 @@
 """
 Graph service package for Neo4j database operations.
-""" 
\ No newline at end of file
+"""
+
+import sys
+from pathlib import Path
+
+# Make the shared package importable exactly once for the whole package,
+# instead of each module prepending to sys.path on import
+_shared_path = str(Path(__file__).parent.parent.parent / "shared")
+if _shared_path not in sys.path:
+    sys.path.insert(0, _shared_path)
@@ -3,8 +3,9 @@ Neo4j operations for Company nodes.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime, UTC
 from uuid import uuid4
 
@@ -12,36 +13,36 @@ from uuid import uuid4
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
 
 from neo4j import Session
+from pydantic import TypeAdapter
 from shared.types import Company
-from shared.utils import setup_logging
+from shared.utils import convert_neo4j_record, setup_logging
 from .connection import get_session_context
+from .graph_queries import invalidate_network_caches
 
 logger = setup_logging(__name__)
 
+# Validators compiled once at import time and shared by every function below
+_COMPANY_ADAPTER = TypeAdapter(Company)
+_COMPANY_LIST_ADAPTER = TypeAdapter(List[Company])
 
-def _convert_neo4j_record(record):
-    """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-    return data
+
+def _company_from_record(node) -> Company:
+    """Build a Company from a trusted Neo4j node via the compiled validator."""
+    return _COMPANY_ADAPTER.validate_python(convert_neo4j_record(node))
 
 
 def create_company(company: Company) -> Company:
     """Create a new Company node in Neo4j."""
     if not company.id:
-        company.id = str(uuid4())
+        company.id = uuid4().hex
     
     now = datetime.now(UTC)
     company.created_at = now
     company.updated_at = now
     
-    # Convert HttpUrl to string for Neo4j compatibility
+    # website is stored as a plain string, so the dump is Bolt-ready
     company_data = company.model_dump()
-    if company_data.get('website'):
-        company_data['website'] = str(company_data['website'])
-    
+
     cypher_query = """
     CREATE (c:Company {
         id: $id,
@@ -55,10 +56,11 @@ def create_company(company: Company) -> Company:
     """
     
     with get_session_context() as session:
-        result = session.run(cypher_query, **company_data)
-        created_company = _convert_neo4j_record(result.single()["c"])
+        result = session.run(cypher_query, company_data)
+        created_company = _company_from_record(result.single()["c"])
+        invalidate_network_caches()
         logger.info(f"Created company: {company.name} with ID: {company.id}")
-        return Company(**created_company)
+        return created_company
 
 
 def get_company(company_id: str) -> Optional[Company]:
@@ -72,26 +74,47 @@ def get_company(company_id: str) -> Optional[Company]:
         result = session.run(cypher_query, company_id=company_id)
         record = result.single()
         if record:
-            company_data = _convert_neo4j_record(record["c"])
-            return Company(**company_data)
+            return _company_from_record(record["c"])
         return None
 
 
-def list_companies() -> List[Company]:
-    """List all Company nodes."""
+def iter_companies() -> Iterator[Company]:
+    """Stream all Company nodes one record at a time.
+
+    The session stays open for the lifetime of the generator, so peak
+    memory is bounded by a single record instead of the full result set.
+    """
     cypher_query = """
     MATCH (c:Company)
     RETURN c
     ORDER BY c.name
     """
-    
+
     with get_session_context() as session:
         result = session.run(cypher_query)
-        companies = []
         for record in result:
-            company_data = _convert_neo4j_record(record["c"])
-            companies.append(Company(**company_data))
-        return companies
+            yield _company_from_record(record["c"])
+
+
+def list_companies() -> List[Company]:
+    """List all Company nodes."""
+    return list(iter_companies())
+
+
+@lru_cache(maxsize=64)
+def _update_company_cypher(fields: frozenset) -> str:
+    """Build (and memoize) the update query for a given set of fields.
+
+    Updates touching the same fields reuse the exact same Cypher string,
+    so Neo4j can serve them from its query plan cache instead of
+    re-parsing a fresh statement on every call.
+    """
+    set_clause = ", ".join(f"c.{key} = ${key}" for key in sorted(fields))
+    return f"""
+    MATCH (c:Company {{id: $company_id}})
+    SET {set_clause}
+    RETURN c
+    """
 
 
 def update_company(company_id: str, company_data: Dict[str, Any]) -> Optional[Company]:
@@ -99,27 +122,16 @@ def update_company(company_id: str, company_data: Dict[str, Any]) -> Optional[Co
     # Remove None values and add updated_at timestamp
     update_data = {k: v for k, v in company_data.items() if v is not None}
     update_data["updated_at"] = datetime.now(UTC)
-    
-    # Convert HttpUrl to string for Neo4j compatibility
-    if update_data.get('website'):
-        update_data['website'] = str(update_data['website'])
-    
-    # Build dynamic SET clause
-    set_clause = ", ".join([f"c.{key} = ${key}" for key in update_data.keys()])
-    
-    cypher_query = f"""
-    MATCH (c:Company {{id: $company_id}})
-    SET {set_clause}
-    RETURN c
-    """
-    
+
+    cypher_query = _update_company_cypher(frozenset(update_data))
+    update_data["company_id"] = company_id
+
     with get_session_context() as session:
-        result = session.run(cypher_query, company_id=company_id, **update_data)
+        result = session.run(cypher_query, update_data)
         record = result.single()
         if record:
-            company_data = _convert_neo4j_record(record["c"])
             logger.info(f"Updated company: {company_id}")
-            return Company(**company_data)
+            return _company_from_record(record["c"])
         return None
 
 
@@ -135,6 +147,7 @@ def delete_company(company_id: str) -> bool:
         result = session.run(cypher_query, company_id=company_id)
         deleted_count = result.single()["deleted_count"]
         if deleted_count > 0:
+            invalidate_network_caches()
             logger.info(f"Deleted company: {company_id}")
             return True
         return False
@@ -151,11 +164,9 @@ def search_companies(query: str) -> List[Company]:
     
     with get_session_context() as session:
         result = session.run(cypher_query, query=query)
-        companies = []
-        for record in result:
-            company_data = _convert_neo4j_record(record["c"])
-            companies.append(Company(**company_data))
-        return companies
+        return _COMPANY_LIST_ADAPTER.validate_python(
+            [convert_neo4j_record(record["c"]) for record in result]
+        )
 
 
 def get_company_by_name(name: str) -> Optional[Company]:
@@ -169,6 +180,5 @@ def get_company_by_name(name: str) -> Optional[Company]:
         result = session.run(cypher_query, name=name)
         record = result.single()
         if record:
-            company_data = _convert_neo4j_record(record["c"])
-            return Company(**company_data)
+            return _company_from_record(record["c"])
         return None 
\ No newline at end of file
@@ -2,15 +2,11 @@
 Neo4j database connection management.
 """
 
-import sys
-from pathlib import Path
-from typing import Optional, Generator
-from contextlib import contextmanager
+from typing import AsyncGenerator, Optional, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession, GraphDatabase, Driver, Session
 from shared.config import get_settings
 from shared.utils import setup_logging
 
@@ -30,7 +26,12 @@ class Neo4jConnection:
             try:
                 self._driver = GraphDatabase.driver(
                     settings.NEO4J_URI,
-                    auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+                    auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                    max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+                    max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                    connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+                    max_transaction_retry_time=settings.NEO4J_MAX_TRANSACTION_RETRY_TIME,
+                    keep_alive=True
                 )
                 # Test the connection
                 with self._driver.session(database=settings.NEO4J_DATABASE) as session:
@@ -41,6 +42,17 @@ class Neo4jConnection:
                 raise
         return self._driver
     
+    def warm_up(self):
+        """Eagerly establish the driver so the first request skips the handshake.
+
+        Best-effort: if the database is not reachable yet, connection
+        setup falls back to the lazy path on first use.
+        """
+        try:
+            self.connect()
+        except Exception as e:
+            logger.warning(f"Neo4j warm-up failed, will connect lazily: {e}")
+
     def close(self):
         """Close the Neo4j driver connection."""
         if self._driver:
@@ -52,15 +64,66 @@ class Neo4jConnection:
     def get_session(self, database: Optional[str] = None) -> Generator[Session, None, None]:
         """Get a Neo4j session with automatic cleanup."""
         driver = self.connect()
-        session = driver.session(database=database or settings.NEO4J_DATABASE)
+        session = driver.session(
+            database=database or settings.NEO4J_DATABASE,
+            fetch_size=settings.NEO4J_FETCH_SIZE
+        )
         try:
             yield session
         finally:
             session.close()
 
 
-# Global connection instance
+class AsyncNeo4jConnection:
+    """Async Neo4j connection manager for use inside the event loop.
+
+    Mirrors Neo4jConnection but hands out AsyncSession objects, so
+    endpoints can overlap independent queries with asyncio.gather
+    instead of blocking a worker thread per query.
+    """
+
+    def __init__(self):
+        self._driver: Optional[AsyncDriver] = None
+
+    def connect(self) -> AsyncDriver:
+        """Create and return an async Neo4j driver instance."""
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+                max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+                connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+                max_transaction_retry_time=settings.NEO4J_MAX_TRANSACTION_RETRY_TIME,
+                keep_alive=True
+            )
+            logger.info(f"Created async Neo4j driver for {settings.NEO4J_URI}")
+        return self._driver
+
+    async def close(self):
+        """Close the async Neo4j driver connection."""
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+            logger.info("Async Neo4j connection closed")
+
+    @asynccontextmanager
+    async def get_session(self, database: Optional[str] = None) -> AsyncGenerator[AsyncSession, None]:
+        """Get an async Neo4j session with automatic cleanup."""
+        driver = self.connect()
+        session = driver.session(
+            database=database or settings.NEO4J_DATABASE,
+            fetch_size=settings.NEO4J_FETCH_SIZE
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+# Global connection instances
 neo4j_connection = Neo4jConnection()
+async_neo4j_connection = AsyncNeo4jConnection()
 
 
 def get_neo4j_session(database: Optional[str] = None) -> Session:
@@ -68,8 +131,67 @@ def get_neo4j_session(database: Optional[str] = None) -> Session:
     return neo4j_connection.get_session(database)
 
 
+# Session bound by batch_session() for the current task/thread; service
+# functions called inside that scope reuse it instead of checking a new
+# session out of the pool per query.
+_scoped_session: ContextVar[Optional[Session]] = ContextVar("neo4j_scoped_session", default=None)
+
+
 @contextmanager
 def get_session_context(database: Optional[str] = None) -> Generator[Session, None, None]:
-    """Context manager for Neo4j sessions."""
+    """Context manager for Neo4j sessions.
+
+    Reuses the session bound by an enclosing batch_session() when there
+    is one; otherwise acquires a fresh session from the pool.
+    """
+    scoped = _scoped_session.get()
+    if scoped is not None:
+        yield scoped
+        return
+    with neo4j_connection.get_session(database) as session:
+        yield session
+
+
+@contextmanager
+def batch_session(database: Optional[str] = None) -> Generator[Session, None, None]:
+    """Bind one session for every nested get_session_context call.
+
+    Callers that issue many service calls in a row (request handlers,
+    ingest loops) wrap them in this to pay the session checkout cost
+    once instead of per call.
+    """
+    scoped = _scoped_session.get()
+    if scoped is not None:
+        # Already inside a batch scope; nest transparently
+        yield scoped
+        return
     with neo4j_connection.get_session(database) as session:
-        yield session 
\ No newline at end of file
+        token = _scoped_session.set(session)
+        try:
+            yield session
+        finally:
+            _scoped_session.reset(token)
+
+
+@asynccontextmanager
+async def get_async_session_context(database: Optional[str] = None) -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for Neo4j sessions."""
+    async with async_neo4j_connection.get_session(database) as session:
+        yield session
+
+
+def run_read_query(query: str, **parameters) -> list:
+    """Run a read query in a managed transaction and return all records.
+
+    Unlike auto-commit session.run, managed transactions are retried by
+    the driver on transient errors (leader switch, deadlock) and are
+    routed to readers in a cluster.
+    """
+    with get_session_context() as session:
+        return session.execute_read(lambda tx: list(tx.run(query, **parameters)))
+
+
+def run_write_query(query: str, **parameters) -> list:
+    """Run a write query in a managed transaction and return all records."""
+    with get_session_context() as session:
+        return session.execute_write(lambda tx: list(tx.run(query, **parameters))) 
\ No newline at end of file
@@ -2,358 +2,515 @@
 Neo4j operations for Event nodes.
 """
 
-import sys
-from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime, UTC
 from uuid import uuid4
 
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
-from neo4j import Session
-from shared.types import Event, EventType
-from shared.utils import setup_logging
-from .connection import get_session_context
+from pydantic import TypeAdapter
+from shared.types import Event, EventSummary, EventType
+from shared.utils import convert_neo4j_record, escape_lucene_query, setup_logging
+from .connection import get_session_context, run_read_query, run_write_query
+from .graph_queries import FULLTEXT_INDEX_NAME
 
 logger = setup_logging(__name__)
 
+# Pre-compiled validators; batch validation runs in pydantic-core instead of
+# constructing each Event through Python-level __init__.
+_EVENT_ADAPTER = TypeAdapter(Event)
+_EVENT_LIST_ADAPTER = TypeAdapter(List[Event])
+_EVENT_SUMMARY_LIST_ADAPTER = TypeAdapter(List[EventSummary])
+
+# Fields callers are allowed to change via update_event
+_UPDATABLE_EVENT_FIELDS = frozenset(Event.model_fields) - {"id", "created_at"}
+
+# Cypher hoisted to module level: the strings are built once at import time,
+# and identical string identity keeps Neo4j's plan cache hitting.
+_Q_CREATE_EVENT = """
+CREATE (e:Event {
+    id: $id,
+    name: $name,
+    date: $date,
+    type: $type,
+    location_id: $location_id,
+    created_at: $created_at
+})
+RETURN e
+"""
+
+_Q_CREATE_EVENTS = """
+UNWIND $rows AS row
+CREATE (e:Event {
+    id: row.id,
+    name: row.name,
+    date: row.date,
+    type: row.type,
+    location_id: row.location_id,
+    created_at: row.created_at
+})
+RETURN e
+"""
+
+_Q_GET_EVENT = """
+MATCH (e:Event {id: $event_id})
+RETURN e
+"""
+
+_Q_LIST_EVENTS = """
+MATCH (e:Event)
+RETURN e
+ORDER BY e.date DESC
+"""
+
+_Q_UPDATE_EVENT = """
+MATCH (e:Event {id: $event_id})
+SET e += $updates
+RETURN e
+"""
+
+# Deleting an event also rolls back its HELD_AT contribution to the
+# location's denormalized event_count.
+_Q_DELETE_EVENT = """
+MATCH (e:Event {id: $event_id})
+OPTIONAL MATCH (e)-[:HELD_AT]->(l:Location)
+SET l.event_count = coalesce(l.event_count, 1) - 1
+WITH DISTINCT e
+DETACH DELETE e
+"""
+
+_Q_DELETE_EVENTS = """
+UNWIND $event_ids AS eid
+MATCH (e:Event {id: eid})
+OPTIONAL MATCH (e)-[:HELD_AT]->(l:Location)
+SET l.event_count = coalesce(l.event_count, 1) - 1
+WITH DISTINCT e
+DETACH DELETE e
+"""
+
+_Q_SEARCH_EVENTS_FULLTEXT = """
+CALL db.index.fulltext.queryNodes($index_name, $search_term)
+YIELD node, score
+WHERE node:Event
+RETURN node as e
+ORDER BY score DESC
+"""
+
+_Q_SEARCH_EVENTS_FALLBACK = """
+MATCH (e:Event)
+WHERE e.name CONTAINS $search_term
+RETURN e
+ORDER BY e.date DESC, e.name
+"""
+
+_Q_EVENTS_BY_TYPE = """
+MATCH (e:Event)
+WHERE e.type = $event_type
+RETURN e
+ORDER BY e.date DESC
+"""
+
+_Q_EVENTS_BY_DATE_RANGE = """
+MATCH (e:Event)
+WHERE e.date >= $start_date AND e.date <= $end_date
+RETURN e
+ORDER BY e.date
+"""
+
+_Q_LINK_PERSON_TO_EVENT = """
+MATCH (p:Person {id: $person_id})
+MATCH (e:Event {id: $event_id})
+MERGE (p)-[:ATTENDED]->(e)
+RETURN count(*) as link_count
+"""
+
+_Q_UNLINK_PERSON_FROM_EVENT = """
+MATCH (p:Person {id: $person_id})-[r:ATTENDED]->(e:Event {id: $event_id})
+DELETE r
+RETURN count(r) as deleted_count
+"""
+
+_Q_PEOPLE_AT_EVENT = """
+MATCH (p:Person)-[:ATTENDED]->(e:Event {id: $event_id})
+RETURN p
+ORDER BY p.name
+"""
+
+_Q_EVENTS_FOR_PERSON = """
+MATCH (p:Person {id: $person_id})-[:ATTENDED]->(e:Event)
+RETURN e
+ORDER BY e.date DESC
+"""
+
+_Q_EVENTS_FOR_PEOPLE = """
+UNWIND $person_ids AS pid
+MATCH (p:Person {id: pid})-[:ATTENDED]->(e:Event)
+WITH pid, e
+ORDER BY e.date DESC
+RETURN pid, collect(e) AS events
+"""
+
+_Q_PEOPLE_AT_EVENTS = """
+UNWIND $event_ids AS eid
+MATCH (p:Person)-[:ATTENDED]->(e:Event {id: eid})
+WITH eid, p
+ORDER BY p.name
+RETURN eid, collect(p) AS people
+"""
+
+_Q_LOCATIONS_FOR_EVENTS = """
+UNWIND $event_ids AS eid
+MATCH (e:Event {id: eid})-[:HELD_AT]->(l:Location)
+RETURN eid, l
+"""
+
+_Q_EVENTS_AT_LOCATIONS = """
+UNWIND $location_ids AS lid
+MATCH (e:Event)-[:HELD_AT]->(l:Location {id: lid})
+WITH lid, e
+ORDER BY e.date DESC
+RETURN lid, collect(e) AS events
+"""
+
+_Q_LINK_EVENT_TO_LOCATION = """
+MATCH (e:Event {id: $event_id})
+MATCH (l:Location {id: $location_id})
+MERGE (e)-[r:HELD_AT]->(l)
+ON CREATE SET l.event_count = coalesce(l.event_count, 0) + 1
+RETURN count(*) as link_count
+"""
+
+_Q_LOCATION_FOR_EVENT = """
+MATCH (e:Event {id: $event_id})-[:HELD_AT]->(l:Location)
+RETURN l
+"""
+
+_Q_EVENTS_AT_LOCATION = """
+MATCH (e:Event)-[:HELD_AT]->(l:Location {id: $location_id})
+RETURN e
+ORDER BY e.date DESC
+"""
+
+# datetime() is evaluated server-side, so the cutoff is always the
+# database clock, plays no role in plan selection, and stays comparable
+# to the indexed e.date type
+_Q_UPCOMING_EVENTS = """
+MATCH (e:Event)
+WHERE e.date > datetime()
+RETURN e
+ORDER BY e.date
+LIMIT $limit
+"""
+
+# Map projections ship only the summary fields over Bolt instead of the
+# whole property map
+_Q_UPCOMING_EVENT_SUMMARIES = """
+MATCH (e:Event)
+WHERE e.date > datetime()
+RETURN e{.id, .name, .date, .type} as e
+ORDER BY e.date
+LIMIT $limit
+"""
+
+_Q_RECENT_EVENTS = """
+MATCH (e:Event)
+WHERE e.date <= datetime()
+RETURN e
+ORDER BY e.date DESC
+LIMIT $limit
+"""
+
+_Q_RECENT_EVENT_SUMMARIES = """
+MATCH (e:Event)
+WHERE e.date <= datetime()
+RETURN e{.id, .name, .date, .type} as e
+ORDER BY e.date DESC
+LIMIT $limit
+"""
+
+_Q_EVENT_BY_NAME = """
+MATCH (e:Event {name: $name})
+RETURN e
+"""
+
+
+def _event_from_record(node) -> Event:
+    """Build an Event from a Neo4j node."""
+    return _EVENT_ADAPTER.validate_python(convert_neo4j_record(node))
+
 
-def _convert_neo4j_record(record):
-    """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-    return data
+def _events_from_result(result) -> List[Event]:
+    """Build a list of Events from a Neo4j result in one batch validation."""
+    return _EVENT_LIST_ADAPTER.validate_python(
+        [convert_neo4j_record(record["e"]) for record in result]
+    )
+
+
+def _event_summaries_from_result(result) -> List[EventSummary]:
+    """Build a list of EventSummary models from projected rows."""
+    return _EVENT_SUMMARY_LIST_ADAPTER.validate_python(
+        [convert_neo4j_record(record["e"]) for record in result]
+    )
 
 
 def create_event(event: Event) -> Event:
     """Create a new Event node in Neo4j."""
     if not event.id:
-        event.id = str(uuid4())
-    
+        event.id = uuid4().hex
+
     now = datetime.now(UTC)
     event.created_at = now
-    
-    cypher_query = """
-    CREATE (e:Event {
-        id: $id,
-        name: $name,
-        date: $date,
-        type: $type,
-        location_id: $location_id,
-        created_at: $created_at
-    })
-    RETURN e
+
+    records = run_write_query(_Q_CREATE_EVENT, **event.model_dump())
+    created_event = _event_from_record(records[0]["e"])
+    logger.info(f"Created event: {event.name} with ID: {event.id}")
+    return created_event
+
+
+def create_events(events: List[Event]) -> List[Event]:
+    """Create multiple Event nodes in a single UNWIND batch write.
+
+    One query over the pooled driver replaces one session/round trip per
+    event, which is the dominant cost when loading events in bulk.
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, **event.model_dump())
-        created_event = _convert_neo4j_record(result.single()["e"])
-        logger.info(f"Created event: {event.name} with ID: {event.id}")
-        return Event(**created_event)
+    if not events:
+        return []
+
+    now = datetime.now(UTC)
+    rows = []
+    for event in events:
+        if not event.id:
+            event.id = uuid4().hex
+        event.created_at = now
+        rows.append(event.model_dump())
+
+    created = _events_from_result(run_write_query(_Q_CREATE_EVENTS, rows=rows))
+    logger.info(f"Created {len(created)} events in one batch")
+    return created
 
 
 def get_event(event_id: str) -> Optional[Event]:
     """Get an Event node by ID."""
-    cypher_query = """
-    MATCH (e:Event {id: $event_id})
-    RETURN e
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, event_id=event_id)
-        record = result.single()
-        if record:
-            event_data = _convert_neo4j_record(record["e"])
-            return Event(**event_data)
-        return None
+    records = run_read_query(_Q_GET_EVENT, event_id=event_id)
+    if records:
+        return _event_from_record(records[0]["e"])
+    return None
 
 
 def list_events() -> List[Event]:
     """List all Event nodes."""
-    cypher_query = """
-    MATCH (e:Event)
-    RETURN e
-    ORDER BY e.date DESC
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    return _events_from_result(run_read_query(_Q_LIST_EVENTS))
 
 
 def update_event(event_id: str, event_data: Dict[str, Any]) -> Optional[Event]:
     """Update an Event node."""
-    # Remove None values
-    update_data = {k: v for k, v in event_data.items() if v is not None}
-    
-    # Build dynamic SET clause
-    set_clause = ", ".join([f"e.{key} = ${key}" for key in update_data.keys()])
-    
-    cypher_query = f"""
-    MATCH (e:Event {{id: $event_id}})
-    SET {set_clause}
-    RETURN e
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, event_id=event_id, **update_data)
-        record = result.single()
-        if record:
-            event_data = _convert_neo4j_record(record["e"])
-            logger.info(f"Updated event: {event_id}")
-            return Event(**event_data)
-        return None
+    # Remove None values and anything outside the model's updatable fields,
+    # so a stray key cannot SET arbitrary properties
+    update_data = {
+        k: v for k, v in event_data.items()
+        if v is not None and k in _UPDATABLE_EVENT_FIELDS
+    }
+
+    records = run_write_query(_Q_UPDATE_EVENT, event_id=event_id, updates=update_data)
+    if records:
+        logger.info(f"Updated event: {event_id}")
+        return _event_from_record(records[0]["e"])
+    return None
 
 
 def delete_event(event_id: str) -> bool:
     """Delete an Event node and all its relationships."""
-    cypher_query = """
-    MATCH (e:Event {id: $event_id})
-    DETACH DELETE e
-    RETURN count(e) as deleted_count
+    # The driver's result summary already counts deletions, so there is
+    # no RETURN count(e) aggregation in the query
+    with get_session_context() as session:
+        counters = session.execute_write(
+            lambda tx: tx.run(_Q_DELETE_EVENT, event_id=event_id).consume().counters
+        )
+    if counters.nodes_deleted > 0:
+        logger.info(f"Deleted event: {event_id}")
+        return True
+    return False
+
+
+def delete_events(event_ids: List[str]) -> int:
+    """Delete many Event nodes in a single UNWIND batch write.
+
+    Returns the number of events actually deleted.
     """
-    
+    if not event_ids:
+        return 0
+
     with get_session_context() as session:
-        result = session.run(cypher_query, event_id=event_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Deleted event: {event_id}")
-            return True
-        return False
+        counters = session.execute_write(
+            lambda tx: tx.run(_Q_DELETE_EVENTS, event_ids=event_ids).consume().counters
+        )
+    logger.info(f"Deleted {counters.nodes_deleted} of {len(event_ids)} events in one batch")
+    return counters.nodes_deleted
 
 
 def search_events(search_term: str) -> List[Event]:
     """Search events by name."""
-    cypher_query = """
-    MATCH (e:Event)
-    WHERE e.name CONTAINS $search_term
-    RETURN e
-    ORDER BY e.date DESC, e.name
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, search_term=search_term)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    # Use the shared full-text index when available; the CONTAINS scan is
+    # only a fallback for databases without it
+    try:
+        records = run_read_query(
+            _Q_SEARCH_EVENTS_FULLTEXT,
+            index_name=FULLTEXT_INDEX_NAME,
+            search_term=escape_lucene_query(search_term)
+        )
+    except Exception as e:
+        logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+        records = run_read_query(_Q_SEARCH_EVENTS_FALLBACK, search_term=search_term)
+    return _events_from_result(records)
 
 
 def get_events_by_type(event_type: EventType) -> List[Event]:
     """Get all events of a specific type."""
-    cypher_query = """
-    MATCH (e:Event)
-    WHERE e.type = $event_type
-    RETURN e
-    ORDER BY e.date DESC
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, event_type=event_type)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    return _events_from_result(run_read_query(_Q_EVENTS_BY_TYPE, event_type=event_type))
 
 
 def get_events_by_date_range(start_date: datetime, end_date: datetime) -> List[Event]:
     """Get all events within a date range."""
-    cypher_query = """
-    MATCH (e:Event)
-    WHERE e.date >= $start_date AND e.date <= $end_date
-    RETURN e
-    ORDER BY e.date
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, start_date=start_date, end_date=end_date)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    return _events_from_result(
+        run_read_query(_Q_EVENTS_BY_DATE_RANGE, start_date=start_date, end_date=end_date)
+    )
 
 
 def link_person_to_event(person_id: str, event_id: str) -> bool:
     """Link a person to an event (person attended event)."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})
-    MATCH (e:Event {id: $event_id})
-    MERGE (p)-[:ATTENDED]->(e)
-    RETURN count(*) as link_count
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, event_id=event_id)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked person {person_id} to event {event_id}")
-            return True
-        return False
+    records = run_write_query(_Q_LINK_PERSON_TO_EVENT, person_id=person_id, event_id=event_id)
+    if records and records[0]["link_count"] > 0:
+        logger.info(f"Linked person {person_id} to event {event_id}")
+        return True
+    return False
 
 
 def unlink_person_from_event(person_id: str, event_id: str) -> bool:
     """Unlink a person from an event."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:ATTENDED]->(e:Event {id: $event_id})
-    DELETE r
-    RETURN count(r) as deleted_count
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, event_id=event_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Unlinked person {person_id} from event {event_id}")
-            return True
-        return False
+    records = run_write_query(_Q_UNLINK_PERSON_FROM_EVENT, person_id=person_id, event_id=event_id)
+    if records and records[0]["deleted_count"] > 0:
+        logger.info(f"Unlinked person {person_id} from event {event_id}")
+        return True
+    return False
 
 
 def get_people_at_event(event_id: str) -> List[Dict[str, Any]]:
     """Get all people who attended a specific event."""
-    cypher_query = """
-    MATCH (p:Person)-[:ATTENDED]->(e:Event {id: $event_id})
-    RETURN p
-    ORDER BY p.name
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, event_id=event_id)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(person_data)
-        return people
+    records = run_read_query(_Q_PEOPLE_AT_EVENT, event_id=event_id)
+    return [convert_neo4j_record(record["p"]) for record in records]
 
 
 def get_events_for_person(person_id: str) -> List[Event]:
     """Get all events a person attended."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[:ATTENDED]->(e:Event)
-    RETURN e
-    ORDER BY e.date DESC
+    return _events_from_result(run_read_query(_Q_EVENTS_FOR_PERSON, person_id=person_id))
+
+
+def get_events_for_people(person_ids: List[str]) -> Dict[str, List[Event]]:
+    """Get attended events for many people in one round-trip.
+
+    Callers that would otherwise loop get_events_for_person over N ids
+    issue a single UNWIND query instead; the index seek on Person.id is
+    shared across all ids.
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    if not person_ids:
+        return {}
+
+    records = run_read_query(_Q_EVENTS_FOR_PEOPLE, person_ids=person_ids)
+    events_by_person = {pid: [] for pid in person_ids}
+    for record in records:
+        events_by_person[record["pid"]] = _EVENT_LIST_ADAPTER.validate_python(
+            [convert_neo4j_record(node) for node in record["events"]]
+        )
+    return events_by_person
+
+
+def get_people_at_events(event_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Get attendees for many events in one round-trip."""
+    if not event_ids:
+        return {}
+
+    records = run_read_query(_Q_PEOPLE_AT_EVENTS, event_ids=event_ids)
+    people_by_event = {eid: [] for eid in event_ids}
+    for record in records:
+        people_by_event[record["eid"]] = [
+            convert_neo4j_record(node) for node in record["people"]
+        ]
+    return people_by_event
+
+
+def get_locations_for_events(event_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Get the venue for many events in one round-trip."""
+    if not event_ids:
+        return {}
+
+    records = run_read_query(_Q_LOCATIONS_FOR_EVENTS, event_ids=event_ids)
+    location_by_event = {eid: None for eid in event_ids}
+    for record in records:
+        location_by_event[record["eid"]] = convert_neo4j_record(record["l"])
+    return location_by_event
+
+
+def get_events_at_locations(location_ids: List[str]) -> Dict[str, List[Event]]:
+    """Get events held at many locations in one round-trip."""
+    if not location_ids:
+        return {}
+
+    records = run_read_query(_Q_EVENTS_AT_LOCATIONS, location_ids=location_ids)
+    events_by_location = {lid: [] for lid in location_ids}
+    for record in records:
+        events_by_location[record["lid"]] = _EVENT_LIST_ADAPTER.validate_python(
+            [convert_neo4j_record(node) for node in record["events"]]
+        )
+    return events_by_location
 
 
 def link_event_to_location(event_id: str, location_id: str) -> bool:
     """Link an event to a location (event was held at location)."""
-    cypher_query = """
-    MATCH (e:Event {id: $event_id})
-    MATCH (l:Location {id: $location_id})
-    MERGE (e)-[:HELD_AT]->(l)
-    RETURN count(*) as link_count
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, event_id=event_id, location_id=location_id)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked event {event_id} to location {location_id}")
-            return True
-        return False
+    records = run_write_query(_Q_LINK_EVENT_TO_LOCATION, event_id=event_id, location_id=location_id)
+    if records and records[0]["link_count"] > 0:
+        logger.info(f"Linked event {event_id} to location {location_id}")
+        return True
+    return False
 
 
 def get_location_for_event(event_id: str) -> Optional[Dict[str, Any]]:
     """Get the location where an event was held."""
-    cypher_query = """
-    MATCH (e:Event {id: $event_id})-[:HELD_AT]->(l:Location)
-    RETURN l
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, event_id=event_id)
-        record = result.single()
-        if record:
-            location_data = _convert_neo4j_record(record["l"])
-            return location_data
-        return None
+    records = run_read_query(_Q_LOCATION_FOR_EVENT, event_id=event_id)
+    if records:
+        return convert_neo4j_record(records[0]["l"])
+    return None
 
 
 def get_events_at_location(location_id: str) -> List[Event]:
     """Get all events held at a specific location."""
-    cypher_query = """
-    MATCH (e:Event)-[:HELD_AT]->(l:Location {id: $location_id})
-    RETURN e
-    ORDER BY e.date DESC
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, location_id=location_id)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    return _events_from_result(run_read_query(_Q_EVENTS_AT_LOCATION, location_id=location_id))
 
 
 def get_upcoming_events(limit: int = 10) -> List[Event]:
     """Get upcoming events (events with dates in the future)."""
-    now = datetime.now(UTC)
-    cypher_query = """
-    MATCH (e:Event)
-    WHERE e.date > $now
-    RETURN e
-    ORDER BY e.date
-    LIMIT $limit
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, now=now, limit=limit)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    return _events_from_result(run_read_query(_Q_UPCOMING_EVENTS, limit=limit))
+
+
+def get_upcoming_event_summaries(limit: int = 10) -> List[EventSummary]:
+    """Get upcoming events as compact summaries (id, name, date, type)."""
+    return _event_summaries_from_result(
+        run_read_query(_Q_UPCOMING_EVENT_SUMMARIES, limit=limit)
+    )
 
 
 def get_recent_events(limit: int = 10) -> List[Event]:
     """Get recent events (events with dates in the past)."""
-    now = datetime.now(UTC)
-    cypher_query = """
-    MATCH (e:Event)
-    WHERE e.date <= $now
-    RETURN e
-    ORDER BY e.date DESC
-    LIMIT $limit
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, now=now, limit=limit)
-        events = []
-        for record in result:
-            event_data = _convert_neo4j_record(record["e"])
-            events.append(Event(**event_data))
-        return events
+    return _events_from_result(run_read_query(_Q_RECENT_EVENTS, limit=limit))
+
+
+def get_recent_event_summaries(limit: int = 10) -> List[EventSummary]:
+    """Get recent events as compact summaries (id, name, date, type)."""
+    return _event_summaries_from_result(
+        run_read_query(_Q_RECENT_EVENT_SUMMARIES, limit=limit)
+    )
 
 
 def get_event_by_name(name: str) -> Optional[Event]:
     """Get an Event node by exact name match."""
-    cypher_query = """
-    MATCH (e:Event {name: $name})
-    RETURN e
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, name=name)
-        record = result.single()
-        if record:
-            event_data = _convert_neo4j_record(record["e"])
-            return Event(**event_data)
-        return None 
\ No newline at end of file
+    records = run_read_query(_Q_EVENT_BY_NAME, name=name)
+    if records:
+        return _event_from_record(records[0]["e"])
+    return None
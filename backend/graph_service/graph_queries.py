@@ -2,299 +2,439 @@
 Advanced graph queries for network analysis and visualization.
 """
 
-import sys
-from pathlib import Path
+import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime, UTC
 
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
 from neo4j import Session
+from shared.config import get_settings
 from shared.types import GraphNode, GraphEdge, GraphData
-from shared.utils import setup_logging
-from .connection import get_session_context
+from shared.utils import TTLCache, convert_neo4j_record, escape_lucene_query, setup_logging
+from .connection import get_async_session_context, get_session_context, run_read_query
 
 logger = setup_logging(__name__)
+settings = get_settings()
+
+# Short-lived cache for the whole-network aggregations below; entries are
+# recomputed at most once per TTL window, and the person/company/
+# interaction mutation paths call invalidate_network_caches() so writes
+# are visible on the next statistics/insights read.
+_network_cache = TTLCache(ttl_seconds=settings.GRAPH_STATS_CACHE_TTL_SECONDS)
 
 
-def _convert_neo4j_record(record):
-    """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-    return data
+def invalidate_network_caches() -> None:
+    """Drop cached network statistics and insights."""
+    _network_cache.invalidate()
 
 
 def get_full_network_graph() -> GraphData:
     """Get the complete network graph for visualization."""
-    cypher_query = """
+    # Two plain scans instead of the old OPTIONAL MATCH + DISTINCT: each
+    # node and relationship arrives exactly once, so neither the server
+    # nor the client has to dedupe anything.
+    node_query = """
     MATCH (n)
-    OPTIONAL MATCH (n)-[r]->(m)
-    RETURN DISTINCT n, labels(n) as labels, type(r) as relationship_type, m, labels(m) as target_labels
+    RETURN n, labels(n) as labels
     """
-    
+
+    edge_query = """
+    MATCH (a)-[r]->(b)
+    RETURN a.id as source, b.id as target, type(r) as type
+    """
+
+    def _collect(tx):
+        return list(tx.run(node_query)), list(tx.run(edge_query))
+
     with get_session_context() as session:
-        result = session.run(cypher_query)
-        
-        nodes = {}
-        edges = []
-        
-        for record in result:
-            # Process source node
-            source_node = record["n"]
-            if source_node:
-                source_id = source_node["id"]
-                if source_id not in nodes:
-                    node_labels = record["labels"]
-                    node_type = node_labels[0].lower() if node_labels else "unknown"
-                    nodes[source_id] = GraphNode(
-                        id=source_id,
-                        label=source_node.get("name", source_node.get("id", "Unknown")),
-                        type=node_type,
-                        properties=_convert_neo4j_record(source_node)
-                    )
-            
-            # Process target node and relationship
-            target_node = record["m"]
-            relationship_type = record["relationship_type"]
-            
-            if target_node and relationship_type:
-                target_id = target_node["id"]
-                if target_id not in nodes:
-                    target_labels = record["target_labels"]
-                    target_node_type = target_labels[0].lower() if target_labels else "unknown"
-                    nodes[target_id] = GraphNode(
-                        id=target_id,
-                        label=target_node.get("name", target_node.get("id", "Unknown")),
-                        type=target_node_type,
-                        properties=_convert_neo4j_record(target_node)
-                    )
-                
-                # Create edge
-                edge_id = f"{source_id}-{relationship_type}-{target_id}"
-                edges.append(GraphEdge(
-                    id=edge_id,
-                    source=source_id,
-                    target=target_id,
-                    type=relationship_type,
-                    properties={}
-                ))
-        
-        return GraphData(
-            nodes=list(nodes.values()),
-            edges=edges
+        node_records, edge_records = session.execute_read(_collect)
+
+    nodes = []
+    for record in node_records:
+        node = record["n"]
+        node_labels = record["labels"]
+        node_type = node_labels[0].lower() if node_labels else "unknown"
+        nodes.append(GraphNode.model_construct(
+            id=node["id"],
+            label=node.get("name", node.get("id", "Unknown")),
+            type=node_type,
+            properties=convert_neo4j_record(node)
+        ))
+
+    edges = [
+        GraphEdge.model_construct(
+            id=f"{record['source']}-{record['type']}-{record['target']}",
+            source=record["source"],
+            target=record["target"],
+            type=record["type"],
+            properties={}
         )
+        for record in edge_records
+    ]
+
+    return GraphData(nodes=nodes, edges=edges)
 
 
 def get_person_network_graph(person_id: str, depth: int = 2) -> GraphData:
     """Get a person's network graph up to a certain depth."""
-    cypher_query = """
-    MATCH path = (p:Person {id: $person_id})-[*1..$depth]-(connected)
-    RETURN DISTINCT connected, labels(connected) as labels, length(path) as distance
-    ORDER BY distance, connected.name
+    # Variable-length patterns cannot take a parameterized bound, so clamp
+    # the depth and inline it as a literal.
+    depth = max(1, min(int(depth), 5))
+    cypher_query = f"""
+    MATCH path = (p:Person {{id: $person_id}})-[*1..{depth}]-(connected)
+    UNWIND nodes(path) AS n
+    UNWIND relationships(path) AS r
+    WITH collect(DISTINCT n) AS path_nodes, collect(DISTINCT r) AS path_rels
+    RETURN [n IN path_nodes | {{node: n, labels: labels(n)}}] AS nodes,
+           [r IN path_rels | {{source: startNode(r).id, type: type(r), target: endNode(r).id}}] AS rels
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, depth=depth)
-        
-        nodes = {}
-        edges = []
-        
-        # Add the central person
-        central_person = get_person_details(person_id)
-        if central_person:
-            nodes[person_id] = GraphNode(
-                id=person_id,
-                label=central_person.get("name", "Unknown"),
-                type="person",
-                properties=central_person
-            )
-        
-        for record in result:
-            node = record["connected"]
+
+    nodes = {}
+    edges = []
+
+    # Add the central person so an unconnected person still renders
+    central_person = get_person_details(person_id)
+    if central_person:
+        nodes[person_id] = GraphNode(
+            id=person_id,
+            label=central_person.get("name", "Unknown"),
+            type="person",
+            properties=central_person
+        )
+
+    records = run_read_query(cypher_query, person_id=person_id)
+    if records:
+        record = records[0]
+        for entry in record["nodes"]:
+            node = entry["node"]
             node_id = node["id"]
-            node_labels = record["labels"]
+            if node_id in nodes:
+                continue
+            node_labels = entry["labels"]
             node_type = node_labels[0].lower() if node_labels else "unknown"
-            
-            if node_id not in nodes:
-                nodes[node_id] = GraphNode(
-                    id=node_id,
-                    label=node.get("name", node.get("id", "Unknown")),
-                    type=node_type,
-                    properties=_convert_neo4j_record(node)
-                )
-        
-        # Get relationships between nodes
-        relationship_query = """
-        MATCH (n)-[r]-(m)
-        WHERE n.id IN $node_ids AND m.id IN $node_ids
-        RETURN n.id as source, type(r) as type, m.id as target
-        """
-        
-        node_ids = list(nodes.keys())
-        if node_ids:
-            rel_result = session.run(relationship_query, node_ids=node_ids)
-            for rel_record in rel_result:
-                edge_id = f"{rel_record['source']}-{rel_record['type']}-{rel_record['target']}"
-                edges.append(GraphEdge(
-                    id=edge_id,
-                    source=rel_record["source"],
-                    target=rel_record["target"],
-                    type=rel_record["type"],
-                    properties={}
-                ))
-        
-        return GraphData(
-            nodes=list(nodes.values()),
-            edges=edges
-        )
+            nodes[node_id] = GraphNode.model_construct(
+                id=node_id,
+                label=node.get("name", node.get("id", "Unknown")),
+                type=node_type,
+                properties=convert_neo4j_record(node)
+            )
+
+        for rel in record["rels"]:
+            edge_id = f"{rel['source']}-{rel['type']}-{rel['target']}"
+            edges.append(GraphEdge.model_construct(
+                id=edge_id,
+                source=rel["source"],
+                target=rel["target"],
+                type=rel["type"],
+                properties={}
+            ))
+
+    return GraphData(
+        nodes=list(nodes.values()),
+        edges=edges
+    )
 
 
 def get_person_details(person_id: str) -> Optional[Dict[str, Any]]:
     """Get detailed information about a person including relationships."""
+    # Pattern comprehensions collect each branch independently, avoiding the
+    # OPTIONAL MATCH row multiplication + DISTINCT re-aggregation.
     cypher_query = """
     MATCH (p:Person {id: $person_id})
-    OPTIONAL MATCH (p)-[r:WORKS_AT]->(c:Company)
-    OPTIONAL MATCH (p)-[:LIVES_IN]->(l:Location)
-    OPTIONAL MATCH (p)-[:INTERESTED_IN]->(t:Topic)
-    RETURN p, collect(DISTINCT c) as companies, collect(DISTINCT l) as locations, collect(DISTINCT t) as topics
+    RETURN p,
+           [(p)-[:WORKS_AT]->(c:Company) | c] as companies,
+           [(p)-[:LIVES_IN]->(l:Location) | l] as locations,
+           [(p)-[:INTERESTED_IN]->(t:Topic) | t] as topics
     """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        record = result.single()
-        
-        if record:
-            person_data = _convert_neo4j_record(record["p"])
-            person_data["companies"] = [_convert_neo4j_record(c) for c in record["companies"] if c]
-            person_data["locations"] = [_convert_neo4j_record(l) for l in record["locations"] if l]
-            person_data["topics"] = [_convert_neo4j_record(t) for t in record["topics"] if t]
-            return person_data
-        return None
+    records = run_read_query(cypher_query, person_id=person_id)
+    if records:
+        record = records[0]
+        person_data = convert_neo4j_record(record["p"])
+        person_data["companies"] = [convert_neo4j_record(c) for c in record["companies"] if c]
+        person_data["locations"] = [convert_neo4j_record(l) for l in record["locations"] if l]
+        person_data["topics"] = [convert_neo4j_record(t) for t in record["topics"] if t]
+        return person_data
+    return None
 
 
 def get_network_statistics() -> Dict[str, Any]:
     """Get overall network statistics."""
+    cached = _network_cache.get("statistics")
+    if cached is not None:
+        return cached
+
     cypher_query = """
     MATCH (n)
     RETURN labels(n) as labels, count(n) as count
     """
     
+    rel_query = """
+    MATCH ()-[r]->()
+    RETURN type(r) as type, count(r) as count
+    """
+
+    def _collect(tx):
+        # Both counts in one managed transaction: a single commit, and a
+        # consistent snapshot of the graph
+        return list(tx.run(cypher_query)), list(tx.run(rel_query))
+
     with get_session_context() as session:
-        result = session.run(cypher_query)
-        
-        stats = {
-            "total_nodes": 0,
-            "node_types": {},
-            "total_relationships": 0,
-            "relationship_types": {}
-        }
-        
-        for record in result:
-            labels = record["labels"]
-            count = record["count"]
-            node_type = labels[0].lower() if labels else "unknown"
-            
-            stats["total_nodes"] += count
-            stats["node_types"][node_type] = count
-        
-        # Get relationship statistics
-        rel_query = """
-        MATCH ()-[r]->()
-        RETURN type(r) as type, count(r) as count
-        """
-        
-        rel_result = session.run(rel_query)
-        for record in rel_result:
-            rel_type = record["type"]
-            count = record["count"]
-            
-            stats["total_relationships"] += count
-            stats["relationship_types"][rel_type] = count
-        
-        return stats
+        node_records, rel_records = session.execute_read(_collect)
+
+    stats = {
+        "total_nodes": 0,
+        "node_types": {},
+        "total_relationships": 0,
+        "relationship_types": {}
+    }
+
+    for record in node_records:
+        labels = record["labels"]
+        count = record["count"]
+        node_type = labels[0].lower() if labels else "unknown"
+
+        stats["total_nodes"] += count
+        stats["node_types"][node_type] = count
+
+    for record in rel_records:
+        rel_type = record["type"]
+        count = record["count"]
+
+        stats["total_relationships"] += count
+        stats["relationship_types"][rel_type] = count
+
+    _network_cache.set("statistics", stats)
+    return stats
 
 
 def get_network_insights() -> Dict[str, Any]:
     """Get insights about the network."""
-    insights = {}
-    
-    # Most connected people
+    cached = _network_cache.get("insights")
+    if cached is not None:
+        return cached
+
+    # People with most connections
+    connected_query = """
+    MATCH (p:Person)-[r]-(other)
+    RETURN p, count(r) as connection_count
+    ORDER BY connection_count DESC
+    LIMIT 10
+    """
+
+    # Companies with most employees
+    company_query = """
+    MATCH (p:Person)-[r:WORKS_AT]->(c:Company)
+    WHERE r.end_date IS NULL
+    RETURN c, count(p) as employee_count
+    ORDER BY employee_count DESC
+    LIMIT 10
+    """
+
+    # Most popular topics
+    topic_query = """
+    MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic)
+    RETURN t, count(p) as interest_count
+    ORDER BY interest_count DESC
+    LIMIT 10
+    """
+
+    # Recent activity
+    recent_query = """
+    MATCH (i:Interaction)
+    WHERE i.date >= datetime() - duration({days: 30})
+    RETURN count(i) as recent_interactions
+    """
+
+    def _collect(tx):
+        # One managed transaction for all four reads: one commit, retried
+        # as a unit on transient errors
+        return (
+            list(tx.run(connected_query)),
+            list(tx.run(company_query)),
+            list(tx.run(topic_query)),
+            list(tx.run(recent_query))
+        )
+
     with get_session_context() as session:
-        # People with most connections
-        connected_query = """
-        MATCH (p:Person)-[r]-(other)
-        RETURN p, count(r) as connection_count
-        ORDER BY connection_count DESC
-        LIMIT 10
-        """
-        
-        result = session.run(connected_query)
-        most_connected = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            most_connected.append({
-                "person": person_data,
+        connected, companies, topics, recent = session.execute_read(_collect)
+
+    insights = {
+        "most_connected_people": [
+            {
+                "person": convert_neo4j_record(record["p"]),
                 "connection_count": record["connection_count"]
-            })
-        insights["most_connected_people"] = most_connected
-        
-        # Companies with most employees
-        company_query = """
-        MATCH (p:Person)-[r:WORKS_AT]->(c:Company)
-        WHERE r.end_date IS NULL
-        RETURN c, count(p) as employee_count
-        ORDER BY employee_count DESC
-        LIMIT 10
-        """
-        
-        result = session.run(company_query)
-        top_companies = []
-        for record in result:
-            company_data = _convert_neo4j_record(record["c"])
-            top_companies.append({
-                "company": company_data,
+            }
+            for record in connected
+        ],
+        "top_companies": [
+            {
+                "company": convert_neo4j_record(record["c"]),
                 "employee_count": record["employee_count"]
-            })
-        insights["top_companies"] = top_companies
-        
-        # Most popular topics
-        topic_query = """
-        MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic)
-        RETURN t, count(p) as interest_count
-        ORDER BY interest_count DESC
-        LIMIT 10
-        """
-        
-        result = session.run(topic_query)
-        popular_topics = []
-        for record in result:
-            topic_data = _convert_neo4j_record(record["t"])
-            popular_topics.append({
-                "topic": topic_data,
+            }
+            for record in companies
+        ],
+        "popular_topics": [
+            {
+                "topic": convert_neo4j_record(record["t"]),
                 "interest_count": record["interest_count"]
-            })
-        insights["popular_topics"] = popular_topics
-        
-        # Recent activity
-        recent_query = """
-        MATCH (i:Interaction)
-        WHERE i.date >= datetime() - duration({days: 30})
-        RETURN count(i) as recent_interactions
-        """
-        
-        result = session.run(recent_query)
-        record = result.single()
-        insights["recent_interactions"] = record["recent_interactions"] if record else 0
-    
+            }
+            for record in topics
+        ],
+        "recent_interactions": recent[0]["recent_interactions"] if recent else 0
+    }
+
+    _network_cache.set("insights", insights)
+    return insights
+
+
+async def get_network_insights_async() -> Dict[str, Any]:
+    """Get insights about the network, overlapping the four queries.
+
+    The queries are independent, so issuing them concurrently over the
+    async driver bounds wall time by the slowest one rather than their
+    sum.
+    """
+    cached = _network_cache.get("insights")
+    if cached is not None:
+        return cached
+
+    connected_query = """
+    MATCH (p:Person)-[r]-(other)
+    RETURN p, count(r) as connection_count
+    ORDER BY connection_count DESC
+    LIMIT 10
+    """
+
+    company_query = """
+    MATCH (p:Person)-[r:WORKS_AT]->(c:Company)
+    WHERE r.end_date IS NULL
+    RETURN c, count(p) as employee_count
+    ORDER BY employee_count DESC
+    LIMIT 10
+    """
+
+    topic_query = """
+    MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic)
+    RETURN t, count(p) as interest_count
+    ORDER BY interest_count DESC
+    LIMIT 10
+    """
+
+    recent_query = """
+    MATCH (i:Interaction)
+    WHERE i.date >= datetime() - duration({days: 30})
+    RETURN count(i) as recent_interactions
+    """
+
+    async def run_query(cypher_query: str) -> List[Any]:
+        # One session per query: sessions are not safe for concurrent use
+        async with get_async_session_context() as session:
+            result = await session.run(cypher_query)
+            return [record async for record in result]
+
+    connected, companies, topics, recent = await asyncio.gather(
+        run_query(connected_query),
+        run_query(company_query),
+        run_query(topic_query),
+        run_query(recent_query)
+    )
+
+    insights = {
+        "most_connected_people": [
+            {
+                "person": convert_neo4j_record(record["p"]),
+                "connection_count": record["connection_count"]
+            }
+            for record in connected
+        ],
+        "top_companies": [
+            {
+                "company": convert_neo4j_record(record["c"]),
+                "employee_count": record["employee_count"]
+            }
+            for record in companies
+        ],
+        "popular_topics": [
+            {
+                "topic": convert_neo4j_record(record["t"]),
+                "interest_count": record["interest_count"]
+            }
+            for record in topics
+        ],
+        "recent_interactions": recent[0]["recent_interactions"] if recent else 0
+    }
+
+    _network_cache.set("insights", insights)
     return insights
 
 
+# Lucene full-text index shared by every searchable label; created at
+# startup by ensure_fulltext_indexes()
+FULLTEXT_INDEX_NAME = "entitySearch"
+
+# Per-label indexes used by the person, interaction and location search paths
+PERSON_FULLTEXT_INDEX_NAME = "person_search"
+TOPIC_FULLTEXT_INDEX_NAME = "topic_name_fts"
+INTERACTION_FULLTEXT_INDEX_NAME = "interaction_summary_fts"
+LOCATION_FULLTEXT_INDEX_NAME = "location_place_fts"
+
+_CREATE_FULLTEXT_INDEXES = [
+    """
+    CREATE FULLTEXT INDEX entitySearch IF NOT EXISTS
+    FOR (n:Person|Company|Topic|Location|Event)
+    ON EACH [n.name, n.email, n.industry]
+    """,
+    """
+    CREATE FULLTEXT INDEX person_search IF NOT EXISTS
+    FOR (p:Person)
+    ON EACH [p.name, p.email]
+    """,
+    """
+    CREATE FULLTEXT INDEX topic_name_fts IF NOT EXISTS
+    FOR (t:Topic)
+    ON EACH [t.name]
+    """,
+    """
+    CREATE FULLTEXT INDEX interaction_summary_fts IF NOT EXISTS
+    FOR (i:Interaction)
+    ON EACH [i.summary]
+    """,
+    """
+    CREATE FULLTEXT INDEX location_place_fts IF NOT EXISTS
+    FOR (l:Location)
+    ON EACH [l.city, l.state, l.country]
+    """,
+]
+
+
+def ensure_fulltext_indexes() -> None:
+    """Create the full-text search indexes if they do not exist.
+
+    Best-effort: the search functions fall back to CONTAINS scans when
+    an index is unavailable.
+    """
+    try:
+        with get_session_context() as session:
+            for statement in _CREATE_FULLTEXT_INDEXES:
+                session.run(statement)
+        logger.info(f"Ensured {len(_CREATE_FULLTEXT_INDEXES)} full-text indexes")
+    except Exception as e:
+        logger.warning(f"Could not create full-text indexes: {e}")
+
+
 def search_network(query: str, limit: int = 20) -> Dict[str, Any]:
     """Search across the entire network."""
-    cypher_query = """
+    # Lucene lookup instead of a CONTAINS scan over every node; results
+    # come back ranked by relevance
+    fulltext_query = """
+    CALL db.index.fulltext.queryNodes($index_name, $query)
+    YIELD node, score
+    RETURN node as n, labels(node) as labels
+    ORDER BY score DESC
+    LIMIT $limit
+    """
+
+    fallback_query = """
     MATCH (n)
     WHERE n.name CONTAINS $query OR n.email CONTAINS $query OR n.industry CONTAINS $query
     RETURN n, labels(n) as labels
@@ -302,125 +442,173 @@ def search_network(query: str, limit: int = 20) -> Dict[str, Any]:
     LIMIT $limit
     """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, query=query, limit=limit)
-        
-        results = {
-            "people": [],
-            "companies": [],
-            "topics": [],
-            "locations": [],
-            "events": []
-        }
-        
-        for record in result:
-            node = record["n"]
-            labels = record["labels"]
-            node_type = labels[0].lower() if labels else "unknown"
-            
-            node_data = _convert_neo4j_record(node)
-            
-            if node_type == "person":
-                results["people"].append(node_data)
-            elif node_type == "company":
-                results["companies"].append(node_data)
-            elif node_type == "topic":
-                results["topics"].append(node_data)
-            elif node_type == "location":
-                results["locations"].append(node_data)
-            elif node_type == "event":
-                results["events"].append(node_data)
-        
-        return results
+    try:
+        records = run_read_query(
+            fulltext_query,
+            index_name=FULLTEXT_INDEX_NAME,
+            query=escape_lucene_query(query),
+            limit=limit
+        )
+    except Exception as e:
+        logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+        records = run_read_query(fallback_query, query=query, limit=limit)
+
+    results = {
+        "people": [],
+        "companies": [],
+        "topics": [],
+        "locations": [],
+        "events": []
+    }
+
+    for record in records:
+        node = record["n"]
+        labels = record["labels"]
+        node_type = labels[0].lower() if labels else "unknown"
+
+        node_data = convert_neo4j_record(node)
+
+        if node_type == "person":
+            results["people"].append(node_data)
+        elif node_type == "company":
+            results["companies"].append(node_data)
+        elif node_type == "topic":
+            results["topics"].append(node_data)
+        elif node_type == "location":
+            results["locations"].append(node_data)
+        elif node_type == "event":
+            results["events"].append(node_data)
+
+    return results
 
 
 def get_network_paths(from_person_id: str, to_person_id: str, max_length: int = 3) -> List[Dict[str, Any]]:
     """Find paths between two people in the network."""
-    cypher_query = """
-    MATCH path = (p1:Person {id: $from_person_id})-[*1..$max_length]-(p2:Person {id: $to_person_id})
-    RETURN path, length(path) as path_length
+    # allShortestPaths prunes the search via BFS instead of enumerating
+    # every path up to max_length, which is exponential in node degree.
+    # Variable-length bounds cannot be parameterized, so clamp and inline.
+    max_length = max(1, min(int(max_length), 5))
+    cypher_query = f"""
+    MATCH path = allShortestPaths(
+        (p1:Person {{id: $from_person_id}})-[*..{max_length}]-(p2:Person {{id: $to_person_id}})
+    )
+    RETURN [n IN nodes(path) | {{id: n.id, name: n.name, labels: labels(n)}}] as nodes,
+           [r IN relationships(path) | {{type: type(r), source: startNode(r).id, target: endNode(r).id}}] as rels,
+           length(path) as path_length
     ORDER BY path_length
     LIMIT 10
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, from_person_id=from_person_id, to_person_id=to_person_id, max_length=max_length)
-        
-        paths = []
+
+    records = run_read_query(cypher_query, from_person_id=from_person_id, to_person_id=to_person_id)
+
+    paths = []
+    for record in records:
+        # Only id/name/type are projected per node; the full property
+        # maps never cross the wire
+        path_nodes = [
+            {
+                "id": node["id"],
+                "type": node["labels"][0].lower() if node["labels"] else "unknown",
+                "data": {"id": node["id"], "name": node["name"]}
+            }
+            for node in record["nodes"]
+        ]
+
+        paths.append({
+            "length": record["path_length"],
+            "nodes": path_nodes,
+            "relationships": record["rels"]
+        })
+
+    return paths
+
+
+# Name of the throwaway GDS projection used for community detection
+_WCC_GRAPH_NAME = "network-journal-person-wcc"
+
+
+def _gds_clusters(session) -> List[Dict[str, Any]]:
+    """Run weakly-connected components server-side via the GDS library."""
+    # Drop any stale projection, then project the Person/KNOWS subgraph
+    session.run(
+        "CALL gds.graph.drop($name, false) YIELD graphName RETURN graphName",
+        name=_WCC_GRAPH_NAME
+    ).consume()
+    session.run(
+        """
+        MATCH (source:Person)
+        OPTIONAL MATCH (source)-[:KNOWS]-(target:Person)
+        WITH gds.graph.project($name, source, target) AS g
+        RETURN g.nodeCount AS node_count
+        """,
+        name=_WCC_GRAPH_NAME
+    ).consume()
+
+    try:
+        result = session.run(
+            """
+            CALL gds.wcc.stream($name)
+            YIELD nodeId, componentId
+            WITH componentId, collect(gds.util.asNode(nodeId)) AS members
+            RETURN componentId, members
+            ORDER BY size(members) DESC
+            """,
+            name=_WCC_GRAPH_NAME
+        )
+
+        clusters = []
         for record in result:
-            path = record["path"]
-            path_length = record["path_length"]
-            
-            path_nodes = []
-            path_relationships = []
-            
-            for i, node in enumerate(path.nodes):
-                node_data = _convert_neo4j_record(node)
-                path_nodes.append({
-                    "id": node["id"],
-                    "type": list(node.labels)[0].lower(),
-                    "data": node_data
-                })
-                
-                if i < len(path.relationships):
-                    rel = path.relationships[i]
-                    path_relationships.append({
-                        "type": rel.type,
-                        "source": rel.start_node["id"],
-                        "target": rel.end_node["id"]
-                    })
-            
-            paths.append({
-                "length": path_length,
-                "nodes": path_nodes,
-                "relationships": path_relationships
+            members = [m for m in record["members"] if m]
+            clusters.append({
+                "id": f"cluster_{len(clusters)}",
+                "size": len(members),
+                "nodes": [convert_neo4j_record(m) for m in members]
             })
-        
-        return paths
+        return clusters
+    finally:
+        session.run(
+            "CALL gds.graph.drop($name, false) YIELD graphName RETURN graphName",
+            name=_WCC_GRAPH_NAME
+        ).consume()
 
 
-def get_network_clusters() -> List[Dict[str, Any]]:
-    """Identify clusters or communities in the network."""
-    # This is a simplified community detection using connected components
-    cypher_query = """
-    CALL gds.wcc.stream('person-graph')
-    YIELD nodeId, componentId
-    RETURN componentId, collect(nodeId) as nodes
-    ORDER BY size(collect(nodeId)) DESC
-    """
-    
-    # For now, return a simplified version using connected components
+def _cypher_clusters(session) -> List[Dict[str, Any]]:
+    """Connected-components fallback for servers without the GDS library."""
+    # Labelling each person with the minimum internal id reachable over
+    # KNOWS (including their own — the variable-length match excludes p
+    # itself) gives a stable component id, so grouping happens
+    # server-side and each component comes back as exactly one row.
     simple_query = """
     MATCH (p:Person)
-    WITH p
-    OPTIONAL MATCH (p)-[:KNOWS*]-(connected:Person)
-    RETURN p, collect(DISTINCT connected) as connected_group
+    OPTIONAL MATCH (p)-[:KNOWS*]-(q:Person)
+    WITH p, min(coalesce(id(q), id(p))) as minq
+    WITH p, CASE WHEN minq < id(p) THEN minq ELSE id(p) END as comp
+    RETURN comp, collect(p) as members
+    ORDER BY size(members) DESC
     """
-    
+
+    result = session.run(simple_query)
+
+    clusters = []
+    for record in result:
+        members = record["members"]
+        clusters.append({
+            "id": f"cluster_{len(clusters)}",
+            "size": len(members),
+            "nodes": [convert_neo4j_record(n) for n in members]
+        })
+
+    return clusters
+
+
+def get_network_clusters() -> List[Dict[str, Any]]:
+    """Identify clusters or communities in the network."""
     with get_session_context() as session:
-        result = session.run(simple_query)
-        
-        clusters = []
-        processed = set()
-        
-        for record in result:
-            person = record["p"]
-            connected_group = record["connected_group"]
-            
-            if person["id"] not in processed:
-                cluster_nodes = [person] + [p for p in connected_group if p]
-                cluster_ids = [n["id"] for n in cluster_nodes]
-                
-                # Mark all nodes in this cluster as processed
-                processed.update(cluster_ids)
-                
-                clusters.append({
-                    "id": f"cluster_{len(clusters)}",
-                    "size": len(cluster_nodes),
-                    "nodes": [_convert_neo4j_record(n) for n in cluster_nodes]
-                })
-        
-        return clusters
+        try:
+            return _gds_clusters(session)
+        except Exception as e:
+            logger.warning(f"GDS WCC unavailable, using Cypher connected components: {e}")
+            return _cypher_clusters(session)
 
 
 def get_network_recommendations(person_id: str, limit: int = 5) -> List[Dict[str, Any]]:
@@ -435,16 +623,15 @@ def get_network_recommendations(person_id: str, limit: int = 5) -> List[Dict[str
     LIMIT $limit
     """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, limit=limit)
-        
-        recommendations = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["recommended"])
-            recommendations.append({
-                "person": person_data,
-                "mutual_connections": record["mutual_connections"],
-                "reason": f"Connected through {record['mutual_connections']} mutual friends"
-            })
-        
-        return recommendations 
\ No newline at end of file
+    records = run_read_query(cypher_query, person_id=person_id, limit=limit)
+
+    recommendations = []
+    for record in records:
+        person_data = convert_neo4j_record(record["recommended"])
+        recommendations.append({
+            "person": person_data,
+            "mutual_connections": record["mutual_connections"],
+            "reason": f"Connected through {record['mutual_connections']} mutual friends"
+        })
+
+    return recommendations 
\ No newline at end of file
@@ -2,198 +2,358 @@
 Neo4j operations for Interaction nodes.
 """
 
-import sys
-from pathlib import Path
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime, UTC
 from uuid import uuid4
 
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
-from neo4j import Session
+from pydantic import TypeAdapter
 from shared.types import Interaction, InteractionChannel, DataSource
-from shared.utils import setup_logging
-from .connection import get_session_context
+from shared.utils import TTLCache, chunk_list, convert_neo4j_record, escape_lucene_query, setup_logging
+from .connection import (
+    get_async_session_context,
+    get_session_context,
+    run_read_query,
+    run_write_query,
+)
+from .graph_queries import INTERACTION_FULLTEXT_INDEX_NAME, invalidate_network_caches
 
 logger = setup_logging(__name__)
 
+# Interactions are read far more often than they change; memoize
+# get_interaction per id and drop entries on update/delete.
+_interaction_cache = TTLCache(ttl_seconds=60, maxsize=10_000)
+
+# Pre-compiled validator; batch validation runs in pydantic-core instead
+# of constructing each Interaction through Python-level __init__.
+_INTERACTION_LIST_ADAPTER = TypeAdapter(List[Interaction])
+
+# Fields callers are allowed to change via update_interaction
+_UPDATABLE_INTERACTION_FIELDS = frozenset(Interaction.model_fields) - {"id", "created_at"}
+
+
+# Cypher hoisted to module level: the strings are built once at import time,
+# and identical string identity keeps Neo4j's plan cache hitting.
+_Q_CREATE_INTERACTION = """
+CREATE (i:Interaction {
+    id: $id,
+    date: $date,
+    channel: $channel,
+    summary: $summary,
+    created_at: $created_at,
+    data_source: $data_source
+})
+RETURN i
+"""
+
+_Q_CREATE_INTERACTIONS_BULK = """
+UNWIND $rows AS row
+CREATE (i:Interaction)
+SET i = row
+RETURN i
+"""
+
+# USING INDEX pins both sides of the double seek to the id indexes that
+# ensure_schema() guarantees, so the planner never degrades one side to
+# a label scan.
+_Q_LINK_INTERACTIONS_TO_PEOPLE_BULK = """
+UNWIND $pairs AS pair
+MATCH (p:Person {id: pair.person_id})
+USING INDEX p:Person(id)
+MATCH (i:Interaction {id: pair.interaction_id})
+USING INDEX i:Interaction(id)
+MERGE (p)-[:PARTICIPATED_IN]->(i)
+RETURN count(*) as link_count
+"""
+
+_Q_LIST_INTERACTIONS = """
+MATCH (i:Interaction)
+RETURN i
+ORDER BY i.date DESC
+"""
+
+_Q_LIST_INTERACTIONS_PAGE = """
+MATCH (i:Interaction)
+RETURN i
+ORDER BY i.date DESC
+SKIP $skip LIMIT $limit
+"""
+
+_Q_LIST_INTERACTIONS_SKIP = """
+MATCH (i:Interaction)
+RETURN i
+ORDER BY i.date DESC
+SKIP $skip
+"""
+
+_Q_GET_INTERACTION = """
+MATCH (i:Interaction {id: $interaction_id})
+RETURN i
+"""
+
+_Q_UPDATE_INTERACTION = """
+MATCH (i:Interaction {id: $interaction_id})
+SET i += $updates
+RETURN i
+"""
+
+_Q_DELETE_INTERACTION = """
+MATCH (i:Interaction {id: $interaction_id})
+DETACH DELETE i
+"""
+
+_Q_LINK_INTERACTION_TO_PERSON = """
+MATCH (i:Interaction {id: $interaction_id})
+USING INDEX i:Interaction(id)
+MATCH (p:Person {id: $person_id})
+USING INDEX p:Person(id)
+CREATE (p)-[:PARTICIPATED_IN]->(i)
+"""
+
+_Q_GET_INTERACTIONS_FOR_PERSON = """
+MATCH (p:Person {id: $person_id})-[:PARTICIPATED_IN]->(i:Interaction)
+RETURN i
+ORDER BY i.date DESC
+"""
+
+_Q_GET_PEOPLE_FOR_INTERACTION = """
+MATCH (p:Person)-[:PARTICIPATED_IN]->(i:Interaction {id: $interaction_id})
+RETURN p
+ORDER BY p.name
+"""
+
+_Q_SEARCH_INTERACTIONS_FULLTEXT = """
+CALL db.index.fulltext.queryNodes($index_name, $query)
+YIELD node
+RETURN node as i
+ORDER BY node.date DESC
+"""
+
+_Q_SEARCH_INTERACTIONS_FALLBACK = """
+MATCH (i:Interaction)
+WHERE i.summary CONTAINS $query
+RETURN i
+ORDER BY i.date DESC
+"""
+
 
-def _convert_neo4j_record(record):
-    """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-    return data
+def _interaction_from_record_fast(node) -> Interaction:
+    """Build an Interaction without re-validation.
+
+    Rows coming back from Neo4j were validated when written, so list
+    endpoints skip Pydantic validators via model_construct; missing
+    optional properties fall back to the field defaults.
+    """
+    return Interaction.model_construct(**convert_neo4j_record(node))
 
 
 def create_interaction(interaction: Interaction) -> Interaction:
     """Create a new Interaction node in Neo4j."""
     if not interaction.id:
-        interaction.id = str(uuid4())
+        interaction.id = uuid4().hex
     
     now = datetime.now(UTC)
     interaction.created_at = now
     
-    cypher_query = """
-    CREATE (i:Interaction {
-        id: $id,
-        date: $date,
-        channel: $channel,
-        summary: $summary,
-        created_at: $created_at,
-        data_source: $data_source
-    })
-    RETURN i
+    records = run_write_query(_Q_CREATE_INTERACTION, **interaction.model_dump())
+    invalidate_network_caches()
+    created_interaction = convert_neo4j_record(records[0]["i"])
+    logger.info(f"Created interaction: {interaction.id}")
+    return Interaction(**created_interaction)
+
+
+def create_interactions_bulk(interactions: List[Interaction]) -> List[Interaction]:
+    """Create multiple Interaction nodes with batched UNWIND writes.
+
+    Rows are sent in chunks of 1,000, so N single-row round-trips
+    collapse into ceil(N/1000) queries.
     """
-    
+    if not interactions:
+        return []
+
+    now = datetime.now(UTC)
+    rows = []
+    for interaction in interactions:
+        if not interaction.id:
+            interaction.id = uuid4().hex
+        interaction.created_at = now
+        rows.append(interaction.model_dump())
+
+
+    raw = []
     with get_session_context() as session:
-        result = session.run(cypher_query, **interaction.model_dump())
-        created_interaction = _convert_neo4j_record(result.single()["i"])
-        logger.info(f"Created interaction: {interaction.id}")
-        return Interaction(**created_interaction)
+        for chunk in chunk_list(rows, 1000):
+            records = session.execute_write(
+                lambda tx: list(tx.run(_Q_CREATE_INTERACTIONS_BULK, rows=chunk))
+            )
+            raw.extend(convert_neo4j_record(record["i"]) for record in records)
+    created = _INTERACTION_LIST_ADAPTER.validate_python(raw)
+    if created:
+        invalidate_network_caches()
+    logger.info(f"Created {len(created)} interactions in bulk")
+    return created
 
 
-def get_interaction(interaction_id: str) -> Optional[Interaction]:
-    """Get an Interaction node by ID."""
-    cypher_query = """
-    MATCH (i:Interaction {id: $interaction_id})
-    RETURN i
+def link_interactions_to_people_bulk(pairs: List[Dict[str, str]]) -> int:
+    """Link many interactions to people in one UNWIND write.
+
+    Each pair is {"person_id": ..., "interaction_id": ...}. Returns the
+    number of relationships created.
     """
-    
+    if not pairs:
+        return 0
+
+
+    link_count = 0
     with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id)
-        record = result.single()
-        if record:
-            interaction_data = _convert_neo4j_record(record["i"])
-            return Interaction(**interaction_data)
-        return None
-
-
-def list_interactions() -> List[Interaction]:
-    """List all Interaction nodes."""
-    cypher_query = """
-    MATCH (i:Interaction)
-    RETURN i
-    ORDER BY i.date DESC
+        for chunk in chunk_list(pairs, 1000):
+            records = session.execute_write(
+                lambda tx: list(tx.run(_Q_LINK_INTERACTIONS_TO_PEOPLE_BULK, pairs=chunk))
+            )
+            link_count += records[0]["link_count"]
+    if link_count:
+        invalidate_network_caches()
+    logger.info(f"Linked {link_count} interaction/person pairs in bulk")
+    return link_count
+
+
+async def link_interactions_to_people_async(
+    pairs: List[Dict[str, str]], max_concurrency: int = 8
+) -> int:
+    """Link many interaction/person pairs concurrently with the async driver.
+
+    Chunks go through the same UNWIND write as the sync bulk helper, but
+    up to max_concurrency chunks are in flight at once (bounded by a
+    semaphore so we never outrun the connection pool). Returns the
+    number of relationships created.
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query)
-        interactions = []
-        for record in result:
-            interaction_data = _convert_neo4j_record(record["i"])
-            interactions.append(Interaction(**interaction_data))
-        return interactions
+    if not pairs:
+        return 0
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def link_chunk(chunk):
+        async def run_chunk(tx):
+            result = await tx.run(_Q_LINK_INTERACTIONS_TO_PEOPLE_BULK, pairs=chunk)
+            record = await result.single()
+            return record["link_count"]
+
+        async with semaphore:
+            async with get_async_session_context() as session:
+                return await session.execute_write(run_chunk)
+
+    counts = await asyncio.gather(*[link_chunk(chunk) for chunk in chunk_list(pairs, 1000)])
+    link_count = sum(counts)
+    if link_count:
+        invalidate_network_caches()
+    logger.info(f"Linked {link_count} interaction/person pairs async in bulk")
+    return link_count
+
+
+def get_interaction(interaction_id: str) -> Optional[Interaction]:
+    """Get an Interaction node by ID."""
+    cached = _interaction_cache.get(interaction_id)
+    if cached is not None:
+        return cached
+
+    records = run_read_query(_Q_GET_INTERACTION, interaction_id=interaction_id)
+    if records:
+        interaction = Interaction(**convert_neo4j_record(records[0]["i"]))
+        _interaction_cache.set(interaction_id, interaction)
+        return interaction
+    return None
+
+
+def list_interactions(skip: int = 0, limit: Optional[int] = None) -> List[Interaction]:
+    """List Interaction nodes, optionally paginated server-side.
+
+    SKIP/LIMIT run in Neo4j so only the requested page crosses the
+    wire; the default (skip=0, limit=None) keeps the full listing for
+    callers that build whole-graph views.
+    """
+    if limit is not None:
+        cypher_query = _Q_LIST_INTERACTIONS_PAGE
+    elif skip:
+        cypher_query = _Q_LIST_INTERACTIONS_SKIP
+    else:
+        cypher_query = _Q_LIST_INTERACTIONS
+
+    records = run_read_query(cypher_query, skip=skip, limit=limit)
+    return [_interaction_from_record_fast(record["i"]) for record in records]
 
 
 def update_interaction(interaction_id: str, interaction_data: Dict[str, Any]) -> Optional[Interaction]:
     """Update an Interaction node."""
-    # Remove None values
-    update_data = {k: v for k, v in interaction_data.items() if v is not None}
-    
-    # Build dynamic SET clause
-    set_clause = ", ".join([f"i.{key} = ${key}" for key in update_data.keys()])
-    
-    cypher_query = f"""
-    MATCH (i:Interaction {{id: $interaction_id}})
-    SET {set_clause}
-    RETURN i
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id, **update_data)
-        record = result.single()
-        if record:
-            interaction_data = _convert_neo4j_record(record["i"])
-            logger.info(f"Updated interaction: {interaction_id}")
-            return Interaction(**interaction_data)
-        return None
+    # Remove None values and anything outside the model's updatable fields,
+    # so a stray key cannot SET arbitrary properties
+    update_data = {
+        k: v for k, v in interaction_data.items()
+        if v is not None and k in _UPDATABLE_INTERACTION_FIELDS
+    }
+
+    records = run_write_query(_Q_UPDATE_INTERACTION, interaction_id=interaction_id, updates=update_data)
+    _interaction_cache.invalidate(interaction_id)
+    if records:
+        logger.info(f"Updated interaction: {interaction_id}")
+        return Interaction(**convert_neo4j_record(records[0]["i"]))
+    return None
 
 
 def delete_interaction(interaction_id: str) -> bool:
     """Delete an Interaction node and all its relationships."""
-    cypher_query = """
-    MATCH (i:Interaction {id: $interaction_id})
-    DETACH DELETE i
-    RETURN count(i) as deleted_count
-    """
-    
+    # The driver's result summary already counts deletions, so there is
+    # no RETURN count(i) aggregation in the query
     with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Deleted interaction: {interaction_id}")
-            return True
-        return False
+        counters = session.execute_write(
+            lambda tx: tx.run(_Q_DELETE_INTERACTION, interaction_id=interaction_id).consume().counters
+        )
+    _interaction_cache.invalidate(interaction_id)
+    invalidate_network_caches()
+    if counters.nodes_deleted > 0:
+        logger.info(f"Deleted interaction: {interaction_id}")
+        return True
+    return False
 
 
 def link_interaction_to_person(interaction_id: str, person_id: str) -> bool:
     """Link an interaction to a person."""
-    cypher_query = """
-    MATCH (i:Interaction {id: $interaction_id})
-    MATCH (p:Person {id: $person_id})
-    CREATE (p)-[:PARTICIPATED_IN]->(i)
-    RETURN count(*) as link_count
-    """
-    
     with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id, person_id=person_id)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked interaction {interaction_id} to person {person_id}")
-            return True
-        return False
+        counters = session.execute_write(
+            lambda tx: tx.run(
+                _Q_LINK_INTERACTION_TO_PERSON, interaction_id=interaction_id, person_id=person_id
+            ).consume().counters
+        )
+    if counters.relationships_created > 0:
+        invalidate_network_caches()
+        logger.info(f"Linked interaction {interaction_id} to person {person_id}")
+        return True
+    return False
 
 
 def get_interactions_for_person(person_id: str) -> List[Interaction]:
     """Get all interactions for a specific person."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[:PARTICIPATED_IN]->(i:Interaction)
-    RETURN i
-    ORDER BY i.date DESC
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        interactions = []
-        for record in result:
-            interaction_data = _convert_neo4j_record(record["i"])
-            interactions.append(Interaction(**interaction_data))
-        return interactions
+    records = run_read_query(_Q_GET_INTERACTIONS_FOR_PERSON, person_id=person_id)
+    return [_interaction_from_record_fast(record["i"]) for record in records]
 
 
 def get_people_for_interaction(interaction_id: str) -> List[Dict[str, Any]]:
     """Get all people who participated in an interaction."""
-    cypher_query = """
-    MATCH (p:Person)-[:PARTICIPATED_IN]->(i:Interaction {id: $interaction_id})
-    RETURN p
-    ORDER BY p.name
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(person_data)
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_FOR_INTERACTION, interaction_id=interaction_id)
+    return [convert_neo4j_record(record["p"]) for record in records]
 
 
 def search_interactions(query: str) -> List[Interaction]:
     """Search interactions by summary content."""
-    cypher_query = """
-    MATCH (i:Interaction)
-    WHERE i.summary CONTAINS $query
-    RETURN i
-    ORDER BY i.date DESC
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, query=query)
-        interactions = []
-        for record in result:
-            interaction_data = _convert_neo4j_record(record["i"])
-            interactions.append(Interaction(**interaction_data))
-        return interactions 
\ No newline at end of file
+    # Lucene lookup over the summary index instead of a CONTAINS scan of
+    # every Interaction node
+    try:
+        records = run_read_query(
+            _Q_SEARCH_INTERACTIONS_FULLTEXT,
+            index_name=INTERACTION_FULLTEXT_INDEX_NAME,
+            query=escape_lucene_query(query)
+        )
+    except Exception as e:
+        logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+        records = run_read_query(_Q_SEARCH_INTERACTIONS_FALLBACK, query=query)
+
+    return [_interaction_from_record_fast(record["i"]) for record in records] 
\ No newline at end of file
@@ -2,358 +2,482 @@
 Neo4j operations for Location nodes.
 """
 
-import sys
-from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime, UTC
 from uuid import uuid4
 
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
-from neo4j import Session
+from pydantic import TypeAdapter
 from shared.types import Location
-from shared.utils import setup_logging
-from .connection import get_session_context
+from shared.utils import TTLCache, chunk_list, convert_neo4j_record, escape_lucene_query, setup_logging
+from .connection import get_session_context, run_read_query, run_write_query
+from .graph_queries import LOCATION_FULLTEXT_INDEX_NAME
 
 logger = setup_logging(__name__)
 
+# Locations are read far more often than they change; memoize
+# get_location per id (and find_or_create_location per place tuple) and
+# drop entries on update/delete.
+_location_cache = TTLCache(ttl_seconds=60, maxsize=10_000)
+
+# Pre-compiled validator; batch validation runs in pydantic-core instead
+# of constructing each Location through Python-level __init__.
+_LOCATION_LIST_ADAPTER = TypeAdapter(List[Location])
+
+# Fields callers are allowed to change via update_location
+_UPDATABLE_LOCATION_FIELDS = frozenset(Location.model_fields) - {"id", "created_at"}
+
+
+def _location_from_record_fast(node) -> Location:
+    """Build a Location without re-validation.
+
+    Rows coming back from Neo4j were validated when written, so list
+    endpoints skip Pydantic validators via model_construct; missing
+    optional properties fall back to the field defaults.
+    """
+    return Location.model_construct(**convert_neo4j_record(node))
+
+
+# Cypher hoisted to module level: the strings are built once at import time,
+# and identical string identity keeps Neo4j's plan cache hitting.
+_Q_CREATE_LOCATION = """
+CREATE (l:Location {
+    id: $id,
+    city: $city,
+    state: $state,
+    country: $country,
+    created_at: $created_at
+})
+RETURN l
+"""
+
+_Q_CREATE_LOCATIONS_BULK = """
+UNWIND $rows AS row
+CREATE (l:Location)
+SET l = row
+RETURN l
+"""
+
+_Q_LIST_LOCATIONS = """
+MATCH (l:Location)
+RETURN l
+ORDER BY l.city, l.state, l.country
+"""
+
+_Q_LIST_LOCATIONS_PAGE = """
+MATCH (l:Location)
+RETURN l
+ORDER BY l.city, l.state, l.country
+SKIP $skip LIMIT $limit
+"""
+
+_Q_LIST_LOCATIONS_SKIP = """
+MATCH (l:Location)
+RETURN l
+ORDER BY l.city, l.state, l.country
+SKIP $skip
+"""
+
+_Q_GET_LOCATION = """
+MATCH (l:Location {id: $location_id})
+RETURN l
+"""
+
+_Q_UPDATE_LOCATION = """
+MATCH (l:Location {id: $location_id})
+SET l += $updates
+RETURN l
+"""
+
+_Q_DELETE_LOCATION = """
+MATCH (l:Location {id: $location_id})
+DETACH DELETE l
+"""
+
+_Q_GET_LOCATIONS_BY_CITY = """
+MATCH (l:Location)
+WHERE l.city = $city
+RETURN l
+ORDER BY l.state, l.country
+"""
+
+_Q_GET_LOCATIONS_BY_STATE = """
+MATCH (l:Location)
+WHERE l.state = $state
+RETURN l
+ORDER BY l.city, l.country
+"""
+
+_Q_GET_LOCATIONS_BY_COUNTRY = """
+MATCH (l:Location)
+WHERE l.country = $country
+RETURN l
+ORDER BY l.city, l.state
+"""
+
+# USING INDEX pins both sides of the double seek to the id indexes that
+# ensure_schema() guarantees, so the planner never degrades one side to
+# a label scan.
+_Q_LINK_PERSON_TO_LOCATION = """
+MATCH (p:Person {id: $person_id})
+USING INDEX p:Person(id)
+MATCH (l:Location {id: $location_id})
+USING INDEX l:Location(id)
+MERGE (p)-[r:LIVES_IN]->(l)
+ON CREATE SET l.resident_count = coalesce(l.resident_count, 0) + 1
+RETURN count(*) as link_count
+"""
+
+_Q_UNLINK_PERSON_FROM_LOCATION = """
+MATCH (p:Person {id: $person_id})-[r:LIVES_IN]->(l:Location {id: $location_id})
+DELETE r
+SET l.resident_count = coalesce(l.resident_count, 1) - 1
+"""
+
+_Q_GET_PEOPLE_AT_LOCATION = """
+MATCH (p:Person)-[:LIVES_IN]->(l:Location {id: $location_id})
+RETURN p
+ORDER BY p.name
+"""
+
+_Q_GET_LOCATION_FOR_PERSON = """
+MATCH (p:Person {id: $person_id})-[:LIVES_IN]->(l:Location)
+RETURN l
+"""
 
-def _convert_neo4j_record(record):
-    """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-    return data
+# Top-k over the denormalized counters maintained by the link/unlink
+# helpers: an indexed backwards scan of O(limit) instead of grouping
+# every LIVES_IN / HELD_AT edge on each request.
+_Q_GET_POPULAR_LOCATIONS = """
+MATCH (l:Location)
+WHERE l.resident_count > 0
+RETURN l, l.resident_count as resident_count
+ORDER BY l.resident_count DESC
+LIMIT $limit
+"""
+
+_Q_GET_LOCATIONS_WITH_EVENTS = """
+MATCH (l:Location)
+WHERE l.event_count > 0
+RETURN l, l.event_count as event_count
+ORDER BY l.event_count DESC
+LIMIT $limit
+"""
+
+_Q_GET_LOCATION_BY_CITY = """
+MATCH (l:Location {city: $city})
+RETURN l
+"""
+
+_Q_SEARCH_LOCATIONS_FULLTEXT = """
+CALL db.index.fulltext.queryNodes($index_name, $search_term)
+YIELD node
+RETURN node as l
+ORDER BY node.city, node.state, node.country
+"""
+
+_Q_SEARCH_LOCATIONS_FALLBACK = """
+MATCH (l:Location)
+WHERE l.city CONTAINS $search_term OR l.state CONTAINS $search_term OR l.country CONTAINS $search_term
+RETURN l
+ORDER BY l.city, l.state, l.country
+"""
 
 
 def create_location(location: Location) -> Location:
     """Create a new Location node in Neo4j."""
     if not location.id:
-        location.id = str(uuid4())
+        location.id = uuid4().hex
     
     now = datetime.now(UTC)
     location.created_at = now
     
-    cypher_query = """
-    CREATE (l:Location {
-        id: $id,
-        city: $city,
-        state: $state,
-        country: $country,
-        created_at: $created_at
-    })
-    RETURN l
+    records = run_write_query(_Q_CREATE_LOCATION, **location.model_dump())
+    created_location = convert_neo4j_record(records[0]["l"])
+    logger.info(f"Created location: {location.city} with ID: {location.id}")
+    return Location(**created_location)
+
+
+def create_locations_bulk(locations: List[Location]) -> List[Location]:
+    """Create multiple Location nodes with batched UNWIND writes.
+
+    Rows are sent in chunks of 1,000, so N single-row round-trips
+    collapse into ceil(N/1000) queries.
     """
-    
+    if not locations:
+        return []
+
+    now = datetime.now(UTC)
+    rows = []
+    for location in locations:
+        if not location.id:
+            location.id = uuid4().hex
+        location.created_at = now
+        rows.append(location.model_dump())
+
+
+    raw = []
     with get_session_context() as session:
-        result = session.run(cypher_query, **location.model_dump())
-        created_location = _convert_neo4j_record(result.single()["l"])
-        logger.info(f"Created location: {location.city} with ID: {location.id}")
-        return Location(**created_location)
+        for chunk in chunk_list(rows, 1000):
+            records = session.execute_write(
+                lambda tx: list(tx.run(_Q_CREATE_LOCATIONS_BULK, rows=chunk))
+            )
+            raw.extend(convert_neo4j_record(record["l"]) for record in records)
+    created = _LOCATION_LIST_ADAPTER.validate_python(raw)
+    logger.info(f"Created {len(created)} locations in bulk")
+    return created
 
 
 def get_location(location_id: str) -> Optional[Location]:
     """Get a Location node by ID."""
-    cypher_query = """
-    MATCH (l:Location {id: $location_id})
-    RETURN l
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, location_id=location_id)
-        record = result.single()
-        if record:
-            location_data = _convert_neo4j_record(record["l"])
-            return Location(**location_data)
-        return None
-
-
-def list_locations() -> List[Location]:
-    """List all Location nodes."""
-    cypher_query = """
-    MATCH (l:Location)
-    RETURN l
-    ORDER BY l.city, l.state, l.country
+    cached = _location_cache.get(location_id)
+    if cached is not None:
+        return cached
+
+    records = run_read_query(_Q_GET_LOCATION, location_id=location_id)
+    if records:
+        location = Location(**convert_neo4j_record(records[0]["l"]))
+        _location_cache.set(location_id, location)
+        return location
+    return None
+
+
+def list_locations(skip: int = 0, limit: Optional[int] = None) -> List[Location]:
+    """List Location nodes, optionally paginated server-side.
+
+    SKIP/LIMIT run in Neo4j so only the requested page crosses the
+    wire; the default (skip=0, limit=None) keeps the full listing for
+    callers that build whole-graph views.
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            locations.append(Location(**location_data))
-        return locations
+    if limit is not None:
+        cypher_query = _Q_LIST_LOCATIONS_PAGE
+    elif skip:
+        cypher_query = _Q_LIST_LOCATIONS_SKIP
+    else:
+        cypher_query = _Q_LIST_LOCATIONS
+
+    records = run_read_query(cypher_query, skip=skip, limit=limit)
+    return [_location_from_record_fast(record["l"]) for record in records]
 
 
 def update_location(location_id: str, location_data: Dict[str, Any]) -> Optional[Location]:
     """Update a Location node."""
-    # Remove None values
-    update_data = {k: v for k, v in location_data.items() if v is not None}
-    
-    # Build dynamic SET clause
-    set_clause = ", ".join([f"l.{key} = ${key}" for key in update_data.keys()])
-    
-    cypher_query = f"""
-    MATCH (l:Location {{id: $location_id}})
-    SET {set_clause}
-    RETURN l
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, location_id=location_id, **update_data)
-        record = result.single()
-        if record:
-            location_data = _convert_neo4j_record(record["l"])
-            logger.info(f"Updated location: {location_id}")
-            return Location(**location_data)
-        return None
+    # Remove None values and anything outside the model's updatable fields,
+    # so a stray key cannot SET arbitrary properties
+    update_data = {
+        k: v for k, v in location_data.items()
+        if v is not None and k in _UPDATABLE_LOCATION_FIELDS
+    }
+
+    records = run_write_query(_Q_UPDATE_LOCATION, location_id=location_id, updates=update_data)
+    # The cache also holds (city, state, country) entries that may point
+    # at this location, so drop everything rather than just the id key
+    _location_cache.invalidate()
+    if records:
+        logger.info(f"Updated location: {location_id}")
+        return Location(**convert_neo4j_record(records[0]["l"]))
+    return None
 
 
 def delete_location(location_id: str) -> bool:
     """Delete a Location node and all its relationships."""
-    cypher_query = """
-    MATCH (l:Location {id: $location_id})
-    DETACH DELETE l
-    RETURN count(l) as deleted_count
-    """
-    
+    # The driver's result summary already counts deletions, so there is
+    # no RETURN count(l) aggregation in the query
     with get_session_context() as session:
-        result = session.run(cypher_query, location_id=location_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Deleted location: {location_id}")
-            return True
-        return False
+        counters = session.execute_write(
+            lambda tx: tx.run(_Q_DELETE_LOCATION, location_id=location_id).consume().counters
+        )
+    _location_cache.invalidate()
+    if counters.nodes_deleted > 0:
+        logger.info(f"Deleted location: {location_id}")
+        return True
+    return False
 
 
 def search_locations(search_term: str) -> List[Location]:
     """Search locations by city, state, or country."""
-    cypher_query = """
-    MATCH (l:Location)
-    WHERE l.city CONTAINS $search_term OR l.state CONTAINS $search_term OR l.country CONTAINS $search_term
-    RETURN l
-    ORDER BY l.city, l.state, l.country
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, search_term=search_term)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            locations.append(Location(**location_data))
-        return locations
+    # Lucene lookup over the place index instead of three CONTAINS
+    # predicates scanning every Location node
+    try:
+        records = run_read_query(
+            _Q_SEARCH_LOCATIONS_FULLTEXT,
+            index_name=LOCATION_FULLTEXT_INDEX_NAME,
+            search_term=escape_lucene_query(search_term)
+        )
+    except Exception as e:
+        logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+        records = run_read_query(_Q_SEARCH_LOCATIONS_FALLBACK, search_term=search_term)
+
+    return [_location_from_record_fast(record["l"]) for record in records]
 
 
 def get_locations_by_city(city: str) -> List[Location]:
     """Get all locations in a specific city."""
-    cypher_query = """
-    MATCH (l:Location)
-    WHERE l.city = $city
-    RETURN l
-    ORDER BY l.state, l.country
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, city=city)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            locations.append(Location(**location_data))
-        return locations
+    records = run_read_query(_Q_GET_LOCATIONS_BY_CITY, city=city)
+    return [_location_from_record_fast(record["l"]) for record in records]
 
 
 def get_locations_by_state(state: str) -> List[Location]:
     """Get all locations in a specific state."""
-    cypher_query = """
-    MATCH (l:Location)
-    WHERE l.state = $state
-    RETURN l
-    ORDER BY l.city, l.country
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, state=state)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            locations.append(Location(**location_data))
-        return locations
+    records = run_read_query(_Q_GET_LOCATIONS_BY_STATE, state=state)
+    return [_location_from_record_fast(record["l"]) for record in records]
 
 
 def get_locations_by_country(country: str) -> List[Location]:
     """Get all locations in a specific country."""
-    cypher_query = """
-    MATCH (l:Location)
-    WHERE l.country = $country
-    RETURN l
-    ORDER BY l.city, l.state
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, country=country)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            locations.append(Location(**location_data))
-        return locations
+    records = run_read_query(_Q_GET_LOCATIONS_BY_COUNTRY, country=country)
+    return [_location_from_record_fast(record["l"]) for record in records]
 
 
 def link_person_to_location(person_id: str, location_id: str) -> bool:
-    """Link a person to a location (person lives in location)."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})
-    MATCH (l:Location {id: $location_id})
-    MERGE (p)-[:LIVES_IN]->(l)
-    RETURN count(*) as link_count
+    """Link a person to a location (person lives in location).
+
+    Also bumps the location's denormalized resident_count so popularity
+    queries stay an indexed top-k.
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, location_id=location_id)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked person {person_id} to location {location_id}")
-            return True
-        return False
+    records = run_write_query(_Q_LINK_PERSON_TO_LOCATION, person_id=person_id, location_id=location_id)
+    if records and records[0]["link_count"] > 0:
+        logger.info(f"Linked person {person_id} to location {location_id}")
+        return True
+    return False
 
 
 def unlink_person_from_location(person_id: str, location_id: str) -> bool:
     """Unlink a person from a location."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:LIVES_IN]->(l:Location {id: $location_id})
-    DELETE r
-    RETURN count(r) as deleted_count
-    """
-    
     with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, location_id=location_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Unlinked person {person_id} from location {location_id}")
-            return True
-        return False
+        counters = session.execute_write(
+            lambda tx: tx.run(
+                _Q_UNLINK_PERSON_FROM_LOCATION, person_id=person_id, location_id=location_id
+            ).consume().counters
+        )
+    if counters.relationships_deleted > 0:
+        logger.info(f"Unlinked person {person_id} from location {location_id}")
+        return True
+    return False
 
 
 def get_people_at_location(location_id: str) -> List[Dict[str, Any]]:
     """Get all people who live at a specific location."""
-    cypher_query = """
-    MATCH (p:Person)-[:LIVES_IN]->(l:Location {id: $location_id})
-    RETURN p
-    ORDER BY p.name
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, location_id=location_id)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(person_data)
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_AT_LOCATION, location_id=location_id)
+    return [convert_neo4j_record(record["p"]) for record in records]
 
 
 def get_location_for_person(person_id: str) -> Optional[Dict[str, Any]]:
     """Get the location where a person lives."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[:LIVES_IN]->(l:Location)
-    RETURN l
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        record = result.single()
-        if record:
-            location_data = _convert_neo4j_record(record["l"])
-            return location_data
-        return None
+    records = run_read_query(_Q_GET_LOCATION_FOR_PERSON, person_id=person_id)
+    if records:
+        return convert_neo4j_record(records[0]["l"])
+    return None
 
 
 def get_popular_locations(limit: int = 10) -> List[Dict[str, Any]]:
     """Get the most popular locations (by number of people living there)."""
-    cypher_query = """
-    MATCH (p:Person)-[:LIVES_IN]->(l:Location)
-    RETURN l, count(p) as resident_count
-    ORDER BY resident_count DESC
-    LIMIT $limit
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, limit=limit)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            location_data["resident_count"] = record["resident_count"]
-            locations.append(location_data)
-        return locations
+    records = run_read_query(_Q_GET_POPULAR_LOCATIONS, limit=limit)
+    locations = []
+    for record in records:
+        location_data = convert_neo4j_record(record["l"])
+        location_data["resident_count"] = record["resident_count"]
+        locations.append(location_data)
+    return locations
 
 
 def get_locations_with_events(limit: int = 10) -> List[Dict[str, Any]]:
     """Get locations that have hosted events, ordered by number of events."""
-    cypher_query = """
-    MATCH (e:Event)-[:HELD_AT]->(l:Location)
-    RETURN l, count(e) as event_count
-    ORDER BY event_count DESC
-    LIMIT $limit
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, limit=limit)
-        locations = []
-        for record in result:
-            location_data = _convert_neo4j_record(record["l"])
-            location_data["event_count"] = record["event_count"]
-            locations.append(location_data)
-        return locations
+    records = run_read_query(_Q_GET_LOCATIONS_WITH_EVENTS, limit=limit)
+    locations = []
+    for record in records:
+        location_data = convert_neo4j_record(record["l"])
+        location_data["event_count"] = record["event_count"]
+        locations.append(location_data)
+    return locations
 
 
 def find_or_create_location(city: str, state: Optional[str] = None, country: Optional[str] = None) -> Location:
     """Find an existing location or create a new one if it doesn't exist."""
-    # First try to find existing location
+    # One MERGE instead of MATCH-then-CREATE: a single round-trip, and no
+    # race window between the lookup and the insert. MERGE needs an exact
+    # property map, so branch once on which parts were supplied.
+    cached = _location_cache.get((city, state, country))
+    if cached is not None:
+        return cached
+
     if state and country:
         cypher_query = """
-        MATCH (l:Location)
-        WHERE l.city = $city AND l.state = $state AND l.country = $country
+        MERGE (l:Location {city: $city, state: $state, country: $country})
+        ON CREATE SET l.id = $id, l.created_at = $created_at
         RETURN l
         """
         params = {"city": city, "state": state, "country": country}
     elif state:
         cypher_query = """
-        MATCH (l:Location)
-        WHERE l.city = $city AND l.state = $state
+        MERGE (l:Location {city: $city, state: $state})
+        ON CREATE SET l.id = $id, l.created_at = $created_at
         RETURN l
         """
         params = {"city": city, "state": state}
     else:
         cypher_query = """
-        MATCH (l:Location)
-        WHERE l.city = $city
+        MERGE (l:Location {city: $city})
+        ON CREATE SET l.id = $id, l.created_at = $created_at
         RETURN l
         """
         params = {"city": city}
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, **params)
-        record = result.single()
-        if record:
-            location_data = _convert_neo4j_record(record["l"])
-            return Location(**location_data)
-        
-        # Create new location if not found
-        new_location = Location(city=city, state=state, country=country)
-        return create_location(new_location)
 
+    params["id"] = uuid4().hex
+    params["created_at"] = datetime.now(UTC)
 
-def get_location_by_city(city: str) -> Optional[Location]:
-    """Get a Location node by exact city match."""
-    cypher_query = """
-    MATCH (l:Location {city: $city})
+    records = run_write_query(cypher_query, **params)
+    location = Location(**convert_neo4j_record(records[0]["l"]))
+    _location_cache.set((city, state, country), location)
+    return location
+
+
+def find_or_create_and_link_location(
+    person_id: str,
+    city: str,
+    state: Optional[str] = None,
+    country: Optional[str] = None,
+) -> Optional[Location]:
+    """Find or create a location and link a person to it in one query.
+
+    Callers that create a location then immediately call
+    link_person_to_location pay two round trips and two session
+    checkouts; fusing the MERGEs into one Cypher statement halves that.
+    Returns None when the person does not exist (nothing is linked, but
+    the location MERGE still takes effect).
+    """
+    if state and country:
+        merge_clause = "MERGE (l:Location {city: $city, state: $state, country: $country})"
+        params = {"city": city, "state": state, "country": country}
+    elif state:
+        merge_clause = "MERGE (l:Location {city: $city, state: $state})"
+        params = {"city": city, "state": state}
+    else:
+        merge_clause = "MERGE (l:Location {city: $city})"
+        params = {"city": city}
+
+    cypher_query = f"""
+    {merge_clause}
+    ON CREATE SET l.id = $id, l.created_at = $created_at
+    WITH l
+    MATCH (p:Person {{id: $person_id}})
+    MERGE (p)-[r:LIVES_IN]->(l)
+    ON CREATE SET l.resident_count = coalesce(l.resident_count, 0) + 1
     RETURN l
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, city=city)
-        record = result.single()
-        if record:
-            location_data = _convert_neo4j_record(record["l"])
-            return Location(**location_data)
-        return None 
\ No newline at end of file
+    params["id"] = uuid4().hex
+    params["created_at"] = datetime.now(UTC)
+    params["person_id"] = person_id
+
+    records = run_write_query(cypher_query, **params)
+    if records:
+        logger.info(f"Linked person {person_id} to location {city}")
+        return Location(**convert_neo4j_record(records[0]["l"]))
+    return None
+
+
+def get_location_by_city(city: str) -> Optional[Location]:
+    """Get a Location node by exact city match."""
+    records = run_read_query(_Q_GET_LOCATION_BY_CITY, city=city)
+    if records:
+        return Location(**convert_neo4j_record(records[0]["l"]))
+    return None 
\ No newline at end of file
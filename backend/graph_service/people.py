@@ -2,463 +2,715 @@
 Neo4j operations for Person nodes.
 """
 
-import sys
-from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, UTC
 from uuid import uuid4
-
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
-from neo4j import Session
 from shared.types import Person, ContactStatus, DataSource, RelationshipType
-from shared.utils import setup_logging
-from .connection import get_session_context
+from shared.utils import (
+    NEO4J_TEMPORAL_TYPES,
+    TTLCache,
+    chunk_list,
+    convert_neo4j_record,
+    fuzzy_lucene_query,
+    setup_logging,
+)
+from .connection import (
+    get_async_session_context,
+    get_session_context,
+    run_read_query,
+    run_write_query,
+)
+from .graph_queries import PERSON_FULLTEXT_INDEX_NAME, invalidate_network_caches
 
 logger = setup_logging(__name__)
 
+# People are read far more often than they change; memoize get_person
+# per id and drop entries on update/delete.
+_person_cache = TTLCache(ttl_seconds=60, maxsize=10_000)
 
-def _convert_neo4j_datetime(neo4j_datetime):
-    """Convert Neo4j datetime to Python datetime."""
-    if neo4j_datetime is None:
-        return None
-    if hasattr(neo4j_datetime, 'to_native'):
-        return neo4j_datetime.to_native()
-    return neo4j_datetime
+# Fields callers are allowed to change via update_person
+_UPDATABLE_PERSON_FIELDS = frozenset(Person.model_fields) - {"id", "created_at"}
 
 
-def _convert_neo4j_record(record):
-    """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-    return data
+# Temporal properties on Person nodes, precomputed so per-row conversion
+# only inspects these keys instead of every value.
+_PERSON_TEMPORAL_KEYS = frozenset({"created_at", "updated_at", "last_contacted_date", "birthday"})
 
 
-def create_person(person: Person) -> Person:
-    """Create a new Person node in Neo4j."""
+def _convert_neo4j_datetime(value):
+    """Convert a single Neo4j temporal value to its native equivalent."""
+    if isinstance(value, NEO4J_TEMPORAL_TYPES):
+        return value.to_native()
+    return value
+
+
+def _person_from_record_fast(node) -> Person:
+    """Build a Person without re-validation.
+
+    Rows coming back from Neo4j were validated when written, so read
+    paths skip Pydantic validators via model_construct; missing optional
+    properties fall back to the field defaults.
+    """
+    return Person.model_construct(**convert_neo4j_record(node, _PERSON_TEMPORAL_KEYS))
+
+
+# Cypher hoisted to module level: the strings are built once at import time,
+# and identical string identity keeps Neo4j's plan cache hitting.
+_Q_CREATE_PERSON = """
+CREATE (p:Person {
+    id: $id,
+    name: $name,
+    email: $email,
+    phone: $phone,
+    linkedin_url: $linkedin_url,
+    last_contacted_date: $last_contacted_date,
+    birthday: $birthday,
+    source_of_contact: $source_of_contact,
+    status: $status,
+    notes: $notes,
+    created_at: datetime(),
+    updated_at: datetime(),
+    data_source: $data_source
+})
+RETURN p
+"""
+
+_Q_GET_PERSON = """
+MATCH (p:Person {id: $person_id})
+RETURN p
+"""
+
+_Q_UPDATE_PERSON = """
+MATCH (p:Person {id: $person_id})
+SET p += $updates, p.updated_at = datetime()
+RETURN p
+"""
+
+_Q_LIST_PEOPLE = """
+MATCH (p:Person)
+RETURN p
+ORDER BY p.name
+"""
+
+# Keyset page over the (name, id) ordering: seeking past the cursor
+# through the name index costs the same for page 1 and page 1000,
+# unlike SKIP which re-reads every earlier row. The id tiebreak keeps
+# pagination lossless when a page boundary falls inside a run of
+# people sharing a name.
+_Q_LIST_PEOPLE_PAGE = """
+MATCH (p:Person)
+WHERE $cname IS NULL
+   OR p.name > $cname
+   OR (p.name = $cname AND p.id > $cid)
+RETURN p
+ORDER BY p.name, p.id
+LIMIT $limit
+"""
+
+# Deleting a person also gives back their LIVES_IN slot in the
+# location's denormalized resident_count so the popularity top-k stays
+# accurate.
+_Q_DELETE_PERSON = """
+MATCH (p:Person {id: $person_id})
+OPTIONAL MATCH (p)-[:LIVES_IN]->(l:Location)
+SET l.resident_count = coalesce(l.resident_count, 1) - 1
+WITH DISTINCT p
+DETACH DELETE p
+RETURN count(p) as deleted_count
+"""
+
+_Q_GET_PERSON_BY_NAME = """
+MATCH (p:Person {name: $name})
+RETURN p
+"""
+
+_Q_SEARCH_PEOPLE = """
+MATCH (p:Person)
+WHERE p.name CONTAINS $search_query OR p.email CONTAINS $search_query
+RETURN p
+ORDER BY 
+    CASE 
+        WHEN p.name = $search_query THEN 1
+        WHEN p.name STARTS WITH $search_query THEN 2
+        ELSE 3
+    END,
+    p.name
+LIMIT $limit
+"""
+
+_Q_SEARCH_PEOPLE_FULLTEXT = """
+CALL db.index.fulltext.queryNodes($index_name, $search_query)
+YIELD node, score
+RETURN node as p
+ORDER BY score DESC, node.name
+LIMIT $limit
+"""
+
+_Q_LINK_PERSON_TO_COMPANY = """
+MATCH (p:Person {id: $person_id})
+MATCH (c:Company {id: $company_id})
+MERGE (p)-[r:WORKS_AT]->(c)
+SET r.role = $role, r.start_date = $start_date, r.end_date = $end_date, r.created_at = datetime()
+RETURN count(r) as link_count
+"""
+
+_Q_BULK_LINK_EMPLOYMENT = """
+UNWIND $rows AS row
+MATCH (p:Person {id: row.person_id})
+MATCH (c:Company {id: row.company_id})
+MERGE (p)-[r:WORKS_AT]->(c)
+SET r += row.props
+RETURN count(*) as link_count
+"""
+
+_Q_BULK_CREATE_PERSON_RELATIONSHIPS = """
+UNWIND $rows AS row
+MATCH (p1:Person {id: row.from_person_id})
+MATCH (p2:Person {id: row.to_person_id})
+MERGE (p1)-[r:KNOWS]->(p2)
+SET r.type = row.relationship_type, r.strength = row.strength, r.created_at = row.created_at
+RETURN count(*) as link_count
+"""
+
+_Q_LINK_PERSON_TO_TOPICS = """
+UNWIND $topic_ids AS tid
+MATCH (p:Person {id: $person_id})
+MATCH (t:Topic {id: tid})
+MERGE (p)-[:INTERESTED_IN]->(t)
+ON CREATE SET p.topic_ids = coalesce(p.topic_ids, []) + [t.id]
+RETURN count(*) as link_count
+"""
+
+_Q_GET_EMPLOYMENT_HISTORY = """
+MATCH (p:Person {id: $person_id})-[r:WORKS_AT]->(c:Company)
+RETURN c, r.role as role, r.start_date as start_date, r.end_date as end_date
+ORDER BY r.start_date DESC
+"""
+
+_Q_GET_CURRENT_EMPLOYER = """
+MATCH (p:Person {id: $person_id})-[r:WORKS_AT]->(c:Company)
+WHERE r.end_date IS NULL
+RETURN c, r.role as role, r.start_date as start_date
+LIMIT 1
+"""
+
+_Q_GET_EMPLOYEES_AT_COMPANY = """
+MATCH (p:Person)-[r:WORKS_AT]->(c:Company {id: $company_id})
+WHERE r.end_date IS NULL
+RETURN p, r.role as role, r.start_date as start_date
+ORDER BY p.name
+"""
+
+_Q_CREATE_PERSON_RELATIONSHIP = """
+MATCH (p1:Person {id: $from_person_id})
+MATCH (p2:Person {id: $to_person_id})
+MERGE (p1)-[r:KNOWS]->(p2)
+SET r.type = $relationship_type, r.strength = $strength, r.created_at = datetime()
+RETURN count(r) as link_count
+"""
+
+_Q_GET_PERSON_RELATIONSHIPS = """
+MATCH (p:Person {id: $person_id})-[r:KNOWS]->(other:Person)
+RETURN other, r.type as type, r.strength as strength, r.created_at as created_at
+ORDER BY other.name
+"""
+
+_Q_GET_PEOPLE_BY_RELATIONSHIP_TYPE = """
+MATCH (p:Person {id: $person_id})-[r:KNOWS]->(other:Person)
+WHERE r.type = $relationship_type
+RETURN other, r.strength as strength
+ORDER BY other.name
+"""
+
+# Cypher cannot parameterize variable-length bounds, so the (clamped)
+# depth is inlined; DISTINCT + min() collapses the duplicate rows a
+# multi-path expansion would otherwise return (aggregation groups by
+# connected, so each person appears once at their shortest distance).
+_Q_GET_NETWORK_CONNECTIONS_TEMPLATE = """
+MATCH path = (p:Person {{id: $person_id}})-[*1..{depth}]-(connected:Person)
+WHERE connected.id <> $person_id
+RETURN connected, min(length(path)) as distance
+ORDER BY distance, connected.name
+"""
+
+_Q_GET_PEOPLE_BY_COMPANY_AND_ROLE = """
+MATCH (p:Person)-[r:WORKS_AT]->(c:Company {id: $company_id})
+WHERE r.role CONTAINS $role AND r.end_date IS NULL
+RETURN p
+ORDER BY p.name
+"""
+
+_Q_GET_PEOPLE_NEEDING_FOLLOWUP = """
+MATCH (p:Person)
+WHERE p.status = 'needs_follow_up'
+RETURN p
+ORDER BY p.last_contacted_date ASC NULLS FIRST
+"""
+
+_Q_GET_PEOPLE_BY_BIRTHDAY_MONTH = """
+MATCH (p:Person)
+WHERE p.birthday IS NOT NULL AND month(p.birthday) = $month
+RETURN p
+ORDER BY day(p.birthday)
+"""
+
+_Q_GET_PEOPLE_BY_LOCATION = """
+MATCH (p:Person)-[:LIVES_IN]->(l:Location {id: $location_id})
+RETURN p
+ORDER BY p.name
+"""
+
+# Pattern comprehensions collect each branch independently, so the whole
+# profile arrives in one round trip without the row multiplication that
+# chained OPTIONAL MATCH + collect(DISTINCT) would cause.
+_Q_GET_PERSON_PROFILE = """
+MATCH (p:Person {id: $person_id})
+RETURN p,
+       [(p)-[w:WORKS_AT]->(c:Company) | {company: c, role: w.role, start_date: w.start_date, end_date: w.end_date}] as employment,
+       [(p)-[:INTERESTED_IN]->(t:Topic) | t] as topics,
+       [(p)-[k:KNOWS]->(o:Person) | {person: o, type: k.type, strength: k.strength}] as relationships
+"""
+
+_Q_GET_PEOPLE_BY_TOPIC = """
+MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic {id: $topic_id})
+RETURN p
+ORDER BY p.name
+"""
+
+
+def create_person_with_links(
+    person: Person,
+    company_links: Optional[List[Dict[str, Any]]] = None,
+    topic_ids: Optional[List[str]] = None,
+) -> Person:
+    """Create a person and link employment and topics in one transaction.
+
+    Issuing create_person plus each link as its own service call pays a
+    session checkout and a BEGIN/COMMIT round trip per statement. Here
+    the CREATE and both UNWIND link statements run inside one managed
+    write transaction, so a whole profile import costs a single commit.
+
+    Each company link is {"company_id": ..., "props": {...}} where props
+    carries role/start_date/end_date.
+    """
     if not person.id:
-        person.id = str(uuid4())
-    
+        person.id = uuid4().hex
+
+    # created_at/updated_at are stamped server-side with datetime(), so
+    # rows agree with the database clock even under clock skew.
+    # model_dump serializes linkedin_url to a plain string for Bolt; the
+    # temporal fields stay native datetimes so Neo4j stores them as such
+    person_data = person.model_dump(exclude={"created_at", "updated_at"})
+
     now = datetime.now(UTC)
-    person.created_at = now
-    person.updated_at = now
-    
-    # Convert HttpUrl to string for Neo4j compatibility
-    person_data = person.model_dump()
-    if person_data.get('linkedin_url'):
-        person_data['linkedin_url'] = str(person_data['linkedin_url'])
-    
-    cypher_query = """
-    CREATE (p:Person {
-        id: $id,
-        name: $name,
-        email: $email,
-        phone: $phone,
-        linkedin_url: $linkedin_url,
-        last_contacted_date: $last_contacted_date,
-        birthday: $birthday,
-        source_of_contact: $source_of_contact,
-        status: $status,
-        notes: $notes,
-        created_at: $created_at,
-        updated_at: $updated_at,
-        data_source: $data_source
-    })
-    RETURN p
-    """
-    
+    emp_rows = []
+    for link in (company_links or []):
+        row = dict(link)
+        row["person_id"] = person.id
+        row.setdefault("props", {}).setdefault("created_at", now)
+        emp_rows.append(row)
+
+    def create_profile(tx):
+        record = tx.run(_Q_CREATE_PERSON, **person_data).single()
+        if emp_rows:
+            tx.run(_Q_BULK_LINK_EMPLOYMENT, rows=emp_rows).consume()
+        if topic_ids:
+            tx.run(_Q_LINK_PERSON_TO_TOPICS, person_id=person.id, topic_ids=topic_ids).consume()
+        return record["p"]
+
     with get_session_context() as session:
-        result = session.run(cypher_query, **person_data)
-        created_person = _convert_neo4j_record(result.single()["p"])
-        logger.info(f"Created person: {person.name} with ID: {person.id}")
-        return Person(**created_person)
+        node = session.execute_write(create_profile)
+    invalidate_network_caches()
+    created_person = convert_neo4j_record(node, _PERSON_TEMPORAL_KEYS)
+    logger.info(f"Created person: {person.name} with ID: {person.id}")
+    return Person(**created_person)
+
+
+def create_person(person: Person) -> Person:
+    """Create a new Person node in Neo4j."""
+    return create_person_with_links(person)
 
 
 def get_person(person_id: str) -> Optional[Person]:
     """Get a Person node by ID."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})
-    RETURN p
+    cached = _person_cache.get(person_id)
+    if cached is not None:
+        return cached
+
+    records = run_read_query(_Q_GET_PERSON, person_id=person_id)
+    if records:
+        person = _person_from_record_fast(records[0]["p"])
+        _person_cache.set(person_id, person)
+        return person
+    return None
+
+
+def iter_people() -> Iterator[Person]:
+    """Stream all Person nodes one record at a time.
+
+    The session stays open for the lifetime of the generator, so peak
+    memory is bounded by a single record instead of the full result set.
     """
-    
     with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        record = result.single()
-        if record:
-            person_data = _convert_neo4j_record(record["p"])
-            return Person(**person_data)
-        return None
+        result = session.run(_Q_LIST_PEOPLE)
+        for record in result:
+            yield _person_from_record_fast(record["p"])
 
 
 def list_people() -> List[Person]:
     """List all Person nodes."""
-    cypher_query = """
-    MATCH (p:Person)
-    RETURN p
-    ORDER BY p.name
+    return list(iter_people())
+
+
+def list_people_page(limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Person], Optional[str]]:
+    """List people as a bounded keyset page.
+
+    Returns (people, next_cursor); pass next_cursor back in to fetch the
+    following page, None means the listing is exhausted. The opaque
+    cursor is "<id>:<name>" — names are not unique, so the id breaks
+    ties at page boundaries (ids never contain a colon, names may, so
+    the id goes first and the split takes the first colon only).
     """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people
+    limit = max(1, min(int(limit), 1000))
+    cid, _, cname = cursor.partition(":") if cursor else (None, None, None)
+    records = run_read_query(_Q_LIST_PEOPLE_PAGE, cname=cname, cid=cid, limit=limit)
+    people = [_person_from_record_fast(record["p"]) for record in records]
+    next_cursor = f"{people[-1].id}:{people[-1].name}" if len(people) == limit else None
+    return people, next_cursor
+
+
+async def get_person_async(person_id: str) -> Optional[Person]:
+    """Async variant of get_person for request handlers on the event loop.
+
+    The sync functions block a thread per Bolt round-trip; async-def
+    FastAPI routes that call them stall the whole event loop, so the hot
+    read endpoints await these instead.
+    """
+
+    cached = _person_cache.get(person_id)
+    if cached is not None:
+        return cached
+
+    async def run_query(tx):
+        result = await tx.run(_Q_GET_PERSON, person_id=person_id)
+        return await result.single()
+
+    async with get_async_session_context() as session:
+        record = await session.execute_read(run_query)
+    if record:
+        person = _person_from_record_fast(record["p"])
+        _person_cache.set(person_id, person)
+        return person
+    return None
+
+
+async def list_people_async() -> List[Person]:
+    """Async variant of list_people for request handlers on the event loop."""
+
+    async def run_query(tx):
+        result = await tx.run(_Q_LIST_PEOPLE)
+        return [record["p"] async for record in result]
+
+    async with get_async_session_context() as session:
+        nodes = await session.execute_read(run_query)
+    return [_person_from_record_fast(node) for node in nodes]
 
 
 def update_person(person_id: str, person_data: Dict[str, Any]) -> Optional[Person]:
     """Update a Person node."""
-    # Remove None values and add updated_at timestamp
-    update_data = {k: v for k, v in person_data.items() if v is not None}
-    update_data["updated_at"] = datetime.now(UTC)
-    
-    # Convert HttpUrl to string for Neo4j compatibility
-    if update_data.get('linkedin_url'):
-        update_data['linkedin_url'] = str(update_data['linkedin_url'])
-    
-    # Build dynamic SET clause
-    set_clause = ", ".join([f"p.{key} = ${key}" for key in update_data.keys()])
-    
-    cypher_query = f"""
-    MATCH (p:Person {{id: $person_id}})
-    SET {set_clause}
-    RETURN p
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, **update_data)
-        record = result.single()
-        if record:
-            person_data = _convert_neo4j_record(record["p"])
-            logger.info(f"Updated person: {person_id}")
-            return Person(**person_data)
-        return None
+    # Remove None values and anything outside the model's updatable
+    # fields, so a stray key cannot SET arbitrary properties; the single
+    # map-form query keeps one server-side plan for every key combination
+    update_data = {
+        k: v for k, v in person_data.items()
+        if v is not None and k in _UPDATABLE_PERSON_FIELDS
+    }
+    update_data.pop("updated_at", None)  # stamped server-side
+
+    records = run_write_query(_Q_UPDATE_PERSON, person_id=person_id, updates=update_data)
+    _person_cache.invalidate(person_id)
+    if records:
+        logger.info(f"Updated person: {person_id}")
+        return Person(**convert_neo4j_record(records[0]["p"], _PERSON_TEMPORAL_KEYS))
+    return None
 
 
 def delete_person(person_id: str) -> bool:
     """Delete a Person node and all its relationships."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})
-    DETACH DELETE p
-    RETURN count(p) as deleted_count
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Deleted person: {person_id}")
-            return True
-        return False
+    records = run_write_query(_Q_DELETE_PERSON, person_id=person_id)
+    _person_cache.invalidate(person_id)
+    invalidate_network_caches()
+    if records[0]["deleted_count"] > 0:
+        logger.info(f"Deleted person: {person_id}")
+        return True
+    return False
 
 
 def get_person_by_name(name: str) -> Optional[Person]:
     """Get a Person node by exact name match."""
-    cypher_query = """
-    MATCH (p:Person {name: $name})
-    RETURN p
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, name=name)
-        record = result.single()
-        if record:
-            person_data = _convert_neo4j_record(record["p"])
-            return Person(**person_data)
-        return None
+    records = run_read_query(_Q_GET_PERSON_BY_NAME, name=name)
+    if records:
+        return _person_from_record_fast(records[0]["p"])
+    return None
 
 
-def search_people(query: str) -> List[Person]:
+def search_people(query: str, limit: int = 100) -> List[Person]:
     """Search people by name or email with fuzzy matching."""
-    cypher_query = """
-    MATCH (p:Person)
-    WHERE p.name CONTAINS $search_query OR p.email CONTAINS $search_query
-    RETURN p
-    ORDER BY 
-        CASE 
-            WHEN p.name = $search_query THEN 1
-            WHEN p.name STARTS WITH $search_query THEN 2
-            ELSE 3
-        END,
-        p.name
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, search_query=query)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people
+    limit = max(1, min(int(limit), 1000))
+
+    # Lucene lookup over the person index instead of CONTAINS predicates
+    # scanning every Person node
+    try:
+        records = run_read_query(
+            _Q_SEARCH_PEOPLE_FULLTEXT,
+            index_name=PERSON_FULLTEXT_INDEX_NAME,
+            search_query=fuzzy_lucene_query(query),
+            limit=limit
+        )
+    except Exception as e:
+        logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+        records = run_read_query(_Q_SEARCH_PEOPLE, search_query=query, limit=limit)
+
+    return [_person_from_record_fast(record["p"]) for record in records]
 
 
 # Employment relationship functions
 
 def link_person_to_company(person_id: str, company_id: str, role: str, start_date: datetime, end_date: Optional[datetime] = None) -> bool:
     """Link a person to a company with employment details."""
-    now = datetime.now(UTC)
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})
-    MATCH (c:Company {id: $company_id})
-    MERGE (p)-[r:WORKS_AT]->(c)
-    SET r.role = $role, r.start_date = $start_date, r.end_date = $end_date, r.created_at = $created_at
-    RETURN count(r) as link_count
+    records = run_write_query(_Q_LINK_PERSON_TO_COMPANY,
+                              person_id=person_id, company_id=company_id,
+                              role=role, start_date=start_date, end_date=end_date)
+    if records[0]["link_count"] > 0:
+        invalidate_network_caches()
+        logger.info(f"Linked person {person_id} to company {company_id} as {role}")
+        return True
+    return False
+
+
+def bulk_link_employment(rows: List[Dict[str, Any]]) -> int:
+    """Link many person/company employment pairs in one UNWIND write.
+
+    Each row is {"person_id": ..., "company_id": ..., "props": {...}}
+    where props carries role/start_date/end_date. Importing a profile
+    with N roles costs one round trip instead of N.
     """
-    
+    if not rows:
+        return 0
+
+    now = datetime.now(UTC)
+    for row in rows:
+        row.setdefault("props", {}).setdefault("created_at", now)
+
+    link_count = 0
     with get_session_context() as session:
-        result = session.run(cypher_query, 
-                           person_id=person_id, company_id=company_id, 
-                           role=role, start_date=start_date, end_date=end_date, created_at=now)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked person {person_id} to company {company_id} as {role}")
-            return True
-        return False
+        for chunk in chunk_list(rows, 1000):
+            records = session.execute_write(
+                lambda tx: list(tx.run(_Q_BULK_LINK_EMPLOYMENT, rows=chunk))
+            )
+            link_count += records[0]["link_count"]
+    if link_count:
+        invalidate_network_caches()
+    logger.info(f"Linked {link_count} employment pairs in bulk")
+    return link_count
+
+
+def get_person_profile(person_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a person plus employment, topics and relationships at once.
+
+    The profile view used to fan out into get_person,
+    get_employment_history, get_topics_for_person and
+    get_person_relationships, paying a Bolt round trip per helper; this
+    collects every branch in a single statement.
+    """
+    records = run_read_query(_Q_GET_PERSON_PROFILE, person_id=person_id)
+    if not records:
+        return None
+
+    record = records[0]
+    profile = convert_neo4j_record(record["p"], _PERSON_TEMPORAL_KEYS)
+    profile["employment"] = [
+        {
+            "company": convert_neo4j_record(entry["company"]),
+            "role": entry["role"],
+            "start_date": _convert_neo4j_datetime(entry["start_date"]),
+            "end_date": _convert_neo4j_datetime(entry["end_date"]),
+        }
+        for entry in record["employment"]
+    ]
+    profile["topics"] = [convert_neo4j_record(t) for t in record["topics"]]
+    profile["relationships"] = [
+        {
+            "person": convert_neo4j_record(entry["person"], _PERSON_TEMPORAL_KEYS),
+            "type": entry["type"],
+            "strength": entry["strength"],
+        }
+        for entry in record["relationships"]
+    ]
+    return profile
 
 
 def get_employment_history(person_id: str) -> List[Dict[str, Any]]:
     """Get employment history for a person."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:WORKS_AT]->(c:Company)
-    RETURN c, r.role as role, r.start_date as start_date, r.end_date as end_date
-    ORDER BY r.start_date DESC
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        employment = []
-        for record in result:
-            company_data = _convert_neo4j_record(record["c"])
-            employment.append({
-                "company": company_data,
-                "role": record["role"],
-                "start_date": _convert_neo4j_datetime(record["start_date"]),
-                "end_date": _convert_neo4j_datetime(record["end_date"])
-            })
-        return employment
+    records = run_read_query(_Q_GET_EMPLOYMENT_HISTORY, person_id=person_id)
+    return [
+        {
+            "company": convert_neo4j_record(record["c"]),
+            "role": record["role"],
+            "start_date": _convert_neo4j_datetime(record["start_date"]),
+            "end_date": _convert_neo4j_datetime(record["end_date"])
+        }
+        for record in records
+    ]
 
 
 def get_current_employer(person_id: str) -> Optional[Dict[str, Any]]:
     """Get the current employer for a person."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:WORKS_AT]->(c:Company)
-    WHERE r.end_date IS NULL
-    RETURN c, r.role as role, r.start_date as start_date
-    LIMIT 1
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        record = result.single()
-        if record:
-            company_data = _convert_neo4j_record(record["c"])
-            return {
-                "company": company_data,
-                "role": record["role"],
-                "start_date": _convert_neo4j_datetime(record["start_date"])
-            }
-        return None
+    records = run_read_query(_Q_GET_CURRENT_EMPLOYER, person_id=person_id)
+    if records:
+        record = records[0]
+        return {
+            "company": convert_neo4j_record(record["c"]),
+            "role": record["role"],
+            "start_date": _convert_neo4j_datetime(record["start_date"])
+        }
+    return None
 
 
 def get_employees_at_company(company_id: str) -> List[Dict[str, Any]]:
     """Get all employees at a company."""
-    cypher_query = """
-    MATCH (p:Person)-[r:WORKS_AT]->(c:Company {id: $company_id})
-    WHERE r.end_date IS NULL
-    RETURN p, r.role as role, r.start_date as start_date
-    ORDER BY p.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, company_id=company_id)
-        employees = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            employees.append({
-                "person": person_data,
-                "role": record["role"],
-                "start_date": _convert_neo4j_datetime(record["start_date"])
-            })
-        return employees
+    records = run_read_query(_Q_GET_EMPLOYEES_AT_COMPANY, company_id=company_id)
+    return [
+        {
+            "person": convert_neo4j_record(record["p"], _PERSON_TEMPORAL_KEYS),
+            "role": record["role"],
+            "start_date": _convert_neo4j_datetime(record["start_date"])
+        }
+        for record in records
+    ]
 
 
 # Person-to-person relationship functions
 
 def create_person_relationship(from_person_id: str, to_person_id: str, relationship_type: RelationshipType, strength: int) -> bool:
     """Create a relationship between two people."""
-    now = datetime.now(UTC)
-    cypher_query = """
-    MATCH (p1:Person {id: $from_person_id})
-    MATCH (p2:Person {id: $to_person_id})
-    MERGE (p1)-[r:KNOWS]->(p2)
-    SET r.type = $relationship_type, r.strength = $strength, r.created_at = $created_at
-    RETURN count(r) as link_count
+    records = run_write_query(_Q_CREATE_PERSON_RELATIONSHIP,
+                              from_person_id=from_person_id, to_person_id=to_person_id,
+                              relationship_type=relationship_type, strength=strength)
+    if records[0]["link_count"] > 0:
+        invalidate_network_caches()
+        logger.info(f"Created relationship between {from_person_id} and {to_person_id}")
+        return True
+    return False
+
+
+def bulk_create_person_relationships(rows: List[Dict[str, Any]]) -> int:
+    """Create many KNOWS relationships in one UNWIND write.
+
+    Each row is {"from_person_id": ..., "to_person_id": ...,
+    "relationship_type": ..., "strength": ...}.
     """
-    
+    if not rows:
+        return 0
+
+    now = datetime.now(UTC)
+    for row in rows:
+        row.setdefault("created_at", now)
+
+    link_count = 0
     with get_session_context() as session:
-        result = session.run(cypher_query, 
-                           from_person_id=from_person_id, to_person_id=to_person_id,
-                           relationship_type=relationship_type, strength=strength, created_at=now)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Created relationship between {from_person_id} and {to_person_id}")
-            return True
-        return False
+        for chunk in chunk_list(rows, 1000):
+            records = session.execute_write(
+                lambda tx: list(tx.run(_Q_BULK_CREATE_PERSON_RELATIONSHIPS, rows=chunk))
+            )
+            link_count += records[0]["link_count"]
+    if link_count:
+        invalidate_network_caches()
+    logger.info(f"Created {link_count} person relationships in bulk")
+    return link_count
 
 
 def get_person_relationships(person_id: str) -> List[Dict[str, Any]]:
     """Get all relationships for a person."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:KNOWS]->(other:Person)
-    RETURN other, r.type as type, r.strength as strength, r.created_at as created_at
-    ORDER BY other.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        relationships = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["other"])
-            relationships.append({
-                "person": person_data,
-                "type": record["type"],
-                "strength": record["strength"],
-                "created_at": _convert_neo4j_datetime(record["created_at"])
-            })
-        return relationships
+    records = run_read_query(_Q_GET_PERSON_RELATIONSHIPS, person_id=person_id)
+    return [
+        {
+            "person": convert_neo4j_record(record["other"], _PERSON_TEMPORAL_KEYS),
+            "type": record["type"],
+            "strength": record["strength"],
+            "created_at": _convert_neo4j_datetime(record["created_at"])
+        }
+        for record in records
+    ]
 
 
 def get_people_by_relationship_type(person_id: str, relationship_type: RelationshipType) -> List[Dict[str, Any]]:
     """Get people connected to a person by a specific relationship type."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:KNOWS]->(other:Person)
-    WHERE r.type = $relationship_type
-    RETURN other, r.strength as strength
-    ORDER BY other.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, relationship_type=relationship_type)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["other"])
-            people.append({
-                "person": person_data,
-                "strength": record["strength"]
-            })
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_BY_RELATIONSHIP_TYPE, person_id=person_id, relationship_type=relationship_type)
+    return [
+        {
+            "person": convert_neo4j_record(record["other"], _PERSON_TEMPORAL_KEYS),
+            "strength": record["strength"]
+        }
+        for record in records
+    ]
 
 
 # Advanced query functions
 
 def get_network_connections(person_id: str, depth: int = 2) -> Dict[str, Any]:
-    """Get network connections up to a certain depth."""
-    cypher_query = """
-    MATCH path = (p:Person {id: $person_id})-[*1..$depth]-(connected:Person)
-    WHERE connected.id <> $person_id
-    RETURN connected, length(path) as distance
-    ORDER BY distance, connected.name
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, depth=depth)
-        connections = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["connected"])
-            connections.append({
-                "person": person_data,
-                "distance": record["distance"]
-            })
-        return {"connections": connections, "depth": depth}
+    """Get network connections up to a certain depth (clamped to 1..4)."""
+    depth = max(1, min(int(depth), 4))
+    cypher_query = _Q_GET_NETWORK_CONNECTIONS_TEMPLATE.format(depth=depth)
+
+    records = run_read_query(cypher_query, person_id=person_id)
+    connections = [
+        {
+            "person": convert_neo4j_record(record["connected"], _PERSON_TEMPORAL_KEYS),
+            "distance": record["distance"]
+        }
+        for record in records
+    ]
+    return {"connections": connections, "depth": depth}
 
 
 def get_people_by_company_and_role(company_id: str, role: str) -> List[Person]:
     """Get people at a company with a specific role."""
-    cypher_query = """
-    MATCH (p:Person)-[r:WORKS_AT]->(c:Company {id: $company_id})
-    WHERE r.role CONTAINS $role AND r.end_date IS NULL
-    RETURN p
-    ORDER BY p.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, company_id=company_id, role=role)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_BY_COMPANY_AND_ROLE, company_id=company_id, role=role)
+    return [_person_from_record_fast(record["p"]) for record in records]
 
 
 def get_people_needing_followup() -> List[Person]:
     """Get people who need follow-up (status = needs_follow_up)."""
-    cypher_query = """
-    MATCH (p:Person)
-    WHERE p.status = 'needs_follow_up'
-    RETURN p
-    ORDER BY p.last_contacted_date ASC NULLS FIRST
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_NEEDING_FOLLOWUP)
+    return [_person_from_record_fast(record["p"]) for record in records]
 
 
 def get_people_by_birthday_month(month: int) -> List[Person]:
     """Get people with birthdays in a specific month."""
-    cypher_query = """
-    MATCH (p:Person)
-    WHERE p.birthday IS NOT NULL AND month(p.birthday) = $month
-    RETURN p
-    ORDER BY day(p.birthday)
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, month=month)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_BY_BIRTHDAY_MONTH, month=month)
+    return [_person_from_record_fast(record["p"]) for record in records]
 
 
 def get_people_by_location(location_id: str) -> List[Person]:
     """Get people who live at a specific location."""
-    cypher_query = """
-    MATCH (p:Person)-[:LIVES_IN]->(l:Location {id: $location_id})
-    RETURN p
-    ORDER BY p.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, location_id=location_id)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_BY_LOCATION, location_id=location_id)
+    return [_person_from_record_fast(record["p"]) for record in records]
 
 
 def get_people_by_topic(topic_id: str) -> List[Person]:
     """Get people interested in a specific topic."""
-    cypher_query = """
-    MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic {id: $topic_id})
-    RETURN p
-    ORDER BY p.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, topic_id=topic_id)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(Person(**person_data))
-        return people 
\ No newline at end of file
+    records = run_read_query(_Q_GET_PEOPLE_BY_TOPIC, topic_id=topic_id)
+    return [_person_from_record_fast(record["p"]) for record in records] 
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Neo4j schema management: unique constraints and lookup indexes.
+"""
+
+from shared.utils import setup_logging
+from .connection import get_session_context
+
+logger = setup_logging(__name__)
+
+# Every service function seeks on {id: $id}; the unique constraints turn
+# those lookups (and the double seek inside MERGE links) into O(log N)
+# index seeks instead of label scans. The plain indexes cover the
+# remaining hot filter/sort properties.
+_SCHEMA_STATEMENTS = [
+    "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.id IS UNIQUE",
+    "CREATE CONSTRAINT company_id IF NOT EXISTS FOR (c:Company) REQUIRE c.id IS UNIQUE",
+    "CREATE CONSTRAINT topic_id IF NOT EXISTS FOR (t:Topic) REQUIRE t.id IS UNIQUE",
+    "CREATE CONSTRAINT location_id IF NOT EXISTS FOR (l:Location) REQUIRE l.id IS UNIQUE",
+    "CREATE CONSTRAINT event_id IF NOT EXISTS FOR (e:Event) REQUIRE e.id IS UNIQUE",
+    "CREATE CONSTRAINT interaction_id IF NOT EXISTS FOR (i:Interaction) REQUIRE i.id IS UNIQUE",
+    "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+    # get_people_needing_followup filters on status
+    "CREATE INDEX person_status IF NOT EXISTS FOR (p:Person) ON (p.status)",
+    "CREATE INDEX topic_name IF NOT EXISTS FOR (t:Topic) ON (t.name)",
+    "CREATE INDEX event_name IF NOT EXISTS FOR (e:Event) ON (e.name)",
+    "CREATE INDEX event_date IF NOT EXISTS FOR (e:Event) ON (e.date)",
+    "CREATE INDEX event_type IF NOT EXISTS FOR (e:Event) ON (e.type)",
+    "CREATE INDEX location_city IF NOT EXISTS FOR (l:Location) ON (l.city)",
+    "CREATE INDEX location_state IF NOT EXISTS FOR (l:Location) ON (l.state)",
+    "CREATE INDEX location_country IF NOT EXISTS FOR (l:Location) ON (l.country)",
+    # Composite index backing find_or_create_location's city/state/country seek
+    "CREATE INDEX location_place IF NOT EXISTS FOR (l:Location) ON (l.city, l.state, l.country)",
+    # Denormalized counters backing the popular-location top-k queries
+    "CREATE INDEX location_resident_count IF NOT EXISTS FOR (l:Location) ON (l.resident_count)",
+    "CREATE INDEX location_event_count IF NOT EXISTS FOR (l:Location) ON (l.event_count)",
+]
+
+
+# One-time backfills for denormalized properties; each statement is
+# idempotent and only touches rows that predate the property.
+_BACKFILL_STATEMENTS = [
+    # p.topic_ids mirrors the INTERESTED_IN edges so topic reads can skip
+    # the relationship expansion (maintained by the topic link/unlink paths)
+    """
+    MATCH (p:Person)
+    WHERE p.topic_ids IS NULL
+    SET p.topic_ids = [(p)-[:INTERESTED_IN]->(t:Topic) | t.id]
+    """,
+    # l.resident_count / l.event_count back the popularity top-k queries
+    # (maintained by the location/event link, unlink and delete paths)
+    """
+    MATCH (l:Location)
+    WHERE l.resident_count IS NULL
+    SET l.resident_count = COUNT { (:Person)-[:LIVES_IN]->(l) }
+    """,
+    """
+    MATCH (l:Location)
+    WHERE l.event_count IS NULL
+    SET l.event_count = COUNT { (:Event)-[:HELD_AT]->(l) }
+    """,
+]
+
+
+def ensure_schema() -> None:
+    """Create constraints and indexes if they do not exist.
+
+    Best-effort: failures are logged and do not stop startup, since the
+    queries still work (slower) without the indexes.
+    """
+    try:
+        with get_session_context() as session:
+            for statement in _SCHEMA_STATEMENTS:
+                session.run(statement)
+        logger.info(f"Ensured {len(_SCHEMA_STATEMENTS)} schema constraints/indexes")
+    except Exception as e:
+        logger.warning(f"Could not ensure schema constraints/indexes: {e}")
+
+
+def ensure_denormalized_fields() -> None:
+    """Backfill denormalized properties on nodes that predate them.
+
+    Best-effort like ensure_schema: the write paths keep the fields
+    current, so this only matters for data created on older code.
+    """
+    try:
+        with get_session_context() as session:
+            for statement in _BACKFILL_STATEMENTS:
+                session.run(statement)
+        logger.info(f"Ran {len(_BACKFILL_STATEMENTS)} denormalized-field backfills")
+    except Exception as e:
+        logger.warning(f"Could not backfill denormalized fields: {e}")
@@ -2,91 +2,327 @@
 Neo4j operations for Topic nodes.
 """
 
-import sys
-from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, UTC
 from uuid import uuid4
-
-# Add the shared package to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
-
-from neo4j import Session
 from shared.types import Topic
-from shared.utils import setup_logging
-from .connection import get_session_context
+from shared.utils import TTLCache, chunk_list, convert_neo4j_record, fuzzy_lucene_query, setup_logging
+from .connection import (
+    get_async_session_context,
+    get_session_context,
+    run_read_query,
+    run_write_query,
+)
+from .graph_queries import TOPIC_FULLTEXT_INDEX_NAME
 
 logger = setup_logging(__name__)
 
+# Topics are read far more often than they change; memoize lookups by id
+# and by name, and clear on any mutation. Popularity is an aggregate, so
+# it gets its own short-lived cache keyed by limit.
+_topic_cache = TTLCache(ttl_seconds=60, maxsize=10_000)
+_popular_topics_cache = TTLCache(ttl_seconds=30, maxsize=64)
+
+# Fields callers are allowed to change via update_topic
+_UPDATABLE_TOPIC_FIELDS = frozenset(Topic.model_fields) - {"id", "created_at"}
+
 
 def _convert_neo4j_record(record):
     """Convert Neo4j record to dict with proper datetime conversion."""
-    data = dict(record)
-    for key, value in data.items():
-        if hasattr(value, 'to_native'):  # Neo4j datetime object
-            data[key] = value.to_native()
-        # Handle potential data corruption - ensure name is string
-        if key == 'name' and not isinstance(value, str):
-            logger.warning(f"Found non-string name value: {value} (type: {type(value)})")
-            data[key] = str(value) if value is not None else ""
+    data = convert_neo4j_record(record)
+    # Handle potential data corruption - ensure name is string
+    name = data.get('name')
+    if 'name' in data and not isinstance(name, str):
+        logger.warning(f"Found non-string name value: {name} (type: {type(name)})")
+        data['name'] = str(name) if name is not None else ""
     return data
 
 
+def _topic_from_record_fast(node) -> Topic:
+    """Build a Topic without re-validation.
+
+    Rows coming back from Neo4j were validated when written, so read
+    paths skip Pydantic validators via model_construct; missing optional
+    properties fall back to the field defaults.
+    """
+    return Topic.model_construct(**_convert_neo4j_record(node))
+
+
+# Cypher hoisted to module level: the strings are built once at import time,
+# and identical string identity keeps Neo4j's plan cache hitting.
+_Q_CREATE_TOPIC = """
+CREATE (t:Topic {
+    id: $id,
+    name: $name,
+    created_at: $created_at
+})
+RETURN t
+"""
+
+_Q_GET_TOPIC = """
+MATCH (t:Topic {id: $topic_id})
+RETURN t
+"""
+
+_Q_UPDATE_TOPIC = """
+MATCH (t:Topic {id: $topic_id})
+SET t += $updates
+RETURN t
+"""
+
+_Q_LIST_TOPICS = """
+MATCH (t:Topic)
+RETURN t
+ORDER BY t.name
+"""
+
+# Keyset page over the (name, id) ordering: seeking past the cursor
+# through the name index costs the same for page 1 and page 1000,
+# unlike SKIP which re-reads every earlier row. The id tiebreak keeps
+# pagination lossless if a page boundary falls inside a run of equal
+# names.
+_Q_LIST_TOPICS_PAGE = """
+MATCH (t:Topic)
+WHERE $cname IS NULL
+   OR t.name > $cname
+   OR (t.name = $cname AND t.id > $cid)
+RETURN t
+ORDER BY t.name, t.id
+LIMIT $limit
+"""
+
+_Q_SEARCH_TOPICS = """
+MATCH (t:Topic)
+WHERE t.name CONTAINS $search_term
+RETURN t
+ORDER BY t.name
+"""
+
+_Q_SEARCH_TOPICS_FULLTEXT = """
+CALL db.index.fulltext.queryNodes($index_name, $search_term)
+YIELD node, score
+RETURN node as t
+ORDER BY score DESC, node.name
+"""
+
+# COUNT subqueries tally interest per topic without first expanding one
+# row per (topic, person) pair the way OPTIONAL MATCH + count(p) does,
+# so intermediate rows scale with topics rather than edges.
+_Q_GET_POPULAR_TOPICS = """
+MATCH (t:Topic)
+RETURN t, COUNT { (:Person)-[:INTERESTED_IN]->(t) } as interest_count
+ORDER BY interest_count DESC, t.name
+LIMIT $limit
+"""
+
+# Deleting a topic also scrubs its id from the denormalized p.topic_ids
+# arrays so later UNWIND reads do not chase a dangling id.
+_Q_DELETE_TOPIC = """
+MATCH (t:Topic {id: $topic_id})
+OPTIONAL MATCH (p:Person)-[:INTERESTED_IN]->(t)
+SET p.topic_ids = [tid IN coalesce(p.topic_ids, []) WHERE tid <> $topic_id]
+WITH DISTINCT t
+DETACH DELETE t
+RETURN count(t) as deleted_count
+"""
+
+# The link/unlink queries keep p.topic_ids in lockstep with the
+# INTERESTED_IN edges; ON CREATE guards against duplicate ids when the
+# MERGE matches an existing relationship.
+_Q_LINK_PERSON_TO_TOPIC = """
+MATCH (p:Person {id: $person_id})
+MATCH (t:Topic {id: $topic_id})
+MERGE (p)-[:INTERESTED_IN]->(t)
+ON CREATE SET p.topic_ids = coalesce(p.topic_ids, []) + [t.id]
+RETURN count(*) as link_count
+"""
+
+_Q_BULK_LINK_PERSON_TO_TOPICS = """
+UNWIND $topic_ids AS tid
+MATCH (p:Person {id: $person_id})
+MATCH (t:Topic {id: tid})
+MERGE (p)-[:INTERESTED_IN]->(t)
+ON CREATE SET p.topic_ids = coalesce(p.topic_ids, []) + [t.id]
+RETURN count(*) as link_count
+"""
+
+_Q_UNLINK_PERSON_FROM_TOPIC = """
+MATCH (p:Person {id: $person_id})-[r:INTERESTED_IN]->(t:Topic {id: $topic_id})
+DELETE r
+SET p.topic_ids = [tid IN coalesce(p.topic_ids, []) WHERE tid <> $topic_id]
+RETURN count(r) as deleted_count
+"""
+
+_Q_GET_PEOPLE_INTERESTED_IN_TOPIC = """
+MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic {id: $topic_id})
+RETURN p
+ORDER BY p.name
+"""
+
+# Reads off the denormalized array: one node seek plus one unique-index
+# seek per topic id, no relationship expansion. ensure_denormalized_fields
+# backfills topic_ids for people created before the array existed.
+_Q_GET_TOPICS_FOR_PERSON = """
+MATCH (p:Person {id: $person_id})
+UNWIND coalesce(p.topic_ids, []) AS tid
+MATCH (t:Topic {id: tid})
+RETURN t
+ORDER BY t.name
+"""
+
+_Q_LINK_INTERACTION_TO_TOPIC = """
+MATCH (i:Interaction {id: $interaction_id})
+MATCH (t:Topic {id: $topic_id})
+MERGE (i)-[:DISCUSSED]->(t)
+RETURN count(*) as link_count
+"""
+
+_Q_GET_TOPICS_FOR_INTERACTION = """
+MATCH (i:Interaction {id: $interaction_id})-[:DISCUSSED]->(t:Topic)
+RETURN t
+ORDER BY t.name
+"""
+
+_Q_GET_INTERACTIONS_FOR_TOPIC = """
+MATCH (i:Interaction)-[:DISCUSSED]->(t:Topic {id: $topic_id})
+RETURN i
+ORDER BY i.date DESC
+"""
+
+_Q_GET_TOPIC_BY_NAME = """
+MATCH (t:Topic {name: $name})
+RETURN t
+"""
+
+
 def create_topic(topic: Topic) -> Topic:
     """Create a new Topic node in Neo4j."""
     if not topic.id:
-        topic.id = str(uuid4())
+        topic.id = uuid4().hex
     
     now = datetime.now(UTC)
     topic.created_at = now
     
-    cypher_query = """
-    CREATE (t:Topic {
-        id: $id,
-        name: $name,
-        created_at: $created_at
-    })
-    RETURN t
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, **topic.model_dump())
-        created_topic = _convert_neo4j_record(result.single()["t"])
-        logger.info(f"Created topic: {topic.name} with ID: {topic.id}")
-        return Topic(**created_topic)
+    records = run_write_query(_Q_CREATE_TOPIC, **topic.model_dump())
+    _popular_topics_cache.invalidate()
+    created_topic = _convert_neo4j_record(records[0]["t"])
+    logger.info(f"Created topic: {topic.name} with ID: {topic.id}")
+    return Topic(**created_topic)
 
 
 def get_topic(topic_id: str) -> Optional[Topic]:
     """Get a Topic node by ID."""
-    cypher_query = """
-    MATCH (t:Topic {id: $topic_id})
-    RETURN t
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, topic_id=topic_id)
-        record = result.single()
-        if record:
-            topic_data = _convert_neo4j_record(record["t"])
-            return Topic(**topic_data)
-        return None
+    cached = _topic_cache.get(topic_id)
+    if cached is not None:
+        return cached
+
+    records = run_read_query(_Q_GET_TOPIC, topic_id=topic_id)
+    if records:
+        topic = _topic_from_record_fast(records[0]["t"])
+        _topic_cache.set(topic_id, topic)
+        return topic
+    return None
 
 
 def list_topics() -> List[Topic]:
     """List all Topic nodes."""
-    cypher_query = """
-    MATCH (t:Topic)
-    RETURN t
-    ORDER BY t.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query)
-        topics = []
-        for record in result:
-            topic_data = _convert_neo4j_record(record["t"])
-            topics.append(Topic(**topic_data))
-        return topics
+    records = run_read_query(_Q_LIST_TOPICS)
+    return [_topic_from_record_fast(record["t"]) for record in records]
+
+
+def list_topics_page(limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Topic], Optional[str]]:
+    """List topics as a bounded keyset page.
+
+    Returns (topics, next_cursor); pass next_cursor back in to fetch the
+    following page, None means the listing is exhausted. The opaque
+    cursor is "<id>:<name>", keyed like list_people_page so equal names
+    cannot swallow rows at a page boundary.
+    """
+    limit = max(1, min(int(limit), 1000))
+    cid, _, cname = cursor.partition(":") if cursor else (None, None, None)
+    records = run_read_query(_Q_LIST_TOPICS_PAGE, cname=cname, cid=cid, limit=limit)
+    topics = [_topic_from_record_fast(record["t"]) for record in records]
+    next_cursor = f"{topics[-1].id}:{topics[-1].name}" if len(topics) == limit else None
+    return topics, next_cursor
+
+
+async def get_topic_async(topic_id: str) -> Optional[Topic]:
+    """Async variant of get_topic for request handlers on the event loop."""
+
+    cached = _topic_cache.get(topic_id)
+    if cached is not None:
+        return cached
+
+    async def run_query(tx):
+        result = await tx.run(_Q_GET_TOPIC, topic_id=topic_id)
+        return await result.single()
+
+    async with get_async_session_context() as session:
+        record = await session.execute_read(run_query)
+    if record:
+        topic = _topic_from_record_fast(record["t"])
+        _topic_cache.set(topic_id, topic)
+        return topic
+    return None
+
+
+async def list_topics_async() -> List[Topic]:
+    """Async variant of list_topics for request handlers on the event loop."""
+
+    async def run_query(tx):
+        result = await tx.run(_Q_LIST_TOPICS)
+        return [record["t"] async for record in result]
+
+    async with get_async_session_context() as session:
+        nodes = await session.execute_read(run_query)
+    return [_topic_from_record_fast(node) for node in nodes]
+
+
+async def search_topics_async(search_term: str) -> List[Topic]:
+    """Async variant of search_topics for request handlers on the event loop."""
+
+    async def run_fulltext(tx):
+        result = await tx.run(
+            _Q_SEARCH_TOPICS_FULLTEXT,
+            index_name=TOPIC_FULLTEXT_INDEX_NAME,
+            search_term=fuzzy_lucene_query(search_term)
+        )
+        return [record["t"] async for record in result]
+
+    async def run_fallback(tx):
+        result = await tx.run(_Q_SEARCH_TOPICS, search_term=search_term)
+        return [record["t"] async for record in result]
+
+    async with get_async_session_context() as session:
+        try:
+            nodes = await session.execute_read(run_fulltext)
+        except Exception as e:
+            logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+            nodes = await session.execute_read(run_fallback)
+    return [_topic_from_record_fast(node) for node in nodes]
+
+
+async def get_popular_topics_async(limit: int = 10) -> List[Dict[str, Any]]:
+    """Async variant of get_popular_topics for request handlers on the event loop."""
+    cached = _popular_topics_cache.get(limit)
+    if cached is not None:
+        return cached
+
+    async def run_query(tx):
+        result = await tx.run(_Q_GET_POPULAR_TOPICS, limit=limit)
+        return [(record["t"], record["interest_count"]) async for record in result]
+
+    async with get_async_session_context() as session:
+        rows = await session.execute_read(run_query)
+
+    topics = []
+    for node, interest_count in rows:
+        topic_data = _convert_neo4j_record(node)
+        topic_data["interest_count"] = interest_count
+        topics.append(topic_data)
+    _popular_topics_cache.set(limit, topics)
+    return topics
 
 
 def update_topic(topic_id: str, topic_data: Dict[str, Any]) -> Optional[Topic]:
@@ -95,215 +331,161 @@ def update_topic(topic_id: str, topic_data: Dict[str, Any]) -> Optional[Topic]:
     if 'name' in topic_data and not isinstance(topic_data['name'], str):
         raise ValueError(f"Topic name must be a string, got {type(topic_data['name'])}")
     
-    # Remove None values
-    update_data = {k: v for k, v in topic_data.items() if v is not None}
-    
-    # Build dynamic SET clause
-    set_clause = ", ".join([f"t.{key} = ${key}" for key in update_data.keys()])
+    # Remove None values and anything outside the model's updatable
+    # fields, so a stray key cannot SET arbitrary properties; the single
+    # map-form query keeps one server-side plan for every key combination
+    update_data = {
+        k: v for k, v in topic_data.items()
+        if v is not None and k in _UPDATABLE_TOPIC_FIELDS
+    }
     
-    cypher_query = f"""
-    MATCH (t:Topic {{id: $topic_id}})
-    SET {set_clause}
-    RETURN t
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, topic_id=topic_id, **update_data)
-        record = result.single()
-        if record:
-            topic_data = _convert_neo4j_record(record["t"])
-            logger.info(f"Updated topic: {topic_id}")
-            return Topic(**topic_data)
-        return None
+    records = run_write_query(_Q_UPDATE_TOPIC, topic_id=topic_id, updates=update_data)
+    # Renames would leave a stale ("name", ...) entry behind, so clear
+    # the whole cache rather than just the id key
+    _topic_cache.invalidate()
+    if records:
+        logger.info(f"Updated topic: {topic_id}")
+        return Topic(**_convert_neo4j_record(records[0]["t"]))
+    return None
 
 
 def delete_topic(topic_id: str) -> bool:
     """Delete a Topic node and all its relationships."""
-    cypher_query = """
-    MATCH (t:Topic {id: $topic_id})
-    DETACH DELETE t
-    RETURN count(t) as deleted_count
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, topic_id=topic_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Deleted topic: {topic_id}")
-            return True
-        return False
+    records = run_write_query(_Q_DELETE_TOPIC, topic_id=topic_id)
+    _topic_cache.invalidate()
+    _popular_topics_cache.invalidate()
+    if records[0]["deleted_count"] > 0:
+        logger.info(f"Deleted topic: {topic_id}")
+        return True
+    return False
 
 
 def search_topics(search_term: str) -> List[Topic]:
     """Search topics by name."""
-    cypher_query = """
-    MATCH (t:Topic)
-    WHERE t.name CONTAINS $search_term
-    RETURN t
-    ORDER BY t.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, search_term=search_term)
-        topics = []
-        for record in result:
-            topic_data = _convert_neo4j_record(record["t"])
-            topics.append(Topic(**topic_data))
-        return topics
+    # Lucene lookup over the topic name index instead of a CONTAINS scan
+    # of every Topic node
+    try:
+        records = run_read_query(
+            _Q_SEARCH_TOPICS_FULLTEXT,
+            index_name=TOPIC_FULLTEXT_INDEX_NAME,
+            search_term=fuzzy_lucene_query(search_term)
+        )
+    except Exception as e:
+        logger.warning(f"Full-text search unavailable, falling back to scan: {e}")
+        records = run_read_query(_Q_SEARCH_TOPICS, search_term=search_term)
+
+    return [_topic_from_record_fast(record["t"]) for record in records]
 
 
 def link_person_to_topic(person_id: str, topic_id: str) -> bool:
     """Link a person to a topic (person is interested in topic)."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})
-    MATCH (t:Topic {id: $topic_id})
-    MERGE (p)-[:INTERESTED_IN]->(t)
-    RETURN count(*) as link_count
-    """
     
+    records = run_write_query(_Q_LINK_PERSON_TO_TOPIC, person_id=person_id, topic_id=topic_id)
+    if records[0]["link_count"] > 0:
+        _popular_topics_cache.invalidate()
+        logger.info(f"Linked person {person_id} to topic {topic_id}")
+        return True
+    return False
+
+
+def bulk_link_person_to_topics(person_id: str, topic_ids: List[str]) -> int:
+    """Link a person to many topics in one UNWIND write.
+
+    An imported profile with a dozen interests costs one round trip
+    instead of one per topic. Returns the number of pairs linked.
+    """
+    if not topic_ids:
+        return 0
+
+    link_count = 0
     with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, topic_id=topic_id)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked person {person_id} to topic {topic_id}")
-            return True
-        return False
+        for chunk in chunk_list(topic_ids, 1000):
+            records = session.execute_write(
+                lambda tx: list(tx.run(_Q_BULK_LINK_PERSON_TO_TOPICS, person_id=person_id, topic_ids=chunk))
+            )
+            link_count += records[0]["link_count"]
+    if link_count:
+        _popular_topics_cache.invalidate()
+    logger.info(f"Linked person {person_id} to {link_count} topics in bulk")
+    return link_count
 
 
 def unlink_person_from_topic(person_id: str, topic_id: str) -> bool:
     """Unlink a person from a topic."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[r:INTERESTED_IN]->(t:Topic {id: $topic_id})
-    DELETE r
-    RETURN count(r) as deleted_count
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id, topic_id=topic_id)
-        deleted_count = result.single()["deleted_count"]
-        if deleted_count > 0:
-            logger.info(f"Unlinked person {person_id} from topic {topic_id}")
-            return True
-        return False
+    records = run_write_query(_Q_UNLINK_PERSON_FROM_TOPIC, person_id=person_id, topic_id=topic_id)
+    if records[0]["deleted_count"] > 0:
+        _popular_topics_cache.invalidate()
+        logger.info(f"Unlinked person {person_id} from topic {topic_id}")
+        return True
+    return False
 
 
 def get_people_interested_in_topic(topic_id: str) -> List[Dict[str, Any]]:
     """Get all people interested in a specific topic."""
-    cypher_query = """
-    MATCH (p:Person)-[:INTERESTED_IN]->(t:Topic {id: $topic_id})
-    RETURN p
-    ORDER BY p.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, topic_id=topic_id)
-        people = []
-        for record in result:
-            person_data = _convert_neo4j_record(record["p"])
-            people.append(person_data)
-        return people
+    records = run_read_query(_Q_GET_PEOPLE_INTERESTED_IN_TOPIC, topic_id=topic_id)
+    return [_convert_neo4j_record(record["p"]) for record in records]
 
 
 def get_topics_for_person(person_id: str) -> List[Topic]:
     """Get all topics a person is interested in."""
-    cypher_query = """
-    MATCH (p:Person {id: $person_id})-[:INTERESTED_IN]->(t:Topic)
-    RETURN t
-    ORDER BY t.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, person_id=person_id)
-        topics = []
-        for record in result:
-            topic_data = _convert_neo4j_record(record["t"])
-            topics.append(Topic(**topic_data))
-        return topics
+    records = run_read_query(_Q_GET_TOPICS_FOR_PERSON, person_id=person_id)
+    return [_topic_from_record_fast(record["t"]) for record in records]
 
 
 def link_interaction_to_topic(interaction_id: str, topic_id: str) -> bool:
     """Link an interaction to a topic (topic was discussed in interaction)."""
-    cypher_query = """
-    MATCH (i:Interaction {id: $interaction_id})
-    MATCH (t:Topic {id: $topic_id})
-    MERGE (i)-[:DISCUSSED]->(t)
-    RETURN count(*) as link_count
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id, topic_id=topic_id)
-        link_count = result.single()["link_count"]
-        if link_count > 0:
-            logger.info(f"Linked interaction {interaction_id} to topic {topic_id}")
-            return True
-        return False
+    records = run_write_query(_Q_LINK_INTERACTION_TO_TOPIC, interaction_id=interaction_id, topic_id=topic_id)
+    if records[0]["link_count"] > 0:
+        logger.info(f"Linked interaction {interaction_id} to topic {topic_id}")
+        return True
+    return False
 
 
 def get_topics_for_interaction(interaction_id: str) -> List[Topic]:
     """Get all topics discussed in an interaction."""
-    cypher_query = """
-    MATCH (i:Interaction {id: $interaction_id})-[:DISCUSSED]->(t:Topic)
-    RETURN t
-    ORDER BY t.name
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, interaction_id=interaction_id)
-        topics = []
-        for record in result:
-            topic_data = _convert_neo4j_record(record["t"])
-            topics.append(Topic(**topic_data))
-        return topics
+    records = run_read_query(_Q_GET_TOPICS_FOR_INTERACTION, interaction_id=interaction_id)
+    return [_topic_from_record_fast(record["t"]) for record in records]
 
 
 def get_interactions_for_topic(topic_id: str) -> List[Dict[str, Any]]:
     """Get all interactions that discussed a specific topic."""
-    cypher_query = """
-    MATCH (i:Interaction)-[:DISCUSSED]->(t:Topic {id: $topic_id})
-    RETURN i
-    ORDER BY i.date DESC
-    """
     
-    with get_session_context() as session:
-        result = session.run(cypher_query, topic_id=topic_id)
-        interactions = []
-        for record in result:
-            interaction_data = _convert_neo4j_record(record["i"])
-            interactions.append(interaction_data)
-        return interactions
+    records = run_read_query(_Q_GET_INTERACTIONS_FOR_TOPIC, topic_id=topic_id)
+    return [_convert_neo4j_record(record["i"]) for record in records]
 
 
 def get_popular_topics(limit: int = 10) -> List[Dict[str, Any]]:
     """Get the most popular topics (by number of people interested)."""
-    cypher_query = """
-    MATCH (t:Topic)
-    OPTIONAL MATCH (p:Person)-[:INTERESTED_IN]->(t)
-    RETURN t, count(p) as interest_count
-    ORDER BY interest_count DESC, t.name
-    LIMIT $limit
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, limit=limit)
-        topics = []
-        for record in result:
-            topic_data = _convert_neo4j_record(record["t"])
-            topic_data["interest_count"] = record["interest_count"]
-            topics.append(topic_data)
-        return topics
+    cached = _popular_topics_cache.get(limit)
+    if cached is not None:
+        return cached
+
+    records = run_read_query(_Q_GET_POPULAR_TOPICS, limit=limit)
+    topics = []
+    for record in records:
+        topic_data = _convert_neo4j_record(record["t"])
+        topic_data["interest_count"] = record["interest_count"]
+        topics.append(topic_data)
+    _popular_topics_cache.set(limit, topics)
+    return topics
 
 
 def get_topic_by_name(name: str) -> Optional[Topic]:
     """Get a Topic node by exact name match."""
-    cypher_query = """
-    MATCH (t:Topic {name: $name})
-    RETURN t
-    """
-    
-    with get_session_context() as session:
-        result = session.run(cypher_query, name=name)
-        record = result.single()
-        if record:
-            topic_data = _convert_neo4j_record(record["t"])
-            return Topic(**topic_data)
-        return None 
\ No newline at end of file
+    cached = _topic_cache.get(("name", name))
+    if cached is not None:
+        return cached
+
+    records = run_read_query(_Q_GET_TOPIC_BY_NAME, name=name)
+    if records:
+        topic = _topic_from_record_fast(records[0]["t"])
+        _topic_cache.set(("name", name), topic)
+        return topic
+    return None 
\ No newline at end of file
@@ -3,320 +3,255 @@
 Script to create a small, meaningful test dataset for the Network Journal.
 """
 
-import sys
-from pathlib import Path
+import asyncio
+from datetime import datetime
 
-# Add the project root to the Python path
-sys.path.insert(0, str(Path(__file__).parent))
+from neo4j import Query
 
-from backend.graph_service.connection import get_session_context
-from backend.graph_service.people import create_person
-from backend.graph_service.companies import create_company
-from backend.graph_service.topics import create_topic
-from backend.graph_service.events import create_event
-from backend.graph_service.locations import create_location
-from backend.graph_service.interactions import create_interaction
-from shared.types import Company, Person, Topic, Event, Location, Interaction
+from backend.graph_service.connection import get_async_session_context, get_session_context
+from backend.graph_service.schema import ensure_schema
+from shared.utils import generate_id
+
+# One statement per phase: each CALL block is a unit subquery that runs
+# its own UNWIND and leaves the surrounding cardinality at one row, so
+# all six batches ride in a single round-trip and plan-cache entry.
+_Q_CREATE_ALL_NODES = """
+CALL {
+    UNWIND $companies AS r
+    CREATE (n:Company) SET n = r, n.created_at = datetime()
+}
+CALL {
+    UNWIND $locations AS r
+    CREATE (n:Location) SET n = r, n.created_at = datetime()
+}
+CALL {
+    UNWIND $topics AS r
+    CREATE (n:Topic) SET n = r, n.created_at = datetime()
+}
+CALL {
+    UNWIND $events AS r
+    CREATE (n:Event) SET n = r, n.created_at = datetime()
+}
+CALL {
+    UNWIND $people AS r
+    CREATE (n:Person) SET n = r, n.created_at = datetime()
+}
+CALL {
+    UNWIND $interactions AS r
+    CREATE (n:Interaction) SET n = r, n.created_at = datetime()
+}
+"""
+
+# The INTERESTED_IN block also maintains the denormalized p.topic_ids
+# array the service link paths keep in sync
+_Q_CREATE_ALL_RELATIONSHIPS = """
+CALL {
+    UNWIND $works_at AS r
+    MATCH (p:Person {id: r.pid}), (c:Company {id: r.cid})
+    CREATE (p)-[:WORKS_AT {role: r.role, start_date: r.start_date}]->(c)
+}
+CALL {
+    UNWIND $interested_in AS r
+    MATCH (p:Person {id: r.pid}), (t:Topic {id: r.tid})
+    CREATE (p)-[:INTERESTED_IN]->(t)
+    SET p.topic_ids = coalesce(p.topic_ids, []) + [t.id]
+}
+CALL {
+    UNWIND $attended AS r
+    MATCH (p:Person {id: r.pid}), (e:Event {id: r.eid})
+    CREATE (p)-[:ATTENDED]->(e)
+}
+CALL {
+    UNWIND $knows AS r
+    MATCH (p1:Person {id: r.pid1}), (p2:Person {id: r.pid2})
+    CREATE (p1)-[:KNOWS {strength: r.strength, type: r.type}]->(p2)
+}
+CALL {
+    UNWIND $participated_in AS r
+    MATCH (p:Person {id: r.pid}), (i:Interaction {id: r.iid})
+    CREATE (p)-[:PARTICIPATED_IN]->(i)
+}
+CALL {
+    UNWIND $located_at AS r
+    MATCH (e:Event {id: r.eid}), (l:Location {id: r.lid})
+    CREATE (e)-[:LOCATED_AT]->(l)
+}
+"""
 
 def clear_database():
     """Clear all existing data from the database."""
+    # consume() releases the result buffer and surfaces errors here
+    # rather than at session close; the timeout stops a wedged wipe from
+    # hanging the script indefinitely
     with get_session_context() as session:
-        session.run("MATCH (n) DETACH DELETE n")
+        session.run(Query("MATCH (n) DETACH DELETE n", timeout=120)).consume()
         print("✅ Cleared all existing data")
 
-def create_test_data():
+def _with_ids(rows):
+    """Assign client-side ids so edge rows can reference them up front."""
+    for row in rows:
+        row["id"] = generate_id()
+    return rows
+
+async def _run_statement(query, **params):
+    async with get_async_session_context() as session:
+        result = await session.run(query, **params)
+        await result.consume()
+
+async def create_test_data():
     """Create a small, meaningful test dataset."""
-    
-    # Create companies
-    print("Creating companies...")
-    acme_corp = create_company(Company(
-        name="Acme Corp",
-        industry="Technology",
-        website="https://acme.com"
-    ))
-    
-    tech_startup = create_company(Company(
-        name="TechStart Inc",
-        industry="Software",
-        website="https://techstart.io"
-    ))
-    
-    design_agency = create_company(Company(
-        name="Creative Designs",
-        industry="Design",
-        website="https://creativedesigns.com"
-    ))
-    
-    # Create locations
-    print("Creating locations...")
-    san_francisco = create_location(Location(
-        city="San Francisco",
-        state="CA",
-        country="USA"
-    ))
-    
-    new_york = create_location(Location(
-        city="New York",
-        state="NY",
-        country="USA"
-    ))
-    
-    # Create topics
-    print("Creating topics...")
-    ai_ml = create_topic(Topic(name="Artificial Intelligence"))
-    web_dev = create_topic(Topic(name="Web Development"))
-    design = create_topic(Topic(name="UI/UX Design"))
-    entrepreneurship = create_topic(Topic(name="Entrepreneurship"))
-    
-    # Create events
-    print("Creating events...")
-    tech_conference = create_event(Event(
-        name="Tech Innovation Summit",
-        date="2025-07-15",
-        type="conference",
-        location_id=san_francisco.id
-    ))
-    
-    startup_meetup = create_event(Event(
-        name="Startup Networking Night",
-        date="2025-06-30",
-        type="meetup",
-        location_id=new_york.id
-    ))
-    
-    # Create people with relationships
-    print("Creating people...")
-    
-    # Alice - Software Engineer at Acme Corp
-    alice = create_person(Person(
-        name="Alice Johnson",
-        email="alice@acme.com",
-        phone="+1-555-0101",
-        linkedin_url="https://linkedin.com/in/alicejohnson",
-        status="active",
-        notes="Senior software engineer, interested in AI/ML"
-    ))
-    
-    # Bob - Product Manager at TechStart
-    bob = create_person(Person(
-        name="Bob Smith",
-        email="bob@techstart.io",
-        phone="+1-555-0102",
-        linkedin_url="https://linkedin.com/in/bobsmith",
-        status="active",
-        notes="Product manager with design background"
-    ))
-    
-    # Carol - Designer at Creative Designs
-    carol = create_person(Person(
-        name="Carol Brown",
-        email="carol@creativedesigns.com",
-        phone="+1-555-0103",
-        linkedin_url="https://linkedin.com/in/carolbrown",
-        status="active",
-        notes="UI/UX designer, passionate about user experience"
-    ))
-    
-    # David - Entrepreneur
-    david = create_person(Person(
-        name="David Lee",
-        email="david@startup.com",
-        phone="+1-555-0104",
-        linkedin_url="https://linkedin.com/in/davidlee",
-        status="active",
-        notes="Founder of multiple startups, mentor"
-    ))
-    
-    # Eve - Developer at Acme Corp
-    eve = create_person(Person(
-        name="Eve Davis",
-        email="eve@acme.com",
-        phone="+1-555-0105",
-        linkedin_url="https://linkedin.com/in/evedavis",
-        status="active",
-        notes="Full-stack developer, works with Alice"
-    ))
-    
-    # Create interactions
-    print("Creating interactions...")
-    
-    # Alice and Bob met at the tech conference
-    alice_bob_interaction = create_interaction(Interaction(
-        date="2025-07-15",
-        channel="in_person",
-        summary="Met at Tech Innovation Summit. Discussed potential collaboration on AI project."
-    ))
-    
-    # Bob and Carol had a call about design work
-    bob_carol_interaction = create_interaction(Interaction(
-        date="2025-06-20",
-        channel="call",
-        summary="Discussed UI/UX design for new product feature. Carol provided valuable insights."
-    ))
-    
-    # David and Alice had coffee
-    david_alice_interaction = create_interaction(Interaction(
-        date="2025-06-10",
-        channel="in_person",
-        summary="Coffee meeting to discuss startup mentorship opportunities. David offered to mentor Alice."
-    ))
-    
-    # Eve and Alice work together
-    eve_alice_interaction = create_interaction(Interaction(
-        date="2025-06-25",
-        channel="in_person",
-        summary="Weekly team meeting. Discussed AI implementation for new feature."
-    ))
-    
-    # Create relationships in the database
+
+    # ids are generated client-side, so every node and edge parameter
+    # row can be built before anything touches the database
+    companies = _with_ids([
+        {"name": "Acme Corp", "industry": "Technology", "website": "https://acme.com"},
+        {"name": "TechStart Inc", "industry": "Software", "website": "https://techstart.io"},
+        {"name": "Creative Designs", "industry": "Design", "website": "https://creativedesigns.com"},
+    ])
+    acme_corp, tech_startup, design_agency = companies
+
+    locations = _with_ids([
+        {"city": "San Francisco", "state": "CA", "country": "USA"},
+        {"city": "New York", "state": "NY", "country": "USA"},
+    ])
+    san_francisco, new_york = locations
+
+    topics = _with_ids([
+        {"name": "Artificial Intelligence"},
+        {"name": "Web Development"},
+        {"name": "UI/UX Design"},
+        {"name": "Entrepreneurship"},
+    ])
+    ai_ml, web_dev, design, entrepreneurship = topics
+
+    events = _with_ids([
+        {"name": "Tech Innovation Summit", "date": datetime.fromisoformat("2025-07-15"),
+         "type": "conference", "location_id": san_francisco["id"]},
+        {"name": "Startup Networking Night", "date": datetime.fromisoformat("2025-06-30"),
+         "type": "meetup", "location_id": new_york["id"]},
+    ])
+    tech_conference, startup_meetup = events
+
+    people = _with_ids([
+        {"name": "Alice Johnson", "email": "alice@acme.com", "phone": "+1-555-0101",
+         "linkedin_url": "https://linkedin.com/in/alicejohnson", "status": "active",
+         "notes": "Senior software engineer, interested in AI/ML", "data_source": "manual_entry"},
+        {"name": "Bob Smith", "email": "bob@techstart.io", "phone": "+1-555-0102",
+         "linkedin_url": "https://linkedin.com/in/bobsmith", "status": "active",
+         "notes": "Product manager with design background", "data_source": "manual_entry"},
+        {"name": "Carol Brown", "email": "carol@creativedesigns.com", "phone": "+1-555-0103",
+         "linkedin_url": "https://linkedin.com/in/carolbrown", "status": "active",
+         "notes": "UI/UX designer, passionate about user experience", "data_source": "manual_entry"},
+        {"name": "David Lee", "email": "david@startup.com", "phone": "+1-555-0104",
+         "linkedin_url": "https://linkedin.com/in/davidlee", "status": "active",
+         "notes": "Founder of multiple startups, mentor", "data_source": "manual_entry"},
+        {"name": "Eve Davis", "email": "eve@acme.com", "phone": "+1-555-0105",
+         "linkedin_url": "https://linkedin.com/in/evedavis", "status": "active",
+         "notes": "Full-stack developer, works with Alice", "data_source": "manual_entry"},
+    ])
+    alice, bob, carol, david, eve = people
+
+    interactions = _with_ids([
+        {"date": datetime.fromisoformat("2025-07-15"), "channel": "in_person",
+         "summary": "Met at Tech Innovation Summit. Discussed potential collaboration on AI project.",
+         "data_source": "manual_entry"},
+        {"date": datetime.fromisoformat("2025-06-20"), "channel": "call",
+         "summary": "Discussed UI/UX design for new product feature. Carol provided valuable insights.",
+         "data_source": "manual_entry"},
+        {"date": datetime.fromisoformat("2025-06-10"), "channel": "in_person",
+         "summary": "Coffee meeting to discuss startup mentorship opportunities. David offered to mentor Alice.",
+         "data_source": "manual_entry"},
+        {"date": datetime.fromisoformat("2025-06-25"), "channel": "in_person",
+         "summary": "Weekly team meeting. Discussed AI implementation for new feature.",
+         "data_source": "manual_entry"},
+    ])
+    (alice_bob_interaction, bob_carol_interaction,
+     david_alice_interaction, eve_alice_interaction) = interactions
+
+    works_at_rows = [
+        {"pid": alice["id"], "cid": acme_corp["id"], "role": "Senior Software Engineer", "start_date": datetime.fromisoformat("2023-01-15")},
+        {"pid": bob["id"], "cid": tech_startup["id"], "role": "Product Manager", "start_date": datetime.fromisoformat("2024-03-01")},
+        {"pid": carol["id"], "cid": design_agency["id"], "role": "Senior UI/UX Designer", "start_date": datetime.fromisoformat("2022-08-10")},
+        {"pid": eve["id"], "cid": acme_corp["id"], "role": "Full-Stack Developer", "start_date": datetime.fromisoformat("2023-06-01")},
+    ]
+
+    interested_in_rows = [
+        {"pid": alice["id"], "tid": ai_ml["id"]},
+        {"pid": bob["id"], "tid": design["id"]},
+        {"pid": carol["id"], "tid": design["id"]},
+        {"pid": david["id"], "tid": entrepreneurship["id"]},
+        {"pid": eve["id"], "tid": web_dev["id"]},
+    ]
+
+    attended_rows = [
+        {"pid": alice["id"], "eid": tech_conference["id"]},
+        {"pid": bob["id"], "eid": tech_conference["id"]},
+        {"pid": david["id"], "eid": startup_meetup["id"]},
+    ]
+
+    knows_rows = [
+        {"pid1": alice["id"], "pid2": bob["id"], "strength": 3, "type": "Colleague"},
+        {"pid1": alice["id"], "pid2": eve["id"], "strength": 5, "type": "Coworker"},
+        {"pid1": bob["id"], "pid2": carol["id"], "strength": 4, "type": "Business"},
+        {"pid1": alice["id"], "pid2": david["id"], "strength": 2, "type": "Mentor"},
+    ]
+
+    participated_in_rows = [
+        {"pid": alice["id"], "iid": alice_bob_interaction["id"]},
+        {"pid": bob["id"], "iid": alice_bob_interaction["id"]},
+        {"pid": bob["id"], "iid": bob_carol_interaction["id"]},
+        {"pid": carol["id"], "iid": bob_carol_interaction["id"]},
+        {"pid": david["id"], "iid": david_alice_interaction["id"]},
+        {"pid": alice["id"], "iid": david_alice_interaction["id"]},
+        {"pid": eve["id"], "iid": eve_alice_interaction["id"]},
+        {"pid": alice["id"], "iid": eve_alice_interaction["id"]},
+    ]
+
+    located_at_rows = [
+        {"eid": tech_conference["id"], "lid": san_francisco["id"]},
+        {"eid": startup_meetup["id"], "lid": new_york["id"]},
+    ]
+
+    # Phase 1: all six node batches in one statement
+    print("Creating nodes...")
+    await _run_statement(
+        _Q_CREATE_ALL_NODES,
+        companies=companies,
+        locations=locations,
+        topics=topics,
+        events=events,
+        people=people,
+        interactions=interactions,
+    )
+
+    # Phase 2: all six edge batches, once every node they MATCH on exists
     print("Creating relationships...")
-    with get_session_context() as session:
-        # People -> Companies (WORKS_AT)
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (c:Company {id: $company_id})
-            CREATE (p)-[:WORKS_AT {role: $role, start_date: $start_date}]->(c)
-        """, person_id=alice.id, company_id=acme_corp.id, role="Senior Software Engineer", start_date="2023-01-15")
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (c:Company {id: $company_id})
-            CREATE (p)-[:WORKS_AT {role: $role, start_date: $start_date}]->(c)
-        """, person_id=bob.id, company_id=tech_startup.id, role="Product Manager", start_date="2024-03-01")
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (c:Company {id: $company_id})
-            CREATE (p)-[:WORKS_AT {role: $role, start_date: $start_date}]->(c)
-        """, person_id=carol.id, company_id=design_agency.id, role="Senior UI/UX Designer", start_date="2022-08-10")
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (c:Company {id: $company_id})
-            CREATE (p)-[:WORKS_AT {role: $role, start_date: $start_date}]->(c)
-        """, person_id=eve.id, company_id=acme_corp.id, role="Full-Stack Developer", start_date="2023-06-01")
-        
-        # People -> Topics (INTERESTED_IN)
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (t:Topic {id: $topic_id})
-            CREATE (p)-[:INTERESTED_IN]->(t)
-        """, person_id=alice.id, topic_id=ai_ml.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (t:Topic {id: $topic_id})
-            CREATE (p)-[:INTERESTED_IN]->(t)
-        """, person_id=bob.id, topic_id=design.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (t:Topic {id: $topic_id})
-            CREATE (p)-[:INTERESTED_IN]->(t)
-        """, person_id=carol.id, topic_id=design.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (t:Topic {id: $topic_id})
-            CREATE (p)-[:INTERESTED_IN]->(t)
-        """, person_id=david.id, topic_id=entrepreneurship.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (t:Topic {id: $topic_id})
-            CREATE (p)-[:INTERESTED_IN]->(t)
-        """, person_id=eve.id, topic_id=web_dev.id)
-        
-        # People -> Events (ATTENDED)
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (e:Event {id: $event_id})
-            CREATE (p)-[:ATTENDED]->(e)
-        """, person_id=alice.id, event_id=tech_conference.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (e:Event {id: $event_id})
-            CREATE (p)-[:ATTENDED]->(e)
-        """, person_id=bob.id, event_id=tech_conference.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (e:Event {id: $event_id})
-            CREATE (p)-[:ATTENDED]->(e)
-        """, person_id=david.id, event_id=startup_meetup.id)
-        
-        # People -> People (KNOWS)
-        session.run("""
-            MATCH (p1:Person {id: $person1_id}), (p2:Person {id: $person2_id})
-            CREATE (p1)-[:KNOWS {strength: $strength, type: $type}]->(p2)
-        """, person1_id=alice.id, person2_id=bob.id, strength=3, type="Colleague")
-        
-        session.run("""
-            MATCH (p1:Person {id: $person1_id}), (p2:Person {id: $person2_id})
-            CREATE (p1)-[:KNOWS {strength: $strength, type: $type}]->(p2)
-        """, person1_id=alice.id, person2_id=eve.id, strength=5, type="Coworker")
-        
-        session.run("""
-            MATCH (p1:Person {id: $person1_id}), (p2:Person {id: $person2_id})
-            CREATE (p1)-[:KNOWS {strength: $strength, type: $type}]->(p2)
-        """, person1_id=bob.id, person2_id=carol.id, strength=4, type="Business")
-        
-        session.run("""
-            MATCH (p1:Person {id: $person1_id}), (p2:Person {id: $person2_id})
-            CREATE (p1)-[:KNOWS {strength: $strength, type: $type}]->(p2)
-        """, person1_id=alice.id, person2_id=david.id, strength=2, type="Mentor")
-        
-        # People -> Interactions (PARTICIPATED_IN)
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=alice.id, interaction_id=alice_bob_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=bob.id, interaction_id=alice_bob_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=bob.id, interaction_id=bob_carol_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=carol.id, interaction_id=bob_carol_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=david.id, interaction_id=david_alice_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=alice.id, interaction_id=david_alice_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=eve.id, interaction_id=eve_alice_interaction.id)
-        
-        session.run("""
-            MATCH (p:Person {id: $person_id}), (i:Interaction {id: $interaction_id})
-            CREATE (p)-[:PARTICIPATED_IN]->(i)
-        """, person_id=alice.id, interaction_id=eve_alice_interaction.id)
-        
-        # Events -> Locations (LOCATED_AT)
-        session.run("""
-            MATCH (e:Event {id: $event_id}), (l:Location {id: $location_id})
-            CREATE (e)-[:LOCATED_AT]->(l)
-        """, event_id=tech_conference.id, location_id=san_francisco.id)
-        
-        session.run("""
-            MATCH (e:Event {id: $event_id}), (l:Location {id: $location_id})
-            CREATE (e)-[:LOCATED_AT]->(l)
-        """, event_id=startup_meetup.id, location_id=new_york.id)
-    
+    await _run_statement(
+        _Q_CREATE_ALL_RELATIONSHIPS,
+        works_at=works_at_rows,
+        interested_in=interested_in_rows,
+        attended=attended_rows,
+        knows=knows_rows,
+        participated_in=participated_in_rows,
+        located_at=located_at_rows,
+    )
+
     print("✅ Created test dataset with meaningful relationships!")
 
 def main():
     """Main function to create the test dataset."""
     print("🧹 Clearing existing database...")
     clear_database()
-    
+
+    # Make sure the id uniqueness constraints exist before the
+    # relationship UNWINDs MATCH on {id: ...}; without them each MATCH
+    # is a label scan
+    print("🔧 Ensuring schema constraints/indexes...")
+    ensure_schema()
+
     print("📊 Creating new test dataset...")
-    create_test_data()
-    
+    asyncio.run(create_test_data())
+
     print("\n🎉 Test dataset created successfully!")
     print("\nDataset includes:")
     print("- 5 people with realistic profiles")
@@ -326,8 +261,8 @@ def main():
     print("- 2 locations (San Francisco, New York)")
     print("- 4 interactions between people")
     print("- Multiple relationship types: WORKS_AT, KNOWS, INTERESTED_IN, ATTENDED, PARTICIPATED_IN")
-    
+
     print("\nThe network should now show a connected graph with meaningful relationships!")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -3,15 +3,17 @@ Shared package for the Network Journal application.
 """
 
 from .types import (
-    Person, Company, Topic, Location, Event, Interaction,
+    Person, Company, Topic, Location, Event, EventSummary, Interaction,
     PersonRelationship, EmploymentRelationship,
-    GraphNode, GraphEdge, GraphData,
+    GraphNode, GraphEdge, GraphData, GraphDataColumnar,
     NoteProcessingRequest, NoteProcessingResult, AgentSuggestion,
     APIResponse, PaginatedResponse,
     RelationshipType, InteractionChannel, EventType, ContactStatus, DataSource
 )
 
 from .utils import (
+    TTLCache,
+    escape_lucene_query,
     generate_id, get_current_timestamp, setup_logging,
     safe_get, validate_email, sanitize_string,
     get_project_root, format_date_for_display, format_datetime_for_display,
@@ -26,14 +28,16 @@ from .config import (
 
 __all__ = [
     # Types
-    "Person", "Company", "Topic", "Location", "Event", "Interaction",
+    "Person", "Company", "Topic", "Location", "Event", "EventSummary", "Interaction",
     "PersonRelationship", "EmploymentRelationship",
-    "GraphNode", "GraphEdge", "GraphData",
+    "GraphNode", "GraphEdge", "GraphData", "GraphDataColumnar",
     "NoteProcessingRequest", "NoteProcessingResult", "AgentSuggestion",
     "APIResponse", "PaginatedResponse",
     "RelationshipType", "InteractionChannel", "EventType", "ContactStatus", "DataSource",
     
     # Utils
+    "TTLCache",
+    "escape_lucene_query",
     "generate_id", "get_current_timestamp", "setup_logging",
     "safe_get", "validate_email", "sanitize_string",
     "get_project_root", "format_date_for_display", "format_datetime_for_display",
@@ -3,7 +3,9 @@ Shared configuration settings for the Network Journal application.
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -12,10 +14,15 @@ class Settings(BaseSettings):
     """Application settings."""
     
     # Database Configuration
-    NEO4J_URI: str = Field(default="bolt://localhost:7687", env="NEO4J_URI")
+    NEO4J_URI: str = Field(default="neo4j://localhost:7687", env="NEO4J_URI")
     NEO4J_USER: str = Field(default="neo4j", env="NEO4J_USER")
     NEO4J_PASSWORD: str = Field(default="password", env="NEO4J_PASSWORD")
     NEO4J_DATABASE: str = Field(default="neo4j", env="NEO4J_DATABASE")
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = Field(default=50, env="NEO4J_MAX_CONNECTION_POOL_SIZE")
+    NEO4J_MAX_CONNECTION_LIFETIME: int = Field(default=3600, env="NEO4J_MAX_CONNECTION_LIFETIME")  # seconds
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = Field(default=60.0, env="NEO4J_CONNECTION_ACQUISITION_TIMEOUT")  # seconds
+    NEO4J_FETCH_SIZE: int = Field(default=1000, env="NEO4J_FETCH_SIZE")  # records pulled per batch from the server
+    NEO4J_MAX_TRANSACTION_RETRY_TIME: float = Field(default=30.0, env="NEO4J_MAX_TRANSACTION_RETRY_TIME")  # seconds
     
     # API Configuration
     API_HOST: str = Field(default="0.0.0.0", env="API_HOST")
@@ -62,6 +69,7 @@ class Settings(BaseSettings):
     # Cache Configuration
     REDIS_URL: Optional[str] = Field(default=None, env="REDIS_URL")
     CACHE_TTL_SECONDS: int = Field(default=3600, env="CACHE_TTL_SECONDS")  # 1 hour
+    GRAPH_STATS_CACHE_TTL_SECONDS: int = Field(default=60, env="GRAPH_STATS_CACHE_TTL_SECONDS")
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
@@ -76,8 +84,9 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings (cached; env is read once at import)."""
     return settings
 
 
@@ -96,18 +105,27 @@ def get_database_url() -> str:
     return f"{settings.NEO4J_URI}"
 
 
-def get_ai_provider_config() -> dict:
-    """Get AI provider configuration."""
+def _build_ai_provider_config() -> dict:
     config = {
         "provider": settings.DEFAULT_LLM_PROVIDER,
         "model": settings.DEFAULT_MODEL,
         "max_tokens": settings.MAX_TOKENS,
         "temperature": settings.TEMPERATURE,
     }
-    
+
     if settings.DEFAULT_LLM_PROVIDER == "openai" and settings.OPENAI_API_KEY:
         config["api_key"] = settings.OPENAI_API_KEY
     elif settings.DEFAULT_LLM_PROVIDER == "anthropic" and settings.ANTHROPIC_API_KEY:
         config["api_key"] = settings.ANTHROPIC_API_KEY
-    
-    return config 
\ No newline at end of file
+
+    return config
+
+
+# Built once at import; settings never change after that (the env is not
+# re-read at runtime), so per-call rebuilds bought nothing.
+_AI_PROVIDER_CONFIG = MappingProxyType(_build_ai_provider_config())
+
+
+def get_ai_provider_config() -> Mapping[str, object]:
+    """Get AI provider configuration (read-only, computed at import)."""
+    return _AI_PROVIDER_CONFIG 
\ No newline at end of file
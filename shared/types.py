@@ -5,7 +5,7 @@ These models define the core entities and relationships in the graph database.
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 from enum import Enum
 
 
@@ -53,6 +53,13 @@ class DataSource(str, Enum):
     MANUAL_ENTRY = "manual_entry"
 
 
+def _validate_url(value: Optional[str]) -> Optional[str]:
+    """Parse value through HttpUrl, returning the normalized string."""
+    if value is None:
+        return None
+    return str(HttpUrl(value))
+
+
 # Base Models
 class Person(BaseModel):
     """A person in the network."""
@@ -60,7 +67,7 @@ class Person(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     email: Optional[str] = None
     phone: Optional[str] = None
-    linkedin_url: Optional[HttpUrl] = None
+    linkedin_url: Optional[str] = None
     last_contacted_date: Optional[datetime] = None
     birthday: Optional[datetime] = None
     source_of_contact: Optional[str] = None
@@ -70,16 +77,33 @@ class Person(BaseModel):
     updated_at: Optional[datetime] = None
     data_source: DataSource = DataSource.MANUAL_ENTRY
 
+    @field_validator('linkedin_url')
+    @classmethod
+    def _validate_linkedin_url(cls, value: Optional[str]) -> Optional[str]:
+        """Validate at the API boundary but store a plain string.
+
+        Keeping the field str-typed means instances built from the
+        database via model_construct never carry HttpUrl objects, and
+        dumps are Bolt-serializable without a custom serializer.
+        """
+        return _validate_url(value)
+
 
 class Company(BaseModel):
     """A company where people work."""
     id: Optional[str] = None
     name: str = Field(..., min_length=1, max_length=200)
     industry: Optional[str] = None
-    website: Optional[HttpUrl] = None
+    website: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    @field_validator('website')
+    @classmethod
+    def _validate_website(cls, value: Optional[str]) -> Optional[str]:
+        """Validate at the API boundary but store a plain string."""
+        return _validate_url(value)
+
 
 class Topic(BaseModel):
     """An interest, skill, or concept."""
@@ -107,6 +131,14 @@ class Event(BaseModel):
     created_at: Optional[datetime] = None
 
 
+class EventSummary(BaseModel):
+    """Compact projection of an Event for list views."""
+    id: Optional[str] = None
+    name: str
+    date: datetime
+    type: EventType
+
+
 class Interaction(BaseModel):
     """A specific communication or meeting event."""
     id: Optional[str] = None
@@ -137,9 +169,13 @@ class EmploymentRelationship(BaseModel):
     created_at: Optional[datetime] = None
 
 
-# Graph Query Models
+# Graph Query Models. These are allocated in bulk when serializing whole
+# graphs and never mutated after construction, so they are frozen; the
+# builders in graph_queries use model_construct to skip validation.
 class GraphNode(BaseModel):
     """A node in the graph visualization."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     type: str  # 'person', 'company', 'topic', etc.
@@ -148,6 +184,8 @@ class GraphNode(BaseModel):
 
 class GraphEdge(BaseModel):
     """An edge in the graph visualization."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     source: str
     target: str
@@ -157,9 +195,69 @@ class GraphEdge(BaseModel):
 
 class GraphData(BaseModel):
     """Complete graph data for visualization."""
+    model_config = ConfigDict(frozen=True)
+
     nodes: List[GraphNode]
     edges: List[GraphEdge]
 
+    def to_columnar(self) -> "GraphDataColumnar":
+        """Convert to the column-oriented representation."""
+        return GraphDataColumnar.from_graph_data(self)
+
+
+class GraphDataColumnar(BaseModel):
+    """Column-oriented graph data for large serializations.
+
+    Parallel lists replace one GraphNode/GraphEdge object per element,
+    trimming the per-object overhead when whole graphs are held in
+    memory or dumped; the row-oriented GraphData stays the public API
+    shape, rebuilt on demand via to_graph_data().
+    """
+    model_config = ConfigDict(frozen=True)
+
+    node_ids: List[str]
+    node_labels: List[str]
+    node_types: List[str]
+    node_properties: List[Dict[str, Any]]
+    edge_ids: List[str]
+    edge_sources: List[str]
+    edge_targets: List[str]
+    edge_types: List[str]
+    edge_properties: List[Dict[str, Any]]
+
+    @classmethod
+    def from_graph_data(cls, graph: GraphData) -> "GraphDataColumnar":
+        """Build columns from a row-oriented GraphData."""
+        nodes, edges = graph.nodes, graph.edges
+        return cls.model_construct(
+            node_ids=[n.id for n in nodes],
+            node_labels=[n.label for n in nodes],
+            node_types=[n.type for n in nodes],
+            node_properties=[n.properties for n in nodes],
+            edge_ids=[e.id for e in edges],
+            edge_sources=[e.source for e in edges],
+            edge_targets=[e.target for e in edges],
+            edge_types=[e.type for e in edges],
+            edge_properties=[e.properties for e in edges],
+        )
+
+    def to_graph_data(self) -> GraphData:
+        """Rebuild the row-oriented GraphData for legacy callers."""
+        nodes = [
+            GraphNode.model_construct(id=i, label=l, type=t, properties=p)
+            for i, l, t, p in zip(
+                self.node_ids, self.node_labels, self.node_types, self.node_properties
+            )
+        ]
+        edges = [
+            GraphEdge.model_construct(id=i, source=s, target=t, type=ty, properties=p)
+            for i, s, t, ty, p in zip(
+                self.edge_ids, self.edge_sources, self.edge_targets,
+                self.edge_types, self.edge_properties
+            )
+        ]
+        return GraphData.model_construct(nodes=nodes, edges=edges)
+
 
 # AI Processing Models
 class NoteProcessingRequest(BaseModel):
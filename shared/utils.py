@@ -2,21 +2,133 @@
 Shared utility functions for the Network Journal application.
 """
 
+import re
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterator, Optional
+from urllib.parse import urlsplit
 import logging
 from pathlib import Path
 
+from neo4j.time import Date, DateTime, Time
+
+
+class TTLCache:
+    """Small in-process cache whose entries expire after a fixed TTL.
+
+    Thread-safe: the service caches built on this are hit concurrently
+    from FastAPI's threadpool and from asyncio.to_thread fan-outs, so
+    expiry uses pop() (two racing readers must not both del the same
+    key) and the eviction scan runs under a lock (min() over a dict
+    another thread is resizing raises RuntimeError).
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 128):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value under key, evicting the oldest entry if full."""
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+                self._entries.pop(oldest_key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop a single key, or every entry when no key is given."""
+        if key is None:
+            with self._lock:
+                self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+# Neo4j temporal values that need converting to native datetimes
+NEO4J_TEMPORAL_TYPES = (DateTime, Date, Time)
+
+
+def convert_neo4j_record(record, temporal_keys: Optional[frozenset] = None) -> Dict[str, Any]:
+    """Convert a Neo4j node or record mapping to a plain dict.
+
+    Temporal values are converted to their native Python equivalents via
+    a C-level isinstance check instead of probing hasattr on every value.
+    Callers converting a node whose schema is fixed can pass the set of
+    temporal property names, so only those keys are inspected per row.
+    """
+    data = dict(record)
+    if temporal_keys is None:
+        return {
+            key: value.to_native() if isinstance(value, NEO4J_TEMPORAL_TYPES) else value
+            for key, value in data.items()
+        }
+    for key in temporal_keys:
+        value = data.get(key)
+        if isinstance(value, NEO4J_TEMPORAL_TYPES):
+            data[key] = value.to_native()
+    return data
+
+
+def escape_lucene_query(query: str) -> str:
+    """Escape Lucene metacharacters in a full-text search query."""
+    if not query:
+        return ""
+    special = '+-&|!(){}[]^"~*?:\\/'
+    return "".join(f"\\{ch}" if ch in special else ch for ch in query)
+
+
+def fuzzy_lucene_query(query: str) -> str:
+    """Build a Lucene query that matches terms fuzzily and by prefix.
+
+    Each whitespace-separated term is escaped and expanded to
+    "(term~1 OR term*)", so index-backed search keeps the forgiving
+    behaviour users got from the old CONTAINS scans.
+    """
+    terms = escape_lucene_query(query).split()
+    return " ".join(f"({term}~1 OR {term}*)" for term in terms)
+
 
 def generate_id() -> str:
-    """Generate a unique ID for database entities."""
-    return str(uuid.uuid4())
+    """Generate a unique ID for database entities.
+
+    uuid4().hex skips the hyphenated __str__ formatting and yields 32
+    chars instead of 36 — smaller index entries and id parameters.
+    Existing hyphenated ids stay valid; ids are opaque strings.
+    """
+    return uuid.uuid4().hex
+
+
+# Offset base for get_current_timestamp. datetime.utcnow() is deprecated
+# as of Python 3.12; of its replacements, one time.time() call plus a
+# timedelta add benchmarks fastest (vs datetime.now(timezone.utc) with a
+# tzinfo strip) while keeping the same naive-UTC result.
+_EPOCH = datetime(1970, 1, 1)
 
 
 def get_current_timestamp() -> datetime:
-    """Get the current timestamp."""
-    return datetime.utcnow()
+    """Get the current timestamp (naive UTC, as datetime.utcnow returned)."""
+    return _EPOCH + timedelta(seconds=time.time())
+
+
+# Compiled once rather than per validate_email call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 def setup_logging(name: str, level: str = "INFO") -> logging.Logger:
@@ -40,11 +152,10 @@ def safe_get(dictionary: Dict[str, Any], key: str, default: Any = None) -> Any:
     return dictionary.get(key, default)
 
 
+@lru_cache(maxsize=2048)
 def validate_email(email: str) -> bool:
-    """Basic email validation."""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    """Basic email validation (memoized; the same address recurs often)."""
+    return _EMAIL_RE.match(email) is not None
 
 
 def sanitize_string(text: str, max_length: Optional[int] = None) -> str:
@@ -62,6 +173,7 @@ def sanitize_string(text: str, max_length: Optional[int] = None) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
@@ -98,51 +210,47 @@ def days_since_last_contact(last_contact_date: datetime) -> int:
     return delta.days
 
 
+# Title-cased abbreviations that take a trailing period; one compiled
+# alternation replaces the per-abbreviation replace loop (LLC/LLP need
+# no rewrite since title-casing leaves them dotless as "Llc"/"Llp")
+_ABBR_RE = re.compile(r'\b(Inc|Corp|Ltd)\b(?!\.)')
+
+
 def normalize_company_name(name: str) -> str:
     """Normalize company name for consistent storage."""
     if not name:
         return ""
-    
-    # Convert to title case and remove extra whitespace
-    normalized = " ".join(name.split()).title()
-    
-    # Handle common abbreviations
-    abbreviations = {
-        "Inc": "Inc.",
-        "Corp": "Corp.",
-        "Ltd": "Ltd.",
-        "LLC": "LLC",
-        "LLP": "LLP"
-    }
-    
-    for abbr, replacement in abbreviations.items():
-        normalized = normalized.replace(f" {abbr} ", f" {replacement} ")
-        if normalized.endswith(f" {abbr}"):
-            normalized = normalized[:-len(abbr)] + replacement
-    
-    return normalized
+
+    # Collapse whitespace, title-case, then dot the abbreviations in a
+    # single linear scan
+    return _ABBR_RE.sub(r'\1.', " ".join(name.split()).title())
 
 
 def extract_domain_from_url(url: str) -> Optional[str]:
     """Extract domain from a URL."""
     if not url:
         return None
-    
+
+    # urlsplit skips the ;params handling urlparse does, and the hoisted
+    # import avoids a per-call lookup
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
-    except Exception:
+        return urlsplit(url).netloc.lower() or None
+    except ValueError:
         return None
 
 
-def chunk_list(lst: list, chunk_size: int) -> list:
-    """Split a list into chunks of specified size."""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def chunk_list(lst: list, chunk_size: int) -> Iterator[list]:
+    """Yield successive chunks of at most chunk_size items.
+
+    Lazy: chunks are built one at a time as the caller iterates, so a
+    large input never materializes every slice up front.
+    """
+    it = iter(lst)
+    while chunk := list(islice(it, chunk_size)):
+        yield chunk
 
 
 def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
     """Merge two dictionaries, with dict2 taking precedence."""
-    result = dict1.copy()
-    result.update(dict2)
-    return result 
\ No newline at end of file
+    # PEP 584 union: one C-level construction instead of copy + update
+    return dict1 | dict2 
\ No newline at end of file